@@ -1,5 +1,7 @@
+from typing import Optional
+
 import jwt
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from jwt.exceptions import InvalidTokenError
 
@@ -9,10 +11,19 @@ from app.models.user import User
 from app.services.user_service import UserService
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
+optional_oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login", auto_error=False)
+
+
+async def get_current_user(request: Request, token: str = Depends(oauth2_scheme)) -> UserInDB:
+    """Get current user from JWT token.
 
+    The user is remembered in the request state, so the sub-requests of a
+    batch (which share it) resolve the same token only once.
+    """
+    resolved = getattr(request.state, "current_user", None)
+    if resolved is not None and resolved[0] == token:
+        return resolved[1]
 
-async def get_current_user(token: str = Depends(oauth2_scheme)) -> UserInDB:
-    """Get current user from JWT token."""
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -30,9 +41,19 @@ async def get_current_user(token: str = Depends(oauth2_scheme)) -> UserInDB:
     user = await user_service.get_user_by_username(username)
     if user is None:
         raise credentials_exception
+    request.state.current_user = (token, user)
     return user
 
 
+async def get_optional_user(
+    request: Request, token: Optional[str] = Depends(optional_oauth2_scheme)
+) -> Optional[UserInDB]:
+    """Get current user from JWT token, None for anonymous requests (an invalid token is still rejected)."""
+    if token is None:
+        return None
+    return await get_current_user(request, token)
+
+
 async def get_current_active_user(
     current_user: User = Depends(get_current_user),
 ) -> User:
@@ -0,0 +1,111 @@
+import hashlib
+from email.utils import formatdate
+from typing import Any, Awaitable, Callable, Hashable, Optional, Sequence
+
+from cachetools import TTLCache
+from fastapi import Request
+from fastapi.responses import Response
+
+from app.core.compression import PrecompressedPayload, negotiate_encoding
+from app.core.config import settings
+from app.core.responses import dumps
+from app.core.versioning import collection_versions
+
+
+class PayloadCache:
+    """Process-wide cache of rendered response payloads, grouped by namespace.
+
+    Entries are PrecompressedPayload objects, so the compressed variants built
+    for one request are reused by the following ones. Callers include the
+    collection version stamps in the key, so a write never serves stale entries;
+    superseded ones simply expire.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: int = 60):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    async def get_or_build(
+        self, namespace: str, key: Hashable, build: Callable[[], Awaitable[Any]]
+    ) -> PrecompressedPayload:
+        """Get a cached payload or render a new one from the result of build()
+
+        Args:
+            namespace: Group of related payloads
+            key: Key identifying the payload within its namespace
+            build: Coroutine factory producing the content to render
+
+        Returns:
+            The cached or freshly rendered payload
+        """
+        cache_key = (namespace, key)
+        payload = self._cache.get(cache_key)
+        if payload is None:
+            payload = PrecompressedPayload(dumps(await build()))
+            self._cache[cache_key] = payload
+        return payload
+
+
+payload_cache = PayloadCache(ttl=settings.PAYLOAD_CACHE_TTL_SECONDS)
+
+
+def make_etag(*parts: Any) -> str:
+    """Build a strong ETag from the values identifying a representation"""
+    digest = hashlib.sha1(repr(parts).encode()).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header value against the current ETag
+
+    "*" is not matched here: it only matches once the resource is known to
+    exist (see cached_response).
+    """
+    if not if_none_match:
+        return False
+    # If-None-Match uses the weak comparison, so W/ prefixes are ignored
+    candidates = (candidate.strip() for candidate in if_none_match.split(","))
+    return any(candidate.removeprefix("W/") == etag for candidate in candidates)
+
+
+async def cached_response(
+    request: Request,
+    namespace: str,
+    key: Hashable,
+    depends_on: Sequence[str],
+    build: Callable[[], Awaitable[Any]],
+) -> Response:
+    """Serve a cached payload with ETag validation
+
+    The ETag is derived from the version stamps of the collections the payload
+    depends on and from the negotiated content encoding (each encoding is a
+    distinct representation), so a matching If-None-Match is answered with 304
+    before any content is loaded or serialized. If-None-Match: * is answered
+    with 304 only after build() succeeded, so a missing resource still gets
+    the error build() raises.
+
+    Args:
+        request: Incoming request (conditional and Accept-Encoding headers)
+        namespace: Group of related payloads
+        key: Key identifying the payload within its namespace
+        depends_on: Collections whose changes invalidate the payload
+        build: Coroutine factory producing the content to render
+
+    Returns:
+        A 304 response or the (possibly precompressed) payload
+    """
+    stamps = await collection_versions.get(*depends_on)
+    encoding = negotiate_encoding(request.headers.get("accept-encoding"))
+    etag = make_etag(namespace, key, stamps, encoding)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    last_modified = collection_versions.last_modified(stamps)
+    if last_modified:
+        headers["Last-Modified"] = formatdate(last_modified.timestamp(), usegmt=True)
+
+    if_none_match = request.headers.get("if-none-match")
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+
+    payload = await payload_cache.get_or_build(namespace, (key, stamps), build)
+    if if_none_match and if_none_match.strip() == "*":
+        return Response(status_code=304, headers=headers)
+    return payload.to_response(request, headers=headers)
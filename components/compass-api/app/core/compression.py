@@ -0,0 +1,220 @@
+import gzip
+import zlib
+from typing import Dict, Optional, Tuple
+
+from fastapi import Request
+from fastapi.responses import Response
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+try:
+    import brotli
+except ImportError:  # brotli is optional, fall back to gzip only
+    brotli = None
+
+# Encodings in server preference order (used to break ties between equal q-values)
+SUPPORTED_ENCODINGS: Tuple[str, ...] = ("br", "gzip") if brotli else ("gzip",)
+
+# Only text-like payloads are worth compressing
+COMPRESSIBLE_MEDIA_TYPES: Tuple[str, ...] = (
+    "application/json",
+    "application/x-ndjson",
+    "text/",
+    "image/svg+xml",
+)
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """Pick the best supported content encoding for an Accept-Encoding header
+
+    Args:
+        accept_encoding: Raw Accept-Encoding header value
+
+    Returns:
+        The chosen encoding ("br" or "gzip"), or None if the client accepts neither
+    """
+    if not accept_encoding:
+        return None
+
+    weights: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        token, _, params = part.strip().partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        weights[token] = quality
+
+    best, best_quality = None, 0.0
+    for encoding in SUPPORTED_ENCODINGS:
+        quality = weights.get(encoding, weights.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """Compress a complete body with the given encoding"""
+    if encoding == "br":
+        return brotli.compress(body, quality=settings.COMPRESSION_BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=settings.COMPRESSION_GZIP_LEVEL)
+
+
+def is_compressible(media_type: str) -> bool:
+    """Check whether a content type is worth compressing"""
+    return media_type.lower().startswith(COMPRESSIBLE_MEDIA_TYPES)
+
+
+class _StreamCompressor:
+    """Incremental compressor used for streamed response bodies"""
+
+    def __init__(self, encoding: str):
+        if encoding == "br":
+            self._brotli = brotli.Compressor(quality=settings.COMPRESSION_BROTLI_QUALITY)
+            self._zlib = None
+        else:
+            self._brotli = None
+            # wbits=31 produces a gzip container
+            self._zlib = zlib.compressobj(settings.COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, 31)
+
+    def compress(self, chunk: bytes) -> bytes:
+        """Compress a chunk and flush it so the client receives it immediately"""
+        if self._brotli:
+            return self._brotli.process(chunk) + self._brotli.flush()
+        return self._zlib.compress(chunk) + self._zlib.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        """Return the trailing bytes of the compressed stream"""
+        if self._brotli:
+            return self._brotli.finish()
+        return self._zlib.flush(zlib.Z_FINISH)
+
+
+class CompressionMiddleware:
+    """Compress responses with brotli or gzip, negotiated via Accept-Encoding.
+
+    Responses that already carry a Content-Encoding (e.g. precompressed cached
+    payloads) are passed through untouched, as are bodies below minimum_size.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding"))
+        if not encoding:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(send, encoding, self.minimum_size)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    """Wraps the ASGI send callable of a single response"""
+
+    def __init__(self, send: Send, encoding: str, minimum_size: int):
+        self._send = send
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.start_message: Optional[Message] = None
+        self.passthrough = False
+        self.compressor: Optional[_StreamCompressor] = None
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            # Hold the start message until the first body chunk tells us the size
+            self.start_message = message
+            headers = Headers(raw=message["headers"])
+            self.passthrough = "content-encoding" in headers or not is_compressible(headers.get("content-type", ""))
+            return
+
+        if message["type"] != "http.response.body":
+            await self._send(message)
+            return
+
+        if self.passthrough:
+            await self._flush_start()
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.compressor is None and self.start_message is not None:
+            if not more_body:
+                # Complete body in a single message
+                if len(body) < self.minimum_size:
+                    await self._flush_start()
+                    await self._send(message)
+                    return
+                compressed = compress(body, self.encoding)
+                headers = MutableHeaders(raw=self.start_message["headers"])
+                headers["Content-Encoding"] = self.encoding
+                headers["Content-Length"] = str(len(compressed))
+                headers.add_vary_header("Accept-Encoding")
+                await self._flush_start()
+                await self._send({"type": "http.response.body", "body": compressed})
+                return
+
+            # Streaming body: compress chunk by chunk, length is unknown
+            self.compressor = _StreamCompressor(self.encoding)
+            headers = MutableHeaders(raw=self.start_message["headers"])
+            headers["Content-Encoding"] = self.encoding
+            headers.add_vary_header("Accept-Encoding")
+            del headers["Content-Length"]
+            await self._flush_start()
+
+        chunk = self.compressor.compress(body) if body else b""
+        if not more_body:
+            chunk += self.compressor.finish()
+        await self._send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+    async def _flush_start(self) -> None:
+        if self.start_message is not None:
+            await self._send(self.start_message)
+            self.start_message = None
+
+
+class PrecompressedPayload:
+    """A rendered response body together with its lazily built compressed variants.
+
+    Cached payloads keep their compressed bytes, so compression runs once per
+    encoding instead of once per request.
+    """
+
+    def __init__(self, body: bytes, media_type: str = "application/json"):
+        self.body = body
+        self.media_type = media_type
+        self._variants: Dict[str, bytes] = {}
+
+    def encoded(self, encoding: str) -> bytes:
+        """Get the body compressed with the given encoding"""
+        if encoding not in self._variants:
+            self._variants[encoding] = compress(self.body, encoding)
+        return self._variants[encoding]
+
+    def to_response(self, request: Request, headers: Optional[Dict[str, str]] = None) -> Response:
+        """Build a response using the best encoding the client accepts"""
+        response_headers = dict(headers or {})
+        body = self.body
+        if len(body) >= settings.COMPRESSION_MINIMUM_SIZE:
+            encoding = negotiate_encoding(request.headers.get("accept-encoding"))
+            response_headers["Vary"] = "Accept-Encoding"
+            if encoding:
+                body = self.encoded(encoding)
+                response_headers["Content-Encoding"] = encoding
+        return Response(content=body, media_type=self.media_type, headers=response_headers)
@@ -0,0 +1,47 @@
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, List, Tuple
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+async def fan_out(label: str, limit: int = settings.QUERY_FANOUT_CONCURRENCY, **queries: Awaitable[Any]) -> Tuple:
+    """Run independent queries of one request concurrently
+
+    At most limit queries run at the same time. With DEBUG logging enabled,
+    each call logs when every query started and how long it took next to the
+    wall-clock time of the whole fan-out, which shows how much they overlapped.
+
+    Args:
+        label: Name of the fan-out in the trace (e.g. "get_comments")
+        limit: Maximum number of queries running at once
+        queries: Named awaitables, e.g. items=..., total=...
+
+    Returns:
+        The results in the order the queries were given
+    """
+    semaphore = asyncio.Semaphore(limit)
+    started = time.perf_counter()
+    timings: List[Tuple[str, float, float]] = []
+
+    async def run(name: str, query: Awaitable[Any]) -> Any:
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                return await query
+            finally:
+                timings.append((name, start - started, time.perf_counter() - start))
+
+    results = await asyncio.gather(*(run(name, query) for name, query in queries.items()))
+
+    if logger.isEnabledFor(logging.DEBUG):
+        wall = time.perf_counter() - started
+        spans = ", ".join(
+            f"{name} +{offset * 1000:.1f}ms {duration * 1000:.1f}ms" for name, offset, duration in timings
+        )
+        sequential = sum(duration for _, _, duration in timings)
+        logger.debug(f"{label}: {spans}; wall {wall * 1000:.1f}ms (sequential {sequential * 1000:.1f}ms)")
+    return tuple(results)
@@ -40,6 +40,39 @@ class Settings(BaseSettings):
     AUTH_RATE_LIMIT_PER_MINUTE: int = 1000
     WRITE_RATE_LIMIT_PER_MINUTE: int = 50
 
+    # Response compression (brotli is used when installed, gzip otherwise)
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 5
+
+    # Cached response payloads (keyed by collection version stamps)
+    PAYLOAD_CACHE_TTL_SECONDS: int = 600
+    VERSION_CHECK_INTERVAL_SECONDS: float = 2.0
+    # Stamps of deleted or renamed solutions are kept this long, then expire
+    RETIRED_VERSION_TTL_SECONDS: int = 30 * 24 * 3600
+    # Assembled solutions cached by slug
+    SOLUTION_CACHE_MAX_ENTRIES: int = 1000
+
+    # Independent queries of one request run concurrently, at most this many at once
+    QUERY_FANOUT_CONCURRENCY: int = 4
+
+    # Batch endpoint (GET requests run in-process in one round trip)
+    BATCH_MAX_REQUESTS: int = 20
+    BATCH_CONCURRENCY: int = 8
+
+    # Streaming exports
+    EXPORT_BATCH_SIZE: int = 1000
+
+    # Bulk solution import
+    SOLUTION_IMPORT_MAX_ITEMS: int = 500
+
+    # Background jobs (cascading tag and category changes)
+    JOB_WORKERS: int = 1
+    JOB_BATCH_SIZE: int = 500
+    JOB_BATCH_DELAY_SECONDS: float = 0.05
+    JOB_POLL_INTERVAL_SECONDS: float = 5.0
+    JOB_LEASE_SECONDS: int = 300
+
     class Config:
         env_file = ".env"
         case_sensitive = True
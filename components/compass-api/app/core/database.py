@@ -1,11 +1,44 @@
-from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorClientSession, AsyncIOMotorDatabase
 
 from app.core.config import settings
 
 client = AsyncIOMotorClient(settings.MONGODB_URL)
 database = client[settings.DATABASE_NAME]
 
+_supports_transactions: Optional[bool] = None
+
 
 def get_database() -> AsyncIOMotorDatabase:
     """Get database instance."""
     return database
+
+
+async def supports_transactions() -> bool:
+    """Check whether the deployment supports transactions (replica sets and sharded clusters do)"""
+    global _supports_transactions
+    if _supports_transactions is None:
+        try:
+            hello = await client.admin.command("hello")
+            _supports_transactions = "setName" in hello or hello.get("msg") == "isdbgrid"
+        except Exception:
+            _supports_transactions = False
+    return _supports_transactions
+
+
+@asynccontextmanager
+async def transaction() -> AsyncIterator[Optional[AsyncIOMotorClientSession]]:
+    """Run the enclosed writes in a transaction when the deployment supports one
+
+    Yields:
+        The session to pass to every operation of the transaction, or None on a
+        standalone server, where the operations are applied one by one
+    """
+    if not await supports_transactions():
+        yield None
+        return
+    async with await client.start_session() as session:
+        async with session.start_transaction():
+            yield session
@@ -0,0 +1,84 @@
+from contextvars import ContextVar
+from typing import Any, Dict, Optional, Tuple
+
+from motor.motor_asyncio import AsyncIOMotorCollection
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class IdentityMap:
+    """Documents already loaded during the current request, keyed by (collection, field, value).
+
+    Missing documents are remembered too (as None), so an existence check
+    followed by a load costs a single query. The map is cleared whenever the
+    request records a write (see CollectionVersions.bump), so a document read
+    after a write is always fresh. Cached documents are shared: callers must
+    not modify them.
+    """
+
+    def __init__(self):
+        self._documents: Dict[Tuple[str, str, Any], Optional[dict]] = {}
+
+    def get(self, key: Tuple[str, str, Any]) -> Tuple[bool, Optional[dict]]:
+        """Get (found, document) for a key; found is False if the key was never loaded"""
+        if key in self._documents:
+            return True, self._documents[key]
+        return False, None
+
+    def put(self, key: Tuple[str, str, Any], document: Optional[dict]) -> None:
+        self._documents[key] = document
+
+    def clear(self) -> None:
+        self._documents.clear()
+
+
+_identity_map: ContextVar[Optional[IdentityMap]] = ContextVar("identity_map", default=None)
+
+
+def current_identity_map() -> Optional[IdentityMap]:
+    """Get the identity map of the current request (None outside requests, e.g. in background jobs)"""
+    return _identity_map.get()
+
+
+async def find_one_by(collection: AsyncIOMotorCollection, field: str, value: Any) -> Optional[dict]:
+    """Find a document by a unique field, at most once per request
+
+    Args:
+        collection: Collection to query
+        field: Unique field to match (e.g. "_id" or "slug")
+        value: Value of the field
+
+    Returns:
+        The document, or None if there is none
+    """
+    identity_map = current_identity_map()
+    if identity_map is None:
+        return await collection.find_one({field: value})
+
+    key = (collection.name, field, value)
+    found, document = identity_map.get(key)
+    if found:
+        return document
+    document = await collection.find_one({field: value})
+    identity_map.put(key, document)
+    if document is not None and field != "_id":
+        # The same document is often loaded again by its id
+        identity_map.put((collection.name, "_id", document["_id"]), document)
+    return document
+
+
+class IdentityMapMiddleware:
+    """Give every HTTP request its own identity map (requests dispatched in-process share their parent's)"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or current_identity_map() is not None:
+            await self.app(scope, receive, send)
+            return
+
+        token = _identity_map.set(IdentityMap())
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _identity_map.reset(token)
@@ -0,0 +1,69 @@
+import logging
+
+from pymongo import ASCENDING, DESCENDING
+
+from app.core.database import get_database
+
+logger = logging.getLogger(__name__)
+
+# Indexes the services rely on, per collection: (keys, options)
+INDEXES = {
+    "tags": [
+        ([("name", ASCENDING)], {"unique": True}),
+    ],
+    "categories": [
+        # Solutions reference categories by name, which must not resolve to two documents
+        ([("name", ASCENDING)], {"unique": True}),
+    ],
+    "solutions": [
+        # Solutions are addressed by slug; concurrent creates of one name cannot share a slug
+        # (see scripts/remove_duplicate_slugs.py)
+        ([("slug", ASCENDING)], {"unique": True}),
+        # Duplicate name checks (see SolutionService.check_name_exists)
+        ([("name_normalized", ASCENDING)], {}),
+        # Similar name candidates (see SolutionService.find_similar_names)
+        ([("name_trigrams", ASCENDING)], {}),
+    ],
+    "users": [
+        # Exact and prefix username filters, listed by username
+        ([("username", ASCENDING)], {}),
+    ],
+    "comments": [
+        # Comments of a solution (exact and prefix slug filters), newest first
+        ([("solution_slug", ASCENDING), ("created_at", DESCENDING)], {}),
+    ],
+    "ratings": [
+        # One rating per user and solution (see scripts/remove_duplicate_ratings.py)
+        ([("solution_slug", ASCENDING), ("username", ASCENDING)], {"unique": True}),
+    ],
+    "solution_adopters": [
+        # One entry per adopter and solution, listed by username
+        ([("solution_slug", ASCENDING), ("username", ASCENDING)], {"unique": True}),
+    ],
+    "history": [
+        # Exact and prefix object name filters, newest first
+        ([("object_name_normalized", ASCENDING), ("created_at", DESCENDING)], {}),
+    ],
+    "collection_versions": [
+        # Retired stamps (see CollectionVersions.retire) expire at expires_at
+        ([("expires_at", ASCENDING)], {"expireAfterSeconds": 0}),
+    ],
+    "jobs": [
+        # Claiming the oldest runnable job
+        ([("status", ASCENDING), ("created_at", ASCENDING)], {}),
+        # Listing jobs newest first
+        ([("created_at", DESCENDING)], {}),
+    ],
+}
+
+
+async def ensure_indexes() -> None:
+    """Create the indexes the services rely on (no-op for existing ones)"""
+    db = get_database()
+    for collection_name, indexes in INDEXES.items():
+        for keys, options in indexes:
+            try:
+                await db[collection_name].create_index(keys, **options)
+            except Exception as e:
+                # Keep serving even if existing data violates an index (e.g. duplicate names)
+                logger.error(f"Error creating index {keys} on {collection_name}: {str(e)}")
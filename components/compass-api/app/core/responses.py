@@ -0,0 +1,44 @@
+from typing import Any
+
+import orjson
+from bson import ObjectId
+from fastapi import status
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+from app.models.job import Job
+from app.models.response import StandardResponse
+
+
+def orjson_default(obj: Any) -> Any:
+    """Serialize types orjson does not handle natively"""
+    if isinstance(obj, ObjectId):
+        return str(obj)
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(by_alias=True)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize content to JSON bytes using orjson"""
+    return orjson.dumps(content, default=orjson_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered with orjson.
+
+    Handles ObjectId, datetime and pydantic models natively, so routes can return
+    a StandardResponse directly and skip FastAPI's response_model re-validation.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def job_accepted_response(job: Job) -> FastJSONResponse:
+    """202 response of an operation run by a background job: the job in the body, its URL in Location"""
+    return FastJSONResponse(
+        StandardResponse.of(job), status_code=status.HTTP_202_ACCEPTED, headers={"Location": f"/api/jobs/{job.id}"}
+    )
@@ -0,0 +1,78 @@
+import re
+from typing import Any, Callable, Dict, List, Literal, Union
+
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import UpdateOne
+
+# How a text filter matches: exact and prefix can use an index, contains scans every document
+MatchMode = Literal["exact", "prefix", "contains"]
+
+
+def normalize_text(value: str) -> str:
+    """Normalize text for case-insensitive matching: lowercase with collapsed whitespace"""
+    return " ".join(value.split()).lower()
+
+
+def text_filter(value: str, match: MatchMode = "prefix") -> Union[str, dict]:
+    """Build a MongoDB condition matching a normalized field
+
+    The field must hold normalize_text() values (slugs and usernames are
+    stored lowercase already), so matching stays case-insensitive without the
+    "i" regex option. Exact matches and anchored, case-sensitive prefix
+    regexes are answered from an index on the field; substring matches are
+    only built on an explicit match="contains".
+
+    Args:
+        value: Text to look for (normalized here)
+        match: Match mode
+
+    Returns:
+        The condition for the field
+    """
+    value = normalize_text(value)
+    if match == "exact":
+        return value
+    if match == "prefix":
+        return {"$regex": f"^{re.escape(value)}"}
+    if match == "contains":
+        return {"$regex": re.escape(value)}
+    raise ValueError(f"Invalid match mode: {match}. Valid modes are: exact, prefix, contains")
+
+
+def trigrams(value: str) -> List[str]:
+    """Get the distinct trigrams of normalized text, each word padded like "  word " (as pg_trgm does)"""
+    grams = set()
+    for word in normalize_text(value).split():
+        padded = f"  {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return sorted(grams)
+
+
+async def backfill_derived_fields(
+    collection: AsyncIOMotorCollection,
+    field: str,
+    derive: Callable[[str], Dict[str, Any]],
+    batch_size: int = 1000,
+) -> int:
+    """Store fields derived from a text field on documents written before they existed
+
+    Args:
+        collection: Collection to update
+        field: Source text field (e.g. "name")
+        derive: Computes the derived fields from the source value; documents
+            missing any of them (the keys of derive("")) are updated
+        batch_size: Number of documents updated per bulk write
+
+    Returns:
+        Number of documents updated
+    """
+    missing = {"$or": [{name: {"$exists": False}} for name in derive("")]}
+    updated = 0
+    cursor = collection.find(missing, {field: 1})
+    while batch := await cursor.to_list(length=batch_size):
+        operations = [
+            UpdateOne({"_id": document["_id"]}, {"$set": derive(document.get(field) or "")}) for document in batch
+        ]
+        result = await collection.bulk_write(operations, ordered=False)
+        updated += result.modified_count
+    return updated
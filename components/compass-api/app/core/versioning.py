@@ -0,0 +1,93 @@
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Optional, Tuple
+
+from bson import ObjectId
+from pymongo import UpdateOne
+
+from app.core.config import settings
+from app.core.database import get_database
+from app.core.identity_map import current_identity_map
+
+
+class CollectionVersions:
+    """Version stamps per logical collection, shared across workers through MongoDB.
+
+    Every write bumps the stamp of the collections it touched. Readers keep the
+    stamps in memory and re-check MongoDB at most once per check_interval, so
+    version lookups on hot read paths usually do not touch the database.
+    Stamps are ObjectIds, which stay unique even if the stamp collection is reset
+    and carry the time of the last change.
+    """
+
+    def __init__(self, check_interval: float = 2.0):
+        self.check_interval = check_interval
+        self._stamps: Dict[str, Optional[ObjectId]] = {}
+        self._checked_at: Dict[str, float] = {}
+
+    @property
+    def collection(self):
+        return get_database().collection_versions
+
+    async def get(self, *names: str) -> Tuple[Optional[ObjectId], ...]:
+        """Get the current stamps for the given collections
+
+        Args:
+            names: Logical collection names (e.g. "solutions", "categories")
+
+        Returns:
+            A tuple of stamps in the same order, None for never-changed collections
+        """
+        now = time.monotonic()
+        stale = [name for name in names if now - self._checked_at.get(name, float("-inf")) > self.check_interval]
+        if stale:
+            stamps = {name: None for name in stale}
+            async for document in self.collection.find({"_id": {"$in": stale}}):
+                stamps[document["_id"]] = document.get("stamp")
+            for name, stamp in stamps.items():
+                self._stamps[name] = stamp
+                self._checked_at[name] = now
+        return tuple(self._stamps.get(name) for name in names)
+
+    async def bump(self, *names: str) -> None:
+        """Record a change to the given collections"""
+        await self._set_stamps(names, {"$unset": {"expires_at": ""}})
+
+    async def retire(self, *names: str) -> None:
+        """Record a last change to collections that no longer exist (e.g. a deleted solution)
+
+        The stamps are bumped like any change, then expire after
+        RETIRED_VERSION_TTL_SECONDS (TTL index on expires_at) unless bumped again.
+        """
+        expires_at = datetime.utcnow() + timedelta(seconds=settings.RETIRED_VERSION_TTL_SECONDS)
+        await self._set_stamps(names, {"$set": {"expires_at": expires_at}})
+
+    async def _set_stamps(self, names: Iterable[str], update: dict) -> None:
+        # Documents loaded earlier in the request may be stale now
+        identity_map = current_identity_map()
+        if identity_map is not None:
+            identity_map.clear()
+        stamps = {name: ObjectId() for name in names}
+        if not stamps:
+            return
+        # One round trip however many stamps a write touches
+        await self.collection.bulk_write(
+            [
+                UpdateOne({"_id": name}, {**update, "$set": {"stamp": stamp, **update.get("$set", {})}}, upsert=True)
+                for name, stamp in stamps.items()
+            ],
+            ordered=False,
+        )
+        now = time.monotonic()
+        for name, stamp in stamps.items():
+            self._stamps[name] = stamp
+            self._checked_at[name] = now
+
+    @staticmethod
+    def last_modified(stamps: Tuple[Optional[ObjectId], ...]) -> Optional[datetime]:
+        """Get the time of the most recent change among the given stamps"""
+        times = [stamp.generation_time for stamp in stamps if stamp is not None]
+        return max(times) if times else None
+
+
+collection_versions = CollectionVersions(check_interval=settings.VERSION_CHECK_INTERVAL_SECONDS)
@@ -0,0 +1,29 @@
+from typing import Any, Dict, List, Literal, Optional
+
+from pydantic import BaseModel, Field
+
+
+class BatchRequestItem(BaseModel):
+    """A GET request to run as part of a batch"""
+
+    id: Optional[str] = Field(None, description="Client identifier echoed in the matching response")
+    method: Literal["GET"] = Field(default="GET", description="HTTP method (only GET is supported)")
+    url: str = Field(..., description="Relative URL with query string, e.g. /api/tags/?show_all=true")
+    headers: Dict[str, str] = Field(
+        default_factory=dict, description="Extra request headers, e.g. If-None-Match (Authorization is inherited)"
+    )
+
+
+class BatchRequest(BaseModel):
+    """Requests to run in one round trip"""
+
+    requests: List[BatchRequestItem] = Field(..., min_length=1, description="Requests to run, answered in order")
+
+
+class BatchResponseItem(BaseModel):
+    """The response to one request of a batch"""
+
+    id: Optional[str] = Field(None, description="Identifier of the matching request")
+    status: int = Field(..., description="HTTP status code")
+    headers: Dict[str, str] = Field(default_factory=dict, description="Response headers")
+    body: Any = Field(None, description="Response body, parsed when it is JSON")
@@ -1,3 +1,5 @@
+from typing import Dict, Optional
+
 from pydantic import BaseModel, Field, field_validator
 
 from app.models.common import AuditModel
@@ -69,3 +71,9 @@ class Category(CategoryInDB):
     """Category model for API responses"""
 
     usage_count: int = Field(default=0, description="Number of solutions using this category")
+    usage_by_review_status: Optional[Dict[str, int]] = Field(
+        None, description="Number of solutions per review status (when requested)"
+    )
+    usage_by_recommend_status: Optional[Dict[str, int]] = Field(
+        None, description="Number of solutions per recommend status (when requested)"
+    )
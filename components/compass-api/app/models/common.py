@@ -43,3 +43,8 @@ class AuditModel(BaseModel):
         arbitrary_types_allowed=True,
         json_encoders={ObjectId: str, datetime: lambda v: v.isoformat()},
     )
+
+    @classmethod
+    def from_db(cls, document: dict):
+        """Build a model from a trusted database document without re-validation"""
+        return cls.model_construct(**document)
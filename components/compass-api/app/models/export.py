@@ -0,0 +1,17 @@
+from enum import Enum
+
+
+class ExportResource(str, Enum):
+    """Collections available for export"""
+
+    SOLUTIONS = "solutions"
+    RATINGS = "ratings"
+    COMMENTS = "comments"
+    HISTORY = "history"
+
+
+class ExportFormat(str, Enum):
+    """Output format of an export"""
+
+    NDJSON = "ndjson"
+    CSV = "csv"
@@ -4,6 +4,7 @@ from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
+from app.core.text_filters import MatchMode
 from app.models.common import AuditModel
 
 
@@ -33,6 +34,13 @@ class HistoryRecord(AuditModel):
     changed_fields: List[ChangeField] = Field(default_factory=list, description="List of fields that were changed")
     change_summary: str = Field(..., description="Summary of changes made")
 
+    @classmethod
+    def from_db(cls, document: dict) -> "HistoryRecord":
+        """Build a history record from a trusted database document without re-validation"""
+        record = super().from_db(document)
+        record.changed_fields = [ChangeField.model_construct(**field) for field in document.get("changed_fields", [])]
+        return record
+
     @classmethod
     def create_record(
         cls,
@@ -97,7 +105,10 @@ class HistoryQuery(BaseModel):
 
     object_type: Optional[str] = Field(None, description="Filter by object type")
     object_id: Optional[str] = Field(None, description="Filter by object ID")
-    object_name: Optional[str] = Field(None, description="Filter by object name")
+    object_name: Optional[str] = Field(None, description="Filter by object name (case-insensitive)")
+    object_name_match: MatchMode = Field(
+        "prefix", description="How object_name matches: exact, prefix or contains (substring, not index-backed)"
+    )
     change_type: Optional[ChangeType] = Field(None, description="Filter by change type")
     username: Optional[str] = Field(None, description="Filter by username who made the change")
     start_date: Optional[datetime] = Field(None, description="Filter changes after this date")
@@ -0,0 +1,40 @@
+from datetime import datetime
+from typing import Any, Dict, Literal, Optional
+
+from pydantic import Field
+
+from app.models.common import AuditModel
+
+# Cascading catalog changes run as background jobs
+JobTypeEnum = Literal[
+    "rename_category",  # Move solutions to a category's new name, then rename it
+    "rename_tag",  # Replace a tag's name in all solutions, then rename it
+    "delete_tag",  # Remove a tag from all solutions, then delete it
+    "merge_tags",  # Replace a tag with another one in all solutions, then delete it
+]
+
+# Job status values
+JobStatusEnum = Literal[
+    "PENDING",  # Waiting for a worker (also after an interrupted run)
+    "RUNNING",  # Claimed by a worker
+    "COMPLETED",  # Finished successfully
+    "FAILED",  # Stopped with an error
+]
+
+
+class Job(AuditModel):
+    """Background job and its progress"""
+
+    type: JobTypeEnum = Field(..., description="Operation performed by the job")
+    params: Dict[str, Any] = Field(default_factory=dict, description="Arguments of the operation")
+    status: JobStatusEnum = Field(default="PENDING", description="Job status")
+    processed: int = Field(default=0, description="Number of solutions processed so far")
+    total: Optional[int] = Field(None, description="Number of solutions to process, once known")
+    attempts: int = Field(default=0, description="Number of times a worker started the job")
+    result: Optional[Dict[str, Any]] = Field(None, description="Outcome of a completed job")
+    error: Optional[str] = Field(None, description="Reason a job failed")
+    started_at: Optional[datetime] = Field(None, description="When the current run started")
+    finished_at: Optional[datetime] = Field(None, description="When the job completed or failed")
+    lease_expires_at: Optional[datetime] = Field(
+        None, description="When a running job is considered abandoned and resumed by another worker"
+    )
@@ -119,6 +119,7 @@ class SolutionInDB(SolutionInDBBase, AuditModel):
     """Solution model as stored in database"""
 
     slug: str = Field(..., description="URL-friendly identifier (auto-generated)")
+    adopter_count: int = Field(default=0, description="Number of adopted users (maintained from comments and ratings)")
 
 
 class Solution(SolutionInDB):
@@ -126,3 +127,29 @@ class Solution(SolutionInDB):
 
     rating: float = Field(default=0.0, description="Average rating score")
     rating_count: int = Field(default=0, description="Total number of ratings")
+
+
+class SolutionImportResult(BaseModel):
+    """Outcome of importing a single solution"""
+
+    index: int = Field(..., description="Position of the item in the submitted batch")
+    success: bool = Field(..., description="Whether the solution was created")
+    id: Optional[str] = Field(None, description="ID of the created solution")
+    slug: Optional[str] = Field(None, description="Slug assigned to the created solution")
+    error: Optional[str] = Field(None, description="Reason the item was rejected")
+
+
+class SimilarSolutionName(BaseModel):
+    """A solution whose name is close to a searched name"""
+
+    name: str = Field(..., description="Solution name")
+    slug: str = Field(..., description="Solution slug")
+    similarity: float = Field(..., description="Trigram similarity with the searched name (0 to 1)")
+
+
+class SolutionImportSummary(BaseModel):
+    """Outcome of a bulk solution import"""
+
+    created: int = Field(0, description="Number of solutions created")
+    failed: int = Field(0, description="Number of rejected items")
+    results: List[SolutionImportResult] = Field(default_factory=list, description="Per-item results in batch order")
@@ -0,0 +1,33 @@
+from typing import List, Literal, Optional
+
+from pydantic import BaseModel, Field
+
+from app.models.comment import Comment
+from app.models.rating import Rating
+from app.models.solution import Solution
+from app.models.tag import Tag
+from app.models.user import User
+
+# Parts of a solution detail that can be selected with include=
+SolutionDetailPart = Literal[
+    "solution",  # The solution with its average rating
+    "rating_summary",  # Average, count and distribution of the ratings
+    "my_rating",  # The current user's rating (anonymous requests get none)
+    "comments",  # First page of comments, newest first
+    "tags",  # The solution's tags with their usage counts
+    "adopted_users",  # Users who marked themselves as adopted users
+]
+
+SOLUTION_DETAIL_PARTS: List[str] = list(SolutionDetailPart.__args__)
+
+
+class SolutionDetail(BaseModel):
+    """Everything the solution page shows, assembled in one response (parts not requested are null)"""
+
+    solution: Optional[Solution] = Field(None, description="The solution with its average rating")
+    rating_summary: Optional[dict] = Field(None, description="Average, count and distribution of the ratings")
+    my_rating: Optional[Rating] = Field(None, description="The current user's rating, if any")
+    comments: Optional[List[Comment]] = Field(None, description="First page of comments, newest first")
+    comments_total: Optional[int] = Field(None, description="Total number of comments")
+    tags: Optional[List[Tag]] = Field(None, description="The solution's tags with their usage counts")
+    adopted_users: Optional[List[User]] = Field(None, description="Users who marked themselves as adopted users")
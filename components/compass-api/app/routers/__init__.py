@@ -2,9 +2,12 @@ from fastapi import APIRouter
 
 from app.routers import (
     auth,
+    batch,
     categories,
     comments,
+    exports,
     history,
+    jobs,
     ratings,
     site_config,
     solutions,
@@ -26,3 +29,6 @@ api_router.include_router(comments.router, prefix="/comments", tags=["comments"]
 api_router.include_router(site_config.router, prefix="/site-config", tags=["site-config"])
 api_router.include_router(tech_radar.router, prefix="/tech-radar", tags=["tech-radar"])
 api_router.include_router(history.router, prefix="/history", tags=["history"])
+api_router.include_router(exports.router, prefix="/exports", tags=["exports"])
+api_router.include_router(jobs.router, prefix="/jobs", tags=["jobs"])
+api_router.include_router(batch.router, prefix="/batch", tags=["batch"])
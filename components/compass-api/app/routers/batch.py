@@ -0,0 +1,123 @@
+import json
+import logging
+from typing import Any, Dict, List, Optional
+from urllib.parse import unquote
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from starlette.types import Message
+
+from app.core.auth import get_optional_user
+from app.core.concurrency import fan_out
+from app.core.config import settings
+from app.models.batch import BatchRequest, BatchRequestItem, BatchResponseItem
+from app.models.response import StandardResponse
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+# Endpoints that cannot run inside a batch (nested batches, streamed exports)
+EXCLUDED_PREFIXES = ("/api/batch", "/api/exports")
+
+# Headers of the batch request passed on to every sub-request
+INHERITED_HEADERS = ("authorization", "user-agent", "x-forwarded-for")
+
+# Headers a sub-request may not set: the host is the batch's, and bodies are embedded
+# in the batch response as text (which is compressed as a whole instead)
+DROPPED_HEADERS = ("host", "accept-encoding")
+
+
+def _validate_url(url: str) -> None:
+    # Checked as routed: percent-encoded paths (e.g. /api/%65xports) must not bypass the exclusions
+    path = unquote(url.partition("?")[0])
+    if not path.startswith("/api/") or "://" in url:
+        raise ValueError(f"Batch URLs must be relative API paths starting with /api/: {url}")
+    if path.startswith(EXCLUDED_PREFIXES):
+        raise ValueError(f"Endpoint not available in a batch: {path}")
+
+
+async def _dispatch(request: Request, item: BatchRequestItem) -> BatchResponseItem:
+    """Run a GET request in-process through the whole application and capture its response"""
+    path, _, query_string = item.url.partition("?")
+    headers = {name: value for name, value in request.headers.items() if name in INHERITED_HEADERS}
+    headers.update({name.lower(): value for name, value in item.headers.items() if name.lower() not in DROPPED_HEADERS})
+    scope = {
+        "type": "http",
+        "asgi": request.scope.get("asgi", {"version": "3.0"}),
+        "http_version": request.scope.get("http_version", "1.1"),
+        "method": "GET",
+        "scheme": request.scope.get("scheme", "http"),
+        "server": request.scope.get("server"),
+        "client": request.scope.get("client"),
+        "root_path": request.scope.get("root_path", ""),
+        "path": unquote(path),
+        "raw_path": path.encode(),
+        "query_string": query_string.encode(),
+        "headers": [(b"host", request.headers.get("host", "").encode())]
+        + [(name.encode(), value.encode()) for name, value in headers.items()],
+        # Shared with the batch request: the user it resolved is reused by every sub-request
+        "state": request.scope.setdefault("state", {}),
+    }
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    response: Dict[str, Any] = {"status": 500, "headers": {}, "body": b""}
+
+    async def send(message: Message) -> None:
+        if message["type"] == "http.response.start":
+            response["status"] = message["status"]
+            response["headers"] = {name.decode(): value.decode() for name, value in message.get("headers", [])}
+        elif message["type"] == "http.response.body":
+            response["body"] += message.get("body", b"")
+
+    try:
+        await request.app(scope, receive, send)
+    except Exception as e:
+        # Already answered with a 500 by the application, the batch carries on
+        logger.error(f"Error in batch request {item.url}: {str(e)}")
+
+    body: Any = response["body"].decode(errors="replace") if response["body"] else None
+    if body is not None and response["headers"].get("content-type", "").startswith("application/json"):
+        try:
+            body = json.loads(body)
+        except ValueError:
+            # Returned as the raw text rather than failing the whole batch
+            pass
+    response["headers"].pop("content-length", None)
+    return BatchResponseItem(id=item.id, status=response["status"], headers=response["headers"], body=body)
+
+
+@router.post("", response_model=StandardResponse[List[BatchResponseItem]])
+async def run_batch(
+    batch: BatchRequest,
+    request: Request,
+    current_user: Optional[User] = Depends(get_optional_user),
+) -> Any:
+    """Run several GET requests of the API in one round trip.
+
+    The requests are dispatched in-process against the regular endpoints and
+    run concurrently (at most BATCH_CONCURRENCY at once). They inherit the
+    Authorization header of the batch, which is resolved to a user only once,
+    and share one request-scoped identity map. Responses are returned in
+    request order with their status, headers and parsed JSON body; a failing
+    request does not fail the batch.
+    """
+    if len(batch.requests) > settings.BATCH_MAX_REQUESTS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"A batch holds at most {settings.BATCH_MAX_REQUESTS} requests",
+        )
+    try:
+        for item in batch.requests:
+            _validate_url(item.url)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    responses = await fan_out(
+        "batch",
+        limit=settings.BATCH_CONCURRENCY,
+        **{str(index): _dispatch(request, item) for index, item in enumerate(batch.requests)},
+    )
+    return StandardResponse.of(list(responses))
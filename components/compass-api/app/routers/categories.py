@@ -1,12 +1,16 @@
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from fastapi.responses import Response
 
 from app.core.auth import get_current_superuser
+from app.core.cache import cached_response
+from app.core.responses import job_accepted_response
 from app.models.category import Category, CategoryCreate, CategoryUpdate
+from app.models.job import Job
 from app.models.response import StandardResponse
 from app.models.user import User
+from app.services.catalog_service import CATEGORY_USAGE
 from app.services.category_service import CategoryService
 
 router = APIRouter()
@@ -29,46 +33,76 @@ async def create_category(
 
 @router.get("/", response_model=StandardResponse[List[Category]])
 async def get_categories(
+    request: Request,
     skip: int = 0,
     limit: int = 100,
     sort: str = Query("radar_quadrant", description="Sort field (prefix with - for descending order)"),
+    usage_breakdown: bool = Query(False, description="Include usage counts per review and recommend status"),
     category_service: CategoryService = Depends(),
-) -> StandardResponse[List[Category]]:
-    """Get all categories with pagination and sorting. Default sorting is by radar_quadrant ascending."""
-    categories = await category_service.get_categories(skip=skip, limit=limit, sort=sort)
-    total = await category_service.count_categories()
-
-    # Convert to Category model with usage count
-    categories_with_usage = []
-    for category in categories:
-        category_with_usage = await category_service.get_category_with_usage(category)
-        categories_with_usage.append(category_with_usage)
+) -> Response:
+    """Get all categories with pagination and sorting. Default sorting is by radar_quadrant ascending.
+
+    The rendered payload is cached together with its compressed variants and
+    served with an ETag; a matching If-None-Match is answered with 304.
+    """
+
+    async def build() -> StandardResponse[List[Category]]:
+        categories = await category_service.get_categories(skip=skip, limit=limit, sort=sort)
+        total = await category_service.count_categories()
+
+        # Convert to Category model with usage counts, fetched for the whole page at once
+        usage = await category_service.get_category_usage_counts([category.name for category in categories])
+        categories_with_usage = [
+            category_service.with_usage(category, usage[category.name], usage_breakdown) for category in categories
+        ]
+
+        return StandardResponse.paginated(data=categories_with_usage, total=total, skip=skip, limit=limit)
 
-    return StandardResponse.paginated(data=categories_with_usage, total=total, skip=skip, limit=limit)
+    return await cached_response(
+        request, "categories", (skip, limit, sort, usage_breakdown), ("categories", CATEGORY_USAGE), build
+    )
 
 
 @router.get("/{category_id}", response_model=StandardResponse[Category])
-async def get_category(category_id: str, category_service: CategoryService = Depends()) -> StandardResponse[Category]:
+async def get_category(
+    category_id: str,
+    usage_breakdown: bool = Query(False, description="Include usage counts per review and recommend status"),
+    category_service: CategoryService = Depends(),
+) -> StandardResponse[Category]:
     """Get a specific category by ID."""
     category = await category_service.get_category_by_id(category_id)
     if not category:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Category not found")
-    category_with_usage = await category_service.get_category_with_usage(category)
+    category_with_usage = await category_service.get_category_with_usage(category, usage_breakdown)
     return StandardResponse.of(category_with_usage)
 
 
-@router.put("/{category_id}", response_model=StandardResponse[Category])
+@router.put(
+    "/{category_id}",
+    response_model=StandardResponse[Category],
+    responses={status.HTTP_202_ACCEPTED: {"model": StandardResponse[Job], "description": "Rename job enqueued"}},
+)
 async def update_category(
     category_id: str,
     category_update: CategoryUpdate,
     current_user: User = Depends(get_current_superuser),
     category_service: CategoryService = Depends(),
 ) -> StandardResponse[Category]:
-    """Update a category by ID (superuser only)."""
+    """Update a category by ID (superuser only).
+
+    When a renamed category is in use, its solutions are moved to the new name
+    by a background job, which renames the category last: the response is 202
+    with the job, also linked in the Location header. Other fields are updated
+    right away.
+    """
     try:
-        category = await category_service.update_category_by_id(category_id, category_update, current_user.username)
+        category, job = await category_service.update_category_by_id(
+            category_id, category_update, current_user.username
+        )
         if not category:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Category not found")
+        if job:
+            return job_accepted_response(job)
         category_with_usage = await category_service.get_category_with_usage(category)
         return StandardResponse.of(category_with_usage)
     except ValueError as e:
@@ -3,6 +3,8 @@ from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 from app.core.auth import get_current_active_user
+from app.core.responses import FastJSONResponse
+from app.core.text_filters import MatchMode
 from app.models.comment import (
     Comment,
     CommentCreate,
@@ -31,8 +33,9 @@ async def get_all_comments(
     limit: int = Query(20, ge=1, le=100, description="Maximum number of items to return"),
     sort: str = Query("-created_at", description="Sort field (prefix with - for descending order)"),
     type: Optional[CommentType] = Query(None, description="Filter comments by type (OFFICIAL or USER)"),
-    solution_slug: Optional[str] = Query(
-        None, description="Filter comments by solution slug (supports partial matching)"
+    solution_slug: Optional[str] = Query(None, description="Filter comments by solution slug (case-insensitive)"),
+    solution_slug_match: MatchMode = Query(
+        "prefix", description="How solution_slug matches: exact, prefix or contains (substring, slower)"
     ),
     comment_service: CommentService = Depends(),
 ) -> StandardResponse[list[Comment]]:
@@ -45,13 +48,19 @@ async def get_all_comments(
     - limit: Maximum number of items to return (1-100)
     - sort: Sort field (created_at, updated_at). Prefix with - for descending order
     - type: Filter comments by type (OFFICIAL or USER)
-    - solution_slug: Filter comments by solution slug (supports partial matching)
+    - solution_slug: Filter comments by solution slug (case-insensitive)
+    - solution_slug_match: exact, prefix (default) or contains; only contains scans every comment
     """
     try:
         comments, total = await comment_service.get_comments(
-            skip=skip, limit=limit, sort=sort, type=type, solution_slug=solution_slug
+            skip=skip,
+            limit=limit,
+            sort=sort,
+            type=type,
+            solution_slug=solution_slug,
+            solution_slug_match=solution_slug_match,
         )
-        return StandardResponse.paginated(comments, total, skip, limit)
+        return FastJSONResponse(StandardResponse.paginated(comments, total, skip, limit))
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -84,7 +93,7 @@ async def get_solution_comments(
             sort_by=sort_by,
             type=type,
         )
-        return StandardResponse.paginated(comments, total, skip, limit)
+        return FastJSONResponse(StandardResponse.paginated(comments, total, skip, limit))
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -194,7 +203,7 @@ async def get_my_comments(
         comments, total = await comment_service.get_user_comments(
             username=current_user.username, skip=skip, limit=limit, sort=sort
         )
-        return StandardResponse.paginated(comments, total, skip, limit)
+        return FastJSONResponse(StandardResponse.paginated(comments, total, skip, limit))
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -0,0 +1,38 @@
+from datetime import datetime
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+
+from app.core.auth import get_current_superuser
+from app.models.export import ExportFormat, ExportResource
+from app.models.user import User
+from app.services.export_service import ExportService
+
+router = APIRouter()
+
+EXPORT_MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv; charset=utf-8",
+}
+
+
+@router.get("/{resource}", response_class=StreamingResponse)
+async def export_resource(
+    resource: ExportResource,
+    format: ExportFormat = Query(ExportFormat.NDJSON, description="Output format (ndjson or csv)"),
+    since: Optional[datetime] = Query(None, description="Only export records changed at or after this date"),
+    current_user: User = Depends(get_current_superuser),
+    export_service: ExportService = Depends(),
+) -> StreamingResponse:
+    """Stream a whole collection as NDJSON or CSV (superuser only).
+
+    Records are read from a single cursor in batches and written as they
+    arrive, so exports of any size run in constant memory.
+    """
+    filename = f"{resource.value}-{datetime.utcnow():%Y%m%d%H%M%S}.{format.value}"
+    return StreamingResponse(
+        export_service.stream(resource, format, since),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
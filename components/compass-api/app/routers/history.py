@@ -4,6 +4,8 @@ from typing import Any, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 
+from app.core.responses import FastJSONResponse
+from app.core.text_filters import MatchMode
 from app.models.history import ChangeType, HistoryQuery, HistoryRecord
 from app.models.response import StandardResponse
 from app.services.history_service import HistoryService
@@ -18,7 +20,10 @@ router = APIRouter()
 async def get_history(
     object_type: Optional[str] = Query(None, description="Filter by object type (e.g., 'solution', 'category')"),
     object_id: Optional[str] = Query(None, description="Filter by object ID"),
-    object_name: Optional[str] = Query(None, description="Filter by object name (case-insensitive, partial match)"),
+    object_name: Optional[str] = Query(None, description="Filter by object name (case-insensitive)"),
+    object_name_match: MatchMode = Query(
+        "prefix", description="How object_name matches: exact, prefix or contains (substring, slower)"
+    ),
     change_type: Optional[ChangeType] = Query(None, description="Filter by change type (create/update/delete)"),
     username: Optional[str] = Query(None, description="Filter by username who made the change"),
     start_date: Optional[datetime] = Query(None, description="Filter changes after this date (ISO format)"),
@@ -37,6 +42,7 @@ async def get_history(
         object_type=object_type,
         object_id=object_id,
         object_name=object_name,
+        object_name_match=object_name_match,
         change_type=change_type,
         username=username,
         start_date=start_date,
@@ -47,7 +53,7 @@ async def get_history(
 
     try:
         history_records, total = await history_service.get_history_records(query)
-        return StandardResponse.paginated(history_records, total, skip, limit)
+        return FastJSONResponse(StandardResponse.paginated(history_records, total, skip, limit))
     except Exception as e:
         logger.error(f"Error getting history records: {str(e)}")
         raise HTTPException(
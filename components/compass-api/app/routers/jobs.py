@@ -0,0 +1,43 @@
+from typing import Any, List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from app.core.auth import get_current_superuser
+from app.core.concurrency import fan_out
+from app.models.job import Job, JobStatusEnum, JobTypeEnum
+from app.models.response import StandardResponse
+from app.models.user import User
+from app.services.job_service import JobService
+
+router = APIRouter()
+
+
+@router.get("/", response_model=StandardResponse[List[Job]])
+async def get_jobs(
+    skip: int = Query(0, ge=0, description="Number of jobs to skip"),
+    limit: int = Query(20, ge=1, le=100, description="Maximum number of jobs to return"),
+    status: Optional[JobStatusEnum] = Query(None, description="Filter by job status"),
+    type: Optional[JobTypeEnum] = Query(None, description="Filter by job type"),
+    current_user: User = Depends(get_current_superuser),
+    job_service: JobService = Depends(),
+) -> Any:
+    """Get background jobs, newest first (superuser only)."""
+    jobs, total = await fan_out(
+        "get_jobs",
+        items=job_service.get_jobs(skip=skip, limit=limit, status=status, job_type=type),
+        total=job_service.count_jobs(status=status, job_type=type),
+    )
+    return StandardResponse.paginated(jobs, total, skip, limit)
+
+
+@router.get("/{job_id}", response_model=StandardResponse[Job])
+async def get_job(
+    job_id: str,
+    current_user: User = Depends(get_current_superuser),
+    job_service: JobService = Depends(),
+) -> Any:
+    """Get a background job and its progress (superuser only)."""
+    job = await job_service.get_job_by_id(job_id)
+    if not job:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
+    return StandardResponse.of(job)
@@ -3,6 +3,8 @@ from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 from app.core.auth import get_current_active_user
+from app.core.responses import FastJSONResponse
+from app.core.text_filters import MatchMode
 from app.models.rating import Rating, RatingCreate
 from app.models.response import StandardResponse
 from app.models.user import User
@@ -35,7 +37,7 @@ async def get_solution_ratings(
     ratings, total = await rating_service.get_solution_ratings(
         solution_slug=solution_slug, skip=skip, limit=page_size, sort_by=sort_by
     )
-    return StandardResponse.paginated(data=ratings, total=total, skip=skip, limit=page_size)
+    return FastJSONResponse(StandardResponse.paginated(data=ratings, total=total, skip=skip, limit=page_size))
 
 
 @router.get(
@@ -114,8 +116,9 @@ async def get_all_ratings(
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
     sort: str = Query("-created_at", description="Sort field (prefix with - for descending order)"),
-    solution_slug: Optional[str] = Query(
-        None, description="Filter ratings by solution slug (supports partial matching)"
+    solution_slug: Optional[str] = Query(None, description="Filter ratings by solution slug (case-insensitive)"),
+    solution_slug_match: MatchMode = Query(
+        "prefix", description="How solution_slug matches: exact, prefix or contains (substring, slower)"
     ),
     score: Optional[int] = Query(None, ge=1, le=5, description="Filter ratings by exact score (1-5)"),
     rating_service: RatingService = Depends(),
@@ -127,7 +130,8 @@ async def get_all_ratings(
     - **page**: Page number for pagination
     - **page_size**: Number of ratings per page
     - **sort**: Field to sort by (created_at, updated_at, score). Prefix with - for descending order
-    - **solution_slug**: Filter ratings by solution slug (supports partial matching)
+    - **solution_slug**: Filter ratings by solution slug (case-insensitive)
+    - **solution_slug_match**: exact, prefix (default) or contains; only contains scans every rating
     - **score**: Filter ratings by exact score (1-5)
     """
     try:
@@ -138,8 +142,9 @@ async def get_all_ratings(
             sort=sort,
             solution_slug=solution_slug,
             score=score,
+            solution_slug_match=solution_slug_match,
         )
-        return StandardResponse.paginated(data=ratings, total=total, skip=skip, limit=page_size)
+        return FastJSONResponse(StandardResponse.paginated(data=ratings, total=total, skip=skip, limit=page_size))
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -167,7 +172,7 @@ async def get_my_ratings(
         ratings, total = await rating_service.get_user_ratings(
             username=current_user.username, skip=skip, limit=limit, sort=sort
         )
-        return StandardResponse.paginated(ratings, total, skip, limit)
+        return FastJSONResponse(StandardResponse.paginated(ratings, total, skip, limit))
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -1,6 +1,7 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 
 from app.core.auth import get_current_active_user
+from app.core.cache import cached_response
 from app.models.site_config import SiteConfigBase, SiteConfigUpdate
 from app.models.user import User
 from app.services.site_config_service import SiteConfigService
@@ -9,18 +10,23 @@ router = APIRouter()
 
 
 @router.get("", response_model=dict, tags=["site-config"])
-async def get_site_config():
+async def get_site_config(request: Request):
     """
     Get the current site configuration.
     This endpoint is public and does not require authentication.
+    Responses carry an ETag; a matching If-None-Match is answered with 304.
     """
-    config_service = SiteConfigService()
-    config = await config_service.get_site_config()
 
-    if not config:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Site configuration not found")
+    async def build():
+        config_service = SiteConfigService()
+        config = await config_service.get_site_config()
+
+        if not config:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Site configuration not found")
+
+        return {"status": "success", "data": config}
 
-    return {"status": "success", "data": config}
+    return await cached_response(request, "site_config", "current", ("site_config",), build)
 
 
 @router.post("", response_model=dict, status_code=status.HTTP_201_CREATED, tags=["site-config"])
@@ -66,7 +72,7 @@ async def update_site_config(
 async def reset_site_config(current_user: User = Depends(get_current_active_user)):
     """
     Reset site configuration to default values.
-    Requires authentication. This will delete the existing configuration and create a new one with defaults.
+    Requires authentication. This replaces the existing configuration with a new one holding the defaults.
     """
     config_service = SiteConfigService()
     try:
@@ -1,19 +1,31 @@
 import logging
-from typing import Any, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request, status
 from fastapi.responses import Response
 
-from app.core.auth import get_current_active_user, get_current_superuser
+from app.core.auth import get_current_active_user, get_current_superuser, get_optional_user
+from app.core.cache import cached_response
+from app.core.concurrency import fan_out
+from app.core.config import settings
+from app.core.responses import FastJSONResponse
 from app.models.history import HistoryRecord
 from app.models.response import StandardResponse
-from app.models.solution import Solution, SolutionCreate, SolutionInDB, SolutionUpdate
+from app.models.solution import (
+    SimilarSolutionName,
+    Solution,
+    SolutionCreate,
+    SolutionImportSummary,
+    SolutionInDB,
+    SolutionUpdate,
+)
+from app.models.solution_detail import SOLUTION_DETAIL_PARTS, SolutionDetail
 from app.models.user import User
-from app.services.comment_service import CommentService
+from app.services.adopter_service import AdopterService
 from app.services.history_service import HistoryService
-from app.services.rating_service import RatingService
+from app.services.solution_cache import solution_depends_on
+from app.services.solution_detail_service import SolutionDetailService
 from app.services.solution_service import SolutionService
-from app.services.user_service import UserService
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +51,30 @@ async def create_solution(
         raise HTTPException(status_code=500, detail=f"Error creating solution: {str(e)}")
 
 
+@router.post("/import", response_model=StandardResponse[SolutionImportSummary])
+async def import_solutions(
+    items: List[Dict[str, Any]] = Body(..., description="Solutions to create (same fields as POST /solutions/)"),
+    current_user: User = Depends(get_current_active_user),
+    solution_service: SolutionService = Depends(),
+) -> Any:
+    """Create a batch of solutions in one request.
+
+    Each item is validated on its own; invalid items are reported in the
+    per-item results without preventing the others from being created.
+    """
+    if len(items) > settings.SOLUTION_IMPORT_MAX_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Too many items: at most {settings.SOLUTION_IMPORT_MAX_ITEMS} solutions per import",
+        )
+    try:
+        summary = await solution_service.import_solutions(items, current_user.username)
+        return StandardResponse.of(summary)
+    except Exception as e:
+        logger.error(f"Error importing solutions: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error importing solutions: {str(e)}")
+
+
 @router.get("/", response_model=StandardResponse[List[Solution]])
 async def get_solutions(
     skip: int = 0,
@@ -104,20 +140,23 @@ async def get_solutions(
         if tags:
             tag_list = [tag.strip() for tag in tags.split(",")]
 
-        solutions = await solution_service.get_solutions_with_ratings(
-            skip=skip,
-            limit=limit,
-            category=category,
-            department=department,
-            team=team,
-            recommend_status=recommend_status,
-            stage=stage,
-            review_status=review_status,
-            tags=tag_list,
-            sort=sort,
+        solutions, total = await fan_out(
+            "get_solutions",
+            items=solution_service.get_solutions_with_ratings(
+                skip=skip,
+                limit=limit,
+                category=category,
+                department=department,
+                team=team,
+                recommend_status=recommend_status,
+                stage=stage,
+                review_status=review_status,
+                tags=tag_list,
+                sort=sort,
+            ),
+            total=solution_service.count_solutions(),
         )
-        total = await solution_service.count_solutions()
-        return StandardResponse.paginated(data=solutions, total=total, skip=skip, limit=limit)
+        return FastJSONResponse(StandardResponse.paginated(data=solutions, total=total, skip=skip, limit=limit))
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -153,7 +192,7 @@ async def search_solutions(
     """
     try:
         solutions = await solution_service.search_solutions(keyword)
-        return StandardResponse.of(solutions)
+        return FastJSONResponse(StandardResponse.of(solutions))
     except Exception as e:
         logger.error(f"Error searching solutions: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error searching solutions: {str(e)}")
@@ -176,11 +215,14 @@ async def get_my_solutions(
     - sort: Sort field (name, category, created_at, updated_at). Prefix with - for descending order
     """
     try:
-        solutions = await solution_service.get_user_solutions(
-            username=current_user.username, skip=skip, limit=limit, sort=sort
+        solutions, total = await fan_out(
+            "get_my_solutions",
+            items=solution_service.get_user_solutions(
+                username=current_user.username, skip=skip, limit=limit, sort=sort
+            ),
+            total=solution_service.count_user_solutions(current_user.username),
         )
-        total = await solution_service.count_user_solutions(current_user.username)
-        return StandardResponse.paginated(data=solutions, total=total, skip=skip, limit=limit)
+        return FastJSONResponse(StandardResponse.paginated(data=solutions, total=total, skip=skip, limit=limit))
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -189,12 +231,58 @@ async def get_my_solutions(
 
 
 @router.get("/{slug}", response_model=StandardResponse[Solution])
-async def get_solution(slug: str, solution_service: SolutionService = Depends()) -> Any:
-    """Get a specific solution by slug."""
-    solution = await solution_service.get_solution_by_slug_with_rating(slug)
-    if not solution:
+async def get_solution(request: Request, slug: str, solution_service: SolutionService = Depends()) -> Any:
+    """Get a specific solution by slug.
+
+    Responses carry an ETag derived from this solution's version stamps; a
+    matching If-None-Match is answered with 304.
+    """
+
+    async def build():
+        solution = await solution_service.get_solution_by_slug_with_rating(slug)
+        if not solution:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Solution not found")
+        return StandardResponse.of(solution)
+
+    return await cached_response(request, "solution", slug, solution_depends_on(slug), build)
+
+
+@router.get("/{slug}/full", response_model=StandardResponse[SolutionDetail])
+async def get_solution_detail(
+    slug: str,
+    include: Optional[str] = Query(
+        None,
+        description=f"Comma-separated parts to include ({', '.join(SOLUTION_DETAIL_PARTS)}), all if omitted",
+    ),
+    comments_limit: int = Query(20, ge=1, le=100, description="Number of comments in the first comment page"),
+    adopted_users_limit: int = Query(100, ge=1, le=1000, description="Number of adopted users in the first page"),
+    current_user: Optional[User] = Depends(get_optional_user),
+    solution_detail_service: SolutionDetailService = Depends(),
+) -> Any:
+    """Get everything the solution page shows in one request.
+
+    The solution, its rating summary, the current user's rating (authenticated
+    requests only), the first page of comments, its tags and its adopted users
+    are assembled with a single slug lookup and concurrent queries. Parts not
+    selected with include= are returned as null.
+    """
+    try:
+        parts = solution_detail_service.parse_include(include)
+        detail = await solution_detail_service.get_solution_detail(
+            slug,
+            include=parts,
+            username=current_user.username if current_user else None,
+            comments_limit=comments_limit,
+            adopted_users_limit=adopted_users_limit,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error getting solution detail: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error getting solution detail: {str(e)}")
+    if not detail:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Solution not found")
-    return StandardResponse.of(solution)
+    return FastJSONResponse(StandardResponse.of(detail))
 
 
 @router.put("/{slug}", response_model=StandardResponse[SolutionInDB])
@@ -233,7 +321,20 @@ async def update_solution(
                 detail="Only superusers can modify the review status",
             )
 
-        solution_in_db = await solution_service.update_solution_by_slug(slug, solution_update, current_user.username)
+        # The permission is checked again by the write itself, in case the maintainer changed meanwhile
+        solution_in_db = await solution_service.update_solution(
+            existing_solution,
+            solution_update,
+            current_user.username,
+            permission_filter=solution_service.solution_permission_filter(
+                current_user.username, current_user.is_superuser
+            ),
+        )
+        if not solution_in_db:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You don't have permission to update this solution",
+            )
         return StandardResponse.of(solution_in_db)
     except HTTPException as e:
         raise e
@@ -280,7 +381,7 @@ async def check_solution_name(name: str, solution_service: SolutionService = Dep
 
     Returns:
     - exists: True if the exact name exists
-    - count: Number of solutions with similar names (case-insensitive)
+    - count: Number of solutions with the same name ignoring case and whitespace
     """
     try:
         exists, count = await solution_service.check_name_exists(name)
@@ -290,6 +391,26 @@ async def check_solution_name(name: str, solution_service: SolutionService = Dep
         raise HTTPException(status_code=500, detail=f"Error checking solution name: {str(e)}")
 
 
+@router.get("/check-name/{name}/similar", response_model=StandardResponse[List[SimilarSolutionName]])
+async def get_similar_solution_names(
+    name: str,
+    limit: int = Query(10, ge=1, le=50, description="Maximum number of solutions to return"),
+    threshold: float = Query(0.3, gt=0, le=1, description="Minimum trigram similarity (0 to 1)"),
+    solution_service: SolutionService = Depends(),
+) -> Any:
+    """Get solutions with names similar to the given one (fuzzy match, most similar first).
+
+    Unlike check-name, this also finds near-duplicates such as typos or
+    reordered words, ranked by trigram similarity.
+    """
+    try:
+        similar = await solution_service.find_similar_names(name, limit=limit, threshold=threshold)
+        return StandardResponse.of(similar)
+    except Exception as e:
+        logger.error(f"Error finding similar solution names: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error finding similar solution names: {str(e)}")
+
+
 @router.delete("/by-name/{name}", status_code=status.HTTP_200_OK)
 async def delete_solutions_by_name(
     name: str,
@@ -342,45 +463,42 @@ async def update_solutions_by_name(
 @router.get("/{slug}/adopted-users", response_model=StandardResponse[List[User]])
 async def get_solution_adopted_users(
     slug: str,
+    skip: int = Query(0, ge=0, description="Number of adopted users to skip"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of adopted users to return"),
     solution_service: SolutionService = Depends(),
-    comment_service: CommentService = Depends(),
-    rating_service: RatingService = Depends(),
-    user_service: UserService = Depends(),
+    adopter_service: AdopterService = Depends(),
 ) -> Any:
-    """Get all adopted users for a solution.
+    """Get adopted users for a solution, sorted by username.
 
-    This endpoint returns a list of users who have marked themselves as adopted users
-    either through comments or ratings on the solution.
+    This endpoint returns users who have marked themselves as adopted users
+    either through comments or ratings on the solution. Adopters are
+    precomputed when comments and ratings are written, so a page costs one
+    indexed query regardless of the number of comments and ratings.
 
     Args:
         slug: The slug of the solution to get adopted users for
+        skip: Number of adopted users to skip
+        limit: Maximum number of adopted users to return
 
     Returns:
-        List of User objects for all adopted users with total count
+        Page of User objects for the adopted users with total count
     """
     try:
-        # First check if solution exists
-        solution = await solution_service.get_solution_by_slug(slug)
+        solution, (users, total) = await fan_out(
+            "get_solution_adopted_users",
+            solution=solution_service.get_solution_by_slug(slug),
+            adopters=adopter_service.get_adopted_users(slug, skip=skip, limit=limit),
+        )
         if not solution:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Solution with slug '{slug}' not found",
             )
 
-        # Get adopted usernames from both comments and ratings
-        comment_usernames = await comment_service.get_solution_adopted_usernames(slug)
-        rating_usernames = await rating_service.get_solution_adopted_usernames(slug)
-
-        # Combine unique usernames
-        all_usernames = comment_usernames.union(rating_usernames)
-
-        if not all_usernames:
-            return StandardResponse.paginated(data=[], total=0, skip=0, limit=0)
-
-        # Get full user information for all usernames
-        users = await user_service.get_users_by_usernames(list(all_usernames))
-        return StandardResponse.paginated(data=users, total=len(users), skip=0, limit=len(users))
+        return StandardResponse.paginated(data=users, total=total, skip=skip, limit=limit)
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error getting adopted users: {str(e)}")
         raise HTTPException(
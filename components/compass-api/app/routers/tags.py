@@ -1,13 +1,16 @@
 from typing import Any, List
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.responses import Response
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 
 from app.core.auth import get_current_active_user, get_current_superuser
+from app.core.cache import cached_response
+from app.core.responses import FastJSONResponse, job_accepted_response
+from app.models.job import Job
 from app.models.response import StandardResponse
 from app.models.solution import SolutionUpdate
 from app.models.tag import Tag, TagCreate, TagUpdate, format_tag_name
 from app.models.user import User
+from app.services.catalog_service import TAG_USAGE
 from app.services.solution_service import SolutionService
 from app.services.tag_service import TagService
 
@@ -32,6 +35,7 @@ async def create_tag(
 
 @router.get("/", response_model=StandardResponse[List[Tag]])
 async def get_tags(
+    request: Request,
     skip: int = 0,
     limit: int = 100,  # Default to 100 items
     show_all: bool = False,  # Default to only show tags with usage_count > 0
@@ -43,10 +47,16 @@ async def get_tags(
         skip: Number of items to skip
         limit: Maximum number of items to return (default: 100)
         show_all: If True, return all tags; if False, only return tags with usage_count > 0 (default: False)
+
+    Responses carry an ETag; a matching If-None-Match is answered with 304.
     """
-    tags = await tag_service.get_tags(skip=skip, limit=limit, show_all=show_all)
-    total = await tag_service.count_tags(show_all=show_all)
-    return StandardResponse.paginated(data=tags, total=total, skip=skip, limit=limit)
+
+    async def build():
+        tags = await tag_service.get_tags(skip=skip, limit=limit, show_all=show_all)
+        total = await tag_service.count_tags(show_all=show_all)
+        return StandardResponse.paginated(data=tags, total=total, skip=skip, limit=limit)
+
+    return await cached_response(request, "tags", (skip, limit, show_all), ("tags", TAG_USAGE), build)
 
 
 @router.get("/{tag_id}", response_model=StandardResponse[Tag])
@@ -59,7 +69,13 @@ async def get_tag(tag_id: str, tag_service: TagService = Depends()) -> Any:
     return StandardResponse.of(tag_with_usage)
 
 
-@router.put("/{tag_id}", response_model=StandardResponse[Tag])
+@router.put(
+    "/{tag_id}",
+    response_model=StandardResponse[Tag],
+    responses={
+        status.HTTP_202_ACCEPTED: {"model": StandardResponse[Job], "description": "Merge or rename job enqueued"}
+    },
+)
 async def update_tag(
     tag_id: str,
     tag_update: TagUpdate,
@@ -67,9 +83,22 @@ async def update_tag(
     tag_service: TagService = Depends(),
 ) -> Any:
     """Update a tag by ID (superuser only).
-    If tag name is changed to an existing tag name, the tags will be merged."""
+    If tag name is changed to an existing tag name, the tags will be merged by a
+    background job; a renamed tag used by solutions is renamed by a background job
+    too. The response is then 202 with the job, also linked in the Location header."""
     try:
         # Name will be formatted by the model validator
+        target_tag = await tag_service.get_tag_by_name(tag_update.name)
+        if target_tag and str(target_tag.id) != tag_id:
+            job = await tag_service.enqueue_merge_tags(tag_id, target_tag.name, current_user.username)
+            if not job:
+                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Tag not found")
+            return job_accepted_response(job)
+
+        job = await tag_service.enqueue_rename_tag(tag_id, tag_update, current_user.username)
+        if job:
+            return job_accepted_response(job)
+
         tag = await tag_service.update_tag(
             tag_id=tag_id,
             tag_update=tag_update,
@@ -84,17 +113,20 @@ async def update_tag(
         raise HTTPException(status_code=400, detail=str(e))
 
 
-@router.delete("/{tag_id}", status_code=status.HTTP_204_NO_CONTENT, response_class=Response)
+@router.delete("/{tag_id}", response_model=StandardResponse[Job], status_code=status.HTTP_202_ACCEPTED)
 async def delete_tag(
     tag_id: str,
     current_user: User = Depends(get_current_superuser),
     tag_service: TagService = Depends(),
-) -> None:
-    """Delete a tag by ID (superuser only). Will also remove the tag from all solutions using it."""
+) -> Any:
+    """Delete a tag by ID (superuser only). Will also remove the tag from all solutions using it.
+
+    The deletion runs as a background job: the response is 202 with the job, also linked in the Location header."""
     try:
-        success = await tag_service.delete_tag(tag_id)
-        if not success:
+        job = await tag_service.enqueue_delete_tag(tag_id, current_user.username)
+        if not job:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Tag not found")
+        return job_accepted_response(job)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
@@ -103,7 +135,7 @@ async def delete_tag(
 async def get_solution_tags(solution_slug: str, tag_service: TagService = Depends()) -> Any:
     """Get all tags for a specific solution."""
     tags = await tag_service.get_solution_tags(solution_slug)
-    return StandardResponse.of(tags)
+    return FastJSONResponse(StandardResponse.of(tags))
 
 
 @router.post(
@@ -144,9 +176,7 @@ async def add_solution_tag(
 
         # Create tag if it doesn't exist and add it to solution
         solution_update = SolutionUpdate(tags=existing_tags + [formatted_tag_name])
-        updated_solution = await solution_service.update_solution_by_slug(
-            solution_slug, solution_update, current_user.username
-        )
+        updated_solution = await solution_service.update_solution(solution, solution_update, current_user.username)
         if not updated_solution:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -202,9 +232,7 @@ async def delete_solution_tag(
         # Remove tag from solution
         updated_tags = [tag for tag in existing_tags if tag != formatted_tag_name]
         solution_update = SolutionUpdate(tags=updated_tags)
-        updated_solution = await solution_service.update_solution_by_slug(
-            solution_slug, solution_update, current_user.username
-        )
+        updated_solution = await solution_service.update_solution(solution, solution_update, current_user.username)
         if not updated_solution:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
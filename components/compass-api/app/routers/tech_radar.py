@@ -1,7 +1,10 @@
+from datetime import datetime
 from typing import Dict, List
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import Response
 
+from app.core.cache import cached_response
 from app.models.tech_radar import TechRadarData
 from app.services.tech_radar_service import TechRadarService
 
@@ -10,8 +13,9 @@ router = APIRouter()
 
 @router.get("/data", response_model=TechRadarData)
 async def get_tech_radar_data(
+    request: Request,
     tech_radar_service: TechRadarService = Depends(),
-) -> TechRadarData:
+) -> Response:
     """Get tech radar data in Zalando Tech Radar format.
 
     Returns a list of all approved solutions with their:
@@ -20,8 +24,15 @@ async def get_tech_radar_data(
     - label (solution name)
     - active (always true for approved solutions)
     - moved (always 0)
+
+    The rendered payload is cached together with its compressed variants and
+    served with an ETag; a matching If-None-Match is answered with 304.
     """
-    return await tech_radar_service.get_tech_radar_data()
+    # The payload embeds the current month, so it is part of the key
+    month = datetime.now().strftime("%Y-%m")
+    return await cached_response(
+        request, "tech_radar", month, ("solutions", "categories"), tech_radar_service.get_tech_radar_data
+    )
 
 
 @router.get("/quadrants", response_model=List[Dict[str, str]])
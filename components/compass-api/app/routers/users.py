@@ -5,6 +5,8 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.responses import Response
 
 from app.core.auth import get_current_active_user, get_current_superuser
+from app.core.concurrency import fan_out
+from app.core.text_filters import MatchMode
 from app.models.response import StandardResponse
 from app.models.user import (
     AdminUserUpdate,
@@ -39,7 +41,10 @@ async def create_user(
 async def get_users(
     skip: int = 0,
     limit: int = 10,
-    username: Optional[str] = Query(None, description="Filter by username (case-insensitive partial match)"),
+    username: Optional[str] = Query(None, description="Filter by username (case-insensitive)"),
+    username_match: MatchMode = Query(
+        "prefix", description="How username matches: exact, prefix or contains (substring, slower)"
+    ),
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
     is_superuser: Optional[bool] = Query(None, description="Filter by superuser status"),
     user_service: UserService = Depends(),
@@ -49,18 +54,25 @@ async def get_users(
     Query Parameters:
     - skip: Number of records to skip
     - limit: Maximum number of records to return
-    - username: Filter by username (case-insensitive partial match)
+    - username: Filter by username (case-insensitive)
+    - username_match: exact, prefix (default) or contains; only contains scans every user
     - is_active: Filter by active status (true/false)
     - is_superuser: Filter by superuser status (true/false)
     """
-    users = await user_service.get_users(
-        skip=skip,
-        limit=limit,
-        username=username,
-        is_active=is_active,
-        is_superuser=is_superuser,
+    users, total = await fan_out(
+        "get_users",
+        items=user_service.get_users(
+            skip=skip,
+            limit=limit,
+            username=username,
+            is_active=is_active,
+            is_superuser=is_superuser,
+            username_match=username_match,
+        ),
+        total=user_service.count_users(
+            username=username, is_active=is_active, is_superuser=is_superuser, username_match=username_match
+        ),
     )
-    total = await user_service.count_users(username=username, is_active=is_active, is_superuser=is_superuser)
     return StandardResponse.paginated(data=users, total=total, skip=skip, limit=limit)
 
 
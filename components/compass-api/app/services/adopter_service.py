@@ -0,0 +1,139 @@
+from datetime import datetime
+from typing import List, Set, Tuple
+
+from pymongo import ASCENDING, DeleteOne, UpdateMany, UpdateOne
+from pymongo.errors import DuplicateKeyError
+
+from app.core.concurrency import fan_out
+from app.core.database import get_database
+from app.core.versioning import collection_versions
+from app.models.user import User
+from app.services.solution_cache import SOLUTIONS_BULK, solution_version
+from app.services.user_service import UserService
+
+
+class AdopterService:
+    """Adopted users of each solution, precomputed in the solution_adopters collection.
+
+    A user adopts a solution when one of their comments or their rating on it
+    is marked with is_adopted_user. Each (solution_slug, username) pair is
+    stored once, and solutions carry the number of their adopters in
+    adopter_count. Comment and rating writes that can change a user's
+    membership call refresh_adopter; rebuild_adopters recomputes everything
+    (scripts/rebuild_adopters.py, for writes made outside the API).
+    """
+
+    def __init__(self):
+        self.db = get_database()
+        self.collection = self.db.solution_adopters
+        self.user_service = UserService()
+
+    async def _adjust_adopter_counts(self, solution_slug: str, delta: int) -> None:
+        await self.db.solutions.update_one({"slug": solution_slug}, {"$inc": {"adopter_count": delta}})
+        # Publish the change to cached solutions
+        await collection_versions.bump(solution_version(solution_slug))
+
+    async def refresh_adopter(self, solution_slug: str, username: str) -> None:
+        """Recompute whether a user adopts a solution after one of their comments or ratings changed"""
+        adopted_filter = {"solution_slug": solution_slug, "username": username, "is_adopted_user": True}
+        comment, rating = await fan_out(
+            "refresh_adopter",
+            comment=self.db.comments.find_one(adopted_filter, {"_id": 1}),
+            rating=self.db.ratings.find_one(adopted_filter, {"_id": 1}),
+        )
+
+        key = {"solution_slug": solution_slug, "username": username}
+        if comment or rating:
+            try:
+                result = await self.collection.update_one(
+                    key, {"$setOnInsert": {"created_at": datetime.utcnow()}}, upsert=True
+                )
+            except DuplicateKeyError:
+                # Added concurrently by another refresh
+                return
+            if result.upserted_id is not None:
+                await self._adjust_adopter_counts(solution_slug, 1)
+        else:
+            result = await self.collection.delete_one(key)
+            if result.deleted_count:
+                await self._adjust_adopter_counts(solution_slug, -1)
+
+    async def _adopted_pairs(self) -> Set[Tuple[str, str]]:
+        pipeline = [
+            {"$match": {"is_adopted_user": True}},
+            {"$group": {"_id": {"solution_slug": "$solution_slug", "username": "$username"}}},
+        ]
+        comment_groups, rating_groups = await fan_out(
+            "adopted_pairs",
+            comments=self.db.comments.aggregate(pipeline).to_list(None),
+            ratings=self.db.ratings.aggregate(pipeline).to_list(None),
+        )
+        return {
+            (group["_id"]["solution_slug"], group["_id"]["username"])
+            for group in comment_groups + rating_groups
+            if group["_id"].get("username")
+        }
+
+    async def rebuild_adopters(self) -> int:
+        """Recompute every adopter and adopter count from the comments and ratings
+
+        Returns:
+            Number of adopters and solution counts corrected
+        """
+        adopted = await self._adopted_pairs()
+        stored = {
+            (adopter["solution_slug"], adopter["username"])
+            async for adopter in self.collection.find({}, {"solution_slug": 1, "username": 1})
+        }
+
+        now = datetime.utcnow()
+        operations = [
+            UpdateOne(
+                {"solution_slug": slug, "username": username},
+                {"$setOnInsert": {"created_at": now}},
+                upsert=True,
+            )
+            for slug, username in adopted - stored
+        ]
+        operations += [DeleteOne({"solution_slug": slug, "username": username}) for slug, username in stored - adopted]
+        corrected = len(operations)
+        if operations:
+            await self.collection.bulk_write(operations, ordered=False)
+
+        counts = {}
+        for slug, _ in adopted:
+            counts[slug] = counts.get(slug, 0) + 1
+        count_operations = [
+            UpdateOne({"slug": slug, "adopter_count": {"$ne": count}}, {"$set": {"adopter_count": count}})
+            for slug, count in counts.items()
+        ]
+        count_operations.append(
+            UpdateMany({"slug": {"$nin": list(counts)}, "adopter_count": {"$gt": 0}}, {"$set": {"adopter_count": 0}})
+        )
+        result = await self.db.solutions.bulk_write(count_operations, ordered=False)
+        corrected += result.modified_count
+
+        if corrected:
+            # Publish the change to cached solutions
+            await collection_versions.bump(SOLUTIONS_BULK)
+        return corrected
+
+    async def get_adopted_users(self, solution_slug: str, skip: int = 0, limit: int = 100) -> Tuple[List[User], int]:
+        """Get a page of a solution's adopted users, sorted by username, and their total number"""
+
+        async def load_page() -> List[User]:
+            cursor = (
+                self.collection.find({"solution_slug": solution_slug}, {"username": 1})
+                .sort("username", ASCENDING)
+                .skip(skip)
+                .limit(limit)
+            )
+            usernames = [adopter["username"] async for adopter in cursor]
+            users = {user.username: user for user in await self.user_service.get_users_by_usernames(usernames)}
+            return [users[username] for username in usernames if username in users]
+
+        return await fan_out(
+            "get_adopted_users",
+            items=load_page(),
+            total=self.collection.count_documents({"solution_slug": solution_slug}),
+        )
@@ -0,0 +1,205 @@
+import asyncio
+from typing import Dict, Iterable, List, Optional
+
+from app.core.database import get_database
+from app.core.versioning import collection_versions
+
+# Marks a section that has never been loaded (None is a valid version stamp)
+_NOT_LOADED = object()
+
+# Slugs whose existence is remembered until the solutions change
+SOLUTION_SLUG_CACHE_SIZE = 10000
+
+# Stamp bumped by writes changing only the usage counts of tags, which reload
+# the counts alone instead of every tag document
+TAG_USAGE = "tag_usage"
+
+# Stamp bumped by solution writes that can change category usage counts, which
+# reload the counts alone instead of every category document
+CATEGORY_USAGE = "category_usage"
+
+# Solution fields category usage counts depend on
+CATEGORY_USAGE_FIELDS = ("category", "review_status", "recommend_status")
+
+
+def category_usage_stamps(update: dict) -> tuple:
+    """Get the stamps to bump, besides "solutions", for a solution update setting these fields"""
+    return (CATEGORY_USAGE,) if any(field in update for field in CATEGORY_USAGE_FIELDS) else ()
+
+
+def empty_category_usage() -> dict:
+    """Usage entry of a category no solution uses"""
+    return {"usage_count": 0, "usage_by_review_status": {}, "usage_by_recommend_status": {}}
+
+
+async def aggregate_category_usage(names: Optional[Iterable[str]] = None) -> Dict[str, dict]:
+    """Count solutions per category in a single $group
+
+    Args:
+        names: Only count these categories (all categories if None)
+
+    Returns:
+        A mapping from category name to its usage_count, usage_by_review_status
+        and usage_by_recommend_status
+    """
+    pipeline = [
+        *([{"$match": {"category": {"$in": list(names)}}}] if names is not None else []),
+        {
+            "$group": {
+                "_id": {
+                    "category": "$category",
+                    "review_status": "$review_status",
+                    "recommend_status": "$recommend_status",
+                },
+                "count": {"$sum": 1},
+            }
+        },
+    ]
+    usage: Dict[str, dict] = {}
+    async for group in get_database().solutions.aggregate(pipeline):
+        key, count = group["_id"], group["count"]
+        entry = usage.setdefault(key.get("category"), empty_category_usage())
+        entry["usage_count"] += count
+        for field, breakdown in (
+            ("review_status", "usage_by_review_status"),
+            ("recommend_status", "usage_by_recommend_status"),
+        ):
+            value = key.get(field)
+            if value:
+                entry[breakdown][value] = entry[breakdown].get(value, 0) + count
+    return usage
+
+
+def _sort_value(value):
+    """Sort key matching MongoDB's ordering of missing/null values before others"""
+    return (0,) if value is None else (1, value)
+
+
+class Catalog:
+    """Process-wide in-memory copy of all tags and categories with their usage counts.
+
+    Tags and categories are small, read constantly and change rarely. Each
+    section is reloaded as a whole when the version stamp of a collection it
+    depends on changes, so writes made by this worker are visible on the next
+    read and writes made by other workers within VERSION_CHECK_INTERVAL_SECONDS.
+    Tag and category usage counts change with solution writes and are reloaded
+    on their own (TAG_USAGE and CATEGORY_USAGE stamps).
+    The existence of solution slugs is cached the same way, one slug at a time.
+    """
+
+    def __init__(self):
+        self._tags: Dict[str, dict] = {}
+        self._tags_stamp = _NOT_LOADED
+        self._tag_usage_stamp = _NOT_LOADED
+        self._categories: Dict[str, dict] = {}
+        self._category_usage: Dict[str, dict] = {}
+        self._categories_stamp = _NOT_LOADED
+        self._category_usage_stamp = _NOT_LOADED
+        self._solution_slugs: Dict[str, bool] = {}
+        self._solution_slugs_stamp = _NOT_LOADED
+        self._lock = asyncio.Lock()
+
+    async def load(self) -> None:
+        """Load every section (called at startup)"""
+        await self._ensure_tags()
+        await self._ensure_categories()
+
+    async def _ensure_tags(self) -> None:
+        stamp, usage_stamp = await collection_versions.get("tags", TAG_USAGE)
+        if stamp == self._tags_stamp and usage_stamp == self._tag_usage_stamp:
+            return
+        async with self._lock:
+            if stamp == self._tags_stamp and usage_stamp == self._tag_usage_stamp:
+                return
+            db = get_database()
+            if stamp != self._tags_stamp:
+                # Kept in name order for listings
+                self._tags = {tag["name"]: tag async for tag in db.tags.find().sort("name", 1)}
+            elif usage_stamp != self._tag_usage_stamp:
+                # Cached documents are shared with callers: replaced, not modified
+                counts = {
+                    tag["name"]: tag.get("usage_count", 0)
+                    async for tag in db.tags.find({}, {"usage_count": 1, "name": 1})
+                }
+                self._tags = {name: {**tag, "usage_count": counts.get(name, 0)} for name, tag in self._tags.items()}
+            self._tags_stamp, self._tag_usage_stamp = stamp, usage_stamp
+
+    async def _ensure_categories(self) -> None:
+        stamp, usage_stamp = await collection_versions.get("categories", CATEGORY_USAGE)
+        if stamp == self._categories_stamp and usage_stamp == self._category_usage_stamp:
+            return
+        async with self._lock:
+            if stamp == self._categories_stamp and usage_stamp == self._category_usage_stamp:
+                return
+            if stamp != self._categories_stamp:
+                # Kept in name order, the secondary order of listings
+                self._categories = {
+                    category["name"]: category async for category in get_database().categories.find().sort("name", 1)
+                }
+            if usage_stamp != self._category_usage_stamp:
+                # Category usage counts are derived from the solutions
+                self._category_usage = await aggregate_category_usage()
+            self._categories_stamp, self._category_usage_stamp = stamp, usage_stamp
+
+    async def get_tag(self, name: str) -> Optional[dict]:
+        """Get a tag document by its formatted name"""
+        await self._ensure_tags()
+        return self._tags.get(name)
+
+    async def get_tags_by_names(self, names: Iterable[str]) -> List[dict]:
+        """Get the tag documents for the given names, skipping unknown ones"""
+        await self._ensure_tags()
+        return [self._tags[name] for name in dict.fromkeys(names) if name in self._tags]
+
+    async def list_tags(self, show_all: bool = False) -> List[dict]:
+        """Get tag documents sorted by name, optionally only the ones in use"""
+        await self._ensure_tags()
+        tags = list(self._tags.values())
+        if show_all:
+            return tags
+        return [tag for tag in tags if tag.get("usage_count", 0) > 0]
+
+    async def get_category(self, name: str) -> Optional[dict]:
+        """Get a category document by name"""
+        await self._ensure_categories()
+        return self._categories.get(name)
+
+    async def list_categories(self, sort: str = "radar_quadrant") -> List[dict]:
+        """Get category documents sorted like the categories listing
+
+        Args:
+            sort: Sort field (prefix with - for descending order), name is the secondary order
+        """
+        await self._ensure_categories()
+        sort_field = sort.lstrip("-")
+        categories = list(self._categories.values())
+        # Stable sort keeps name order within equal values
+        categories.sort(key=lambda category: _sort_value(category.get(sort_field)), reverse=sort.startswith("-"))
+        return categories
+
+    async def get_category_usage(self, names: Optional[Iterable[str]] = None) -> Dict[str, dict]:
+        """Get usage entries (see aggregate_category_usage) of cataloged categories
+
+        Args:
+            names: Only these categories (all if None); names not in the catalog are skipped
+        """
+        await self._ensure_categories()
+        selected = self._categories if names is None else [name for name in names if name in self._categories]
+        return {name: self._category_usage.get(name) or empty_category_usage() for name in selected}
+
+    async def solution_exists(self, slug: str) -> bool:
+        """Check whether a solution with this slug exists"""
+        stamp = await collection_versions.get("solutions")
+        if stamp != self._solution_slugs_stamp:
+            self._solution_slugs = {}
+            self._solution_slugs_stamp = stamp
+        exists = self._solution_slugs.get(slug)
+        if exists is None:
+            exists = await get_database().solutions.find_one({"slug": slug}, {"_id": 1}) is not None
+            if len(self._solution_slugs) >= SOLUTION_SLUG_CACHE_SIZE:
+                self._solution_slugs.clear()
+            self._solution_slugs[slug] = exists
+        return exists
+
+
+catalog = Catalog()
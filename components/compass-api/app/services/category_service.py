@@ -1,19 +1,26 @@
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, Iterable, Optional, Tuple
 
 from bson import ObjectId
-from cachetools import TTLCache, keys
+from pymongo import ReturnDocument
+from pymongo.errors import BulkWriteError, DuplicateKeyError
 
+from app.core.config import settings
 from app.core.database import get_database
+from app.core.versioning import collection_versions
 from app.models.category import Category, CategoryCreate, CategoryInDB, CategoryUpdate
+from app.models.job import Job
+from app.services.catalog_service import CATEGORY_USAGE, aggregate_category_usage, catalog, empty_category_usage
+from app.services.job_service import JobService, ProgressCallback, job_runner
+from app.services.solution_cache import SOLUTIONS_BULK
+
+DUPLICATE_KEY_ERROR = 11000
 
 
 class CategoryService:
     def __init__(self):
         self.db = get_database()
         self.collection = self.db.categories
-        # Create a cache with 1-hour TTL
-        self.categories_cache = TTLCache(maxsize=1, ttl=3600)
 
     async def create_category(self, category: CategoryCreate, username: Optional[str] = None) -> CategoryInDB:
         """Create a new category"""
@@ -32,10 +39,15 @@ class CategoryService:
             category_dict["created_by"] = username
             category_dict["updated_by"] = username
 
-        result = await self.collection.insert_one(category_dict)
-        # Clear cache since data has been updated
-        self.categories_cache.clear()
-        return await self.get_category_by_id(str(result.inserted_id))
+        try:
+            result = await self.collection.insert_one(category_dict)
+        except DuplicateKeyError:
+            # Created concurrently since the check above (names are unique)
+            raise ValueError(f"Category '{name}' already exists")
+        # Publish the change to the catalog and cached responses
+        await collection_versions.bump("categories")
+        category_dict["_id"] = result.inserted_id
+        return CategoryInDB(**category_dict)
 
     async def get_category_by_id(self, category_id: str) -> Optional[CategoryInDB]:
         """Get a category by ID - internal use only"""
@@ -47,7 +59,7 @@ class CategoryService:
     async def get_category_by_name(self, name: str) -> Optional[CategoryInDB]:
         """Get a category by name (exact match)"""
         # Name is already trimmed by the model validator
-        category = await self.collection.find_one({"name": name})
+        category = await catalog.get_category(name)
         if category:
             return CategoryInDB(**category)
         return None
@@ -61,7 +73,45 @@ class CategoryService:
 
         # Create new category with minimal info
         category = CategoryCreate(name=name, description=f"Category for {name}")
-        return await self.create_category(category, username)
+        try:
+            return await self.create_category(category, username)
+        except ValueError:
+            # Created concurrently: use the winner's document
+            existing = await self.collection.find_one({"name": name})
+            if existing:
+                return CategoryInDB(**existing)
+            raise
+
+    async def ensure_categories(self, names: Iterable[str], username: Optional[str] = None) -> None:
+        """Make sure the given categories exist, creating the missing ones in a single insert
+
+        Args:
+            names: Category names (already trimmed)
+            username: The username performing the operation
+        """
+        names = set(names)
+        if not names:
+            return
+
+        missing = sorted([name for name in names if not await catalog.get_category(name)])
+        if missing:
+            now = datetime.utcnow()
+            documents = []
+            for name in missing:
+                category_dict = CategoryCreate(name=name, description=f"Category for {name}").model_dump()
+                category_dict.update({"created_at": now, "updated_at": now})
+                if username:
+                    category_dict.update({"created_by": username, "updated_by": username})
+                documents.append(category_dict)
+
+            try:
+                await self.collection.insert_many(documents, ordered=False)
+            except BulkWriteError as e:
+                # Categories created concurrently already exist, which is all that is needed
+                if any(error.get("code") != DUPLICATE_KEY_ERROR for error in e.details.get("writeErrors", [])):
+                    raise
+            # Publish the change to the catalog and cached responses
+            await collection_versions.bump("categories")
 
     async def get_categories(self, skip: int = 0, limit: int = 100, sort: str = "radar_quadrant") -> list[CategoryInDB]:
         """Get all categories with pagination and sorting
@@ -71,45 +121,33 @@ class CategoryService:
             limit: Maximum number of records to return
             sort: Sort field (prefix with - for descending order)
         """
-        # Generate cache key
-        cache_key = keys.hashkey(skip, limit, sort)
-
-        # Try to get data from cache
-        if cache_key in self.categories_cache:
-            return self.categories_cache[cache_key]
-
-        # Parse sort parameter
-        sort_field = sort.lstrip("-")
-        sort_direction = -1 if sort.startswith("-") else 1
-
-        # Build sort query
-        sort_query = [(sort_field, sort_direction)]
-
-        # Add name as secondary sort if not already sorting by name
-        if sort_field != "name":
-            sort_query.append(("name", 1))
-
-        cursor = self.collection.find().sort(sort_query).skip(skip).limit(limit)
-        categories = await cursor.to_list(length=limit)
-        result = [CategoryInDB(**category) for category in categories]
-
-        # Store result in cache
-        self.categories_cache[cache_key] = result
-        return result
+        categories = await catalog.list_categories(sort=sort)
+        return [CategoryInDB.from_db(category) for category in categories[skip : skip + limit]]
 
     async def update_category_by_id(
         self,
         category_id: str,
         category_update: CategoryUpdate,
         username: Optional[str] = None,
-    ) -> Optional[CategoryInDB]:
-        """Update a category by ID"""
+    ) -> Tuple[Optional[CategoryInDB], Optional[Job]]:
+        """Update a category by ID
+
+        When solutions use a renamed category, they are moved to the new name
+        by a background job, which renames the category document last. Until
+        then the category keeps its old name, so solutions still using it
+        resolve to the existing document instead of recreating it. Other
+        fields are updated right away.
+
+        Returns:
+            The updated category (None if not found) and the job renaming it, if any
+        """
         # Get existing category
         existing_category = await self.get_category_by_id(category_id)
         if not existing_category:
-            return None
+            return None, None
 
         update_dict = category_update.model_dump(exclude_unset=True)
+        job = None
 
         # Check name uniqueness if being updated
         if "name" in update_dict and update_dict["name"] != existing_category.name:
@@ -117,28 +155,110 @@ class CategoryService:
             if other_category:
                 raise ValueError(f"Category '{update_dict['name']}' is already in use")
 
-            # Update all solutions using this category
-            await self.db.solutions.update_many(
-                {"category": existing_category.name},
-                {
-                    "$set": {
-                        "category": update_dict["name"],
-                        "updated_at": datetime.utcnow(),
-                        "updated_by": username if username else None,
-                    }
-                },
-            )
+            # Move all solutions using this category in the background, then rename it
+            if await self.db.solutions.find_one({"category": existing_category.name}, {"_id": 1}):
+                params = {
+                    "category_id": category_id,
+                    "old_name": existing_category.name,
+                    "new_name": update_dict.pop("name"),
+                    "username": username,
+                }
+                job = await JobService().enqueue("rename_category", params, username)
 
         update_dict["updated_at"] = datetime.utcnow()
         if username:
             update_dict["updated_by"] = username
 
-        result = await self.collection.update_one({"_id": ObjectId(category_id)}, {"$set": update_dict})
-        # Clear cache since data has been updated
-        self.categories_cache.clear()
-        if result.modified_count:
-            return await self.get_category_by_id(category_id)
-        return existing_category
+        try:
+            result = await self.collection.find_one_and_update(
+                {"_id": ObjectId(category_id)}, {"$set": update_dict}, return_document=ReturnDocument.AFTER
+            )
+        except DuplicateKeyError:
+            # Created concurrently since the check above (names are unique)
+            raise ValueError(f"Category '{update_dict['name']}' is already in use")
+        # Publish the change to the catalog and cached responses
+        await collection_versions.bump("categories")
+        if result:
+            return CategoryInDB(**result), job
+        return None, job
+
+    async def rename_category(
+        self,
+        category_id: str,
+        old_name: str,
+        new_name: str,
+        username: Optional[str] = None,
+        progress: Optional[ProgressCallback] = None,
+    ) -> int:
+        """Move the solutions of a category to its new name, then rename the category document
+
+        Solutions moved back to the old name while the batches ran are moved
+        by another pass. If a category with the new name was created meanwhile
+        (e.g. by a solution edit), it takes over the renamed category's fields
+        and the old document is deleted.
+
+        Returns:
+            The number of solutions updated
+        """
+        processed = 0
+        while True:
+            processed += await self.rename_solutions_category(old_name, new_name, username, progress)
+            if not await self.db.solutions.find_one({"category": old_name}, {"_id": 1}):
+                break
+
+        changes = {"name": new_name, "updated_at": datetime.utcnow()}
+        if username:
+            changes["updated_by"] = username
+        try:
+            await self.collection.update_one({"_id": ObjectId(category_id), "name": old_name}, {"$set": changes})
+        except DuplicateKeyError:
+            category = await self.collection.find_one({"_id": ObjectId(category_id)})
+            if category:
+                fields = {key: value for key, value in category.items() if key not in ("_id", "name", "created_at")}
+                await self.collection.update_one({"name": new_name}, {"$set": {**fields, **changes}})
+                await self.collection.delete_one({"_id": category["_id"]})
+        # Publish the change to the catalog and cached responses
+        await collection_versions.bump("categories")
+        return processed
+
+    async def rename_solutions_category(
+        self,
+        old_name: str,
+        new_name: str,
+        username: Optional[str] = None,
+        progress: Optional[ProgressCallback] = None,
+    ) -> int:
+        """Move the solutions of a category to its new name in batches of JOB_BATCH_SIZE
+
+        Args:
+            old_name: Previous category name
+            new_name: New category name
+            username: Username performing the change
+            progress: Awaited with (processed, total) after each batch
+
+        Returns:
+            The number of solutions updated
+        """
+        total = await self.db.solutions.count_documents({"category": old_name})
+        processed = 0
+        while True:
+            cursor = self.db.solutions.find({"category": old_name}, {"_id": 1}).limit(settings.JOB_BATCH_SIZE)
+            solution_ids = [solution["_id"] async for solution in cursor]
+            if not solution_ids:
+                break
+            changes = {"category": new_name, "updated_at": datetime.utcnow()}
+            if username:
+                changes["updated_by"] = username
+            result = await self.db.solutions.update_many(
+                {"_id": {"$in": solution_ids}, "category": old_name}, {"$set": changes}
+            )
+            processed += result.modified_count
+            if progress:
+                await progress(processed, max(total, processed))
+        if processed:
+            # Publish the change to the catalog and cached responses
+            await collection_versions.bump("solutions", SOLUTIONS_BULK, CATEGORY_USAGE)
+        return processed
 
     async def delete_category_by_id(self, category_id: str) -> bool:
         """Delete a category by ID"""
@@ -153,20 +273,56 @@ class CategoryService:
             raise ValueError(f"Cannot delete category '{category.name}' as it is being used by solutions")
 
         result = await self.collection.delete_one({"_id": ObjectId(category_id)})
-        # Clear cache since data has been updated
-        self.categories_cache.clear()
+        # Publish the change to the catalog and cached responses
+        await collection_versions.bump("categories")
         return result.deleted_count > 0
 
     async def count_categories(self) -> int:
         """Get total number of categories"""
-        return await self.collection.count_documents({})
+        return len(await catalog.list_categories())
+
+    async def get_category_usage_counts(self, names: Optional[Iterable[str]] = None) -> Dict[str, dict]:
+        """Get the usage counts of categories, broken down by review and recommend status
 
-    async def get_category_usage_count(self, name: str) -> int:
-        """Get the number of approved solutions using this category"""
-        return await self.db.solutions.count_documents({"category": name})
+        Counts come from the catalog, which computes them for all categories in
+        one aggregation; names not cataloged yet are counted with one more.
 
-    async def get_category_with_usage(self, category: CategoryInDB) -> Category:
+        Args:
+            names: Only these categories (all if None)
+
+        Returns:
+            A mapping from category name to its usage_count, usage_by_review_status
+            and usage_by_recommend_status
+        """
+        usage = await catalog.get_category_usage(names)
+        if names is not None:
+            missing = [name for name in dict.fromkeys(names) if name not in usage]
+            if missing:
+                counted = await aggregate_category_usage(missing)
+                usage.update({name: counted.get(name) or empty_category_usage() for name in missing})
+        return usage
+
+    @staticmethod
+    def with_usage(category: CategoryInDB, usage: dict, breakdown: bool = False) -> Category:
+        """Convert CategoryInDB to Category with a usage entry from get_category_usage_counts
+
+        Args:
+            category: Category to convert
+            usage: Usage entry of the category
+            breakdown: Include the counts per review and recommend status
+        """
+        counts = usage if breakdown else {"usage_count": usage["usage_count"]}
+        return Category(**category.model_dump(), **counts)
+
+    async def get_category_with_usage(self, category: CategoryInDB, breakdown: bool = False) -> Category:
         """Convert CategoryInDB to Category with usage count"""
-        category_dict = category.model_dump()
-        usage_count = await self.get_category_usage_count(category.name)
-        return Category(**category_dict, usage_count=usage_count)
+        usage = await self.get_category_usage_counts([category.name])
+        return self.with_usage(category, usage[category.name], breakdown)
+
+
+@job_runner.handler("rename_category")
+async def run_rename_category_job(params: Dict[str, Any], progress: ProgressCallback) -> Dict[str, Any]:
+    updated = await CategoryService().rename_category(
+        params["category_id"], params["old_name"], params["new_name"], params.get("username"), progress
+    )
+    return {"solutions_updated": updated}
@@ -1,11 +1,14 @@
 from datetime import datetime
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from bson import ObjectId
 from fastapi import HTTPException, status
 from pymongo import ASCENDING, DESCENDING
 
+from app.core.concurrency import fan_out
 from app.core.database import get_database
+from app.core.identity_map import find_one_by
+from app.core.text_filters import MatchMode, text_filter
 from app.models.comment import (
     Comment,
     CommentCreate,
@@ -13,6 +16,7 @@ from app.models.comment import (
     CommentType,
     CommentUpdate,
 )
+from app.services.adopter_service import AdopterService
 from app.services.user_service import UserService
 
 VALID_SORT_FIELDS = {"created_at", "updated_at"}
@@ -23,6 +27,7 @@ class CommentService:
         self.db = get_database()
         self.collection = self.db.comments
         self.user_service = UserService()
+        self.adopter_service = AdopterService()
 
     async def _convert_to_comment(self, comment_data: dict) -> Comment:
         """Private helper method to convert comment data to Comment model with full name"""
@@ -30,7 +35,37 @@ class CommentService:
         user_info = await self.user_service.get_user_info(comment_data["username"])
         if user_info:
             comment_data["full_name"] = user_info["full_name"]
-        return Comment(**comment_data)
+        return Comment.from_db(comment_data)
+
+    async def build_comments(self, comments: List[dict], user_infos: Optional[Dict[str, dict]] = None) -> List[Comment]:
+        """Convert several comments at once, resolving the authors' full names in a single query
+
+        Args:
+            comments: Comment documents as read from the database
+            user_infos: Already resolved user infos by username (see UserService.get_user_infos)
+        """
+        for comment in comments:
+            # If username is missing, use created_by as fallback
+            if "username" not in comment:
+                comment["username"] = comment["created_by"]
+        if user_infos is None:
+            user_infos = await self.user_service.get_user_infos(comment["username"] for comment in comments)
+        for comment in comments:
+            user_info = user_infos.get(comment["username"])
+            if user_info:
+                comment["full_name"] = user_info["full_name"]
+        return [Comment.from_db(comment) for comment in comments]
+
+    async def _find_comments(
+        self, label: str, query: dict, sort: List[Tuple[str, int]], skip: int, limit: int
+    ) -> Tuple[List[Comment], int]:
+        """Get a page of comments and the total number of matches, queried concurrently"""
+
+        async def load_page() -> List[Comment]:
+            cursor = self.collection.find(query).sort(sort).skip(skip).limit(limit)
+            return await self.build_comments(await cursor.to_list(length=limit))
+
+        return await fan_out(label, items=load_page(), total=self.collection.count_documents(query))
 
     async def get_comments(
         self,
@@ -39,14 +74,15 @@ class CommentService:
         sort: str = "-created_at",  # Default sort by created_at desc
         type: Optional[CommentType] = None,
         solution_slug: Optional[str] = None,
+        solution_slug_match: MatchMode = "prefix",
     ) -> Tuple[List[Comment], int]:
         """Get all comments with pagination, sorting and optional type filtering."""
         query = {}
         if type:
             query["type"] = type
         if solution_slug:
-            # Add case-insensitive partial matching for solution_slug
-            query["solution_slug"] = {"$regex": solution_slug, "$options": "i"}
+            # Case-insensitive (slugs are lowercase), index-backed unless substring matching is requested
+            query["solution_slug"] = text_filter(solution_slug, solution_slug_match)
 
         if sort.startswith("-"):
             sort_field = sort[1:]  # Remove the minus sign
@@ -59,20 +95,7 @@ class CommentService:
         if sort_field not in VALID_SORT_FIELDS:
             raise ValueError(f"Invalid sort field: {sort_field}. Valid fields are: {', '.join(VALID_SORT_FIELDS)}")
 
-        # Execute query with sort
-        cursor = self.collection.find(query).sort(sort_field, sort_direction).skip(skip).limit(limit)
-
-        # Convert to Comment objects with user full names
-        comments = []
-        async for comment in cursor:
-            # If username is missing, use created_by as fallback
-            if "username" not in comment:
-                comment["username"] = comment["created_by"]
-            comments.append(await self._convert_to_comment(comment))
-
-        total = await self.collection.count_documents(query)
-
-        return comments, total
+        return await self._find_comments("get_comments", query, [(sort_field, sort_direction)], skip, limit)
 
     async def get_solution_comments(
         self,
@@ -87,19 +110,7 @@ class CommentService:
         if type:
             query["type"] = type
 
-        sort_field = sort_by
-        cursor = self.collection.find(query).sort(sort_field, DESCENDING).skip(skip).limit(limit)
-
-        # Convert to Comment objects with user full names
-        comments = []
-        async for comment in cursor:
-            # If username is missing, use created_by as fallback
-            if "username" not in comment:
-                comment["username"] = comment["created_by"]
-            comments.append(await self._convert_to_comment(comment))
-
-        total = await self.collection.count_documents(query)
-        return comments, total
+        return await self._find_comments("get_solution_comments", query, [(sort_by, DESCENDING)], skip, limit)
 
     async def get_comment_by_id(self, comment_id: str) -> Optional[Comment]:
         """Get a specific comment by ID"""
@@ -133,8 +144,8 @@ class CommentService:
 
     async def create_comment(self, solution_slug: str, comment: CommentCreate, username: str) -> CommentInDB:
         """Create a new comment"""
-        # Check if solution exists
-        solution = await self.db.solutions.find_one({"slug": solution_slug})
+        # Check if solution exists (usually already loaded by the router in this request)
+        solution = await find_one_by(self.db.solutions, "slug", solution_slug)
         if not solution:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -156,6 +167,8 @@ class CommentService:
         )
         result = await self.collection.insert_one(comment_dict)
         comment_dict["_id"] = result.inserted_id
+        if comment_dict.get("is_adopted_user"):
+            await self.adopter_service.refresh_adopter(solution_slug, username)
         return CommentInDB(**comment_dict)
 
     async def update_comment(
@@ -189,6 +202,8 @@ class CommentService:
         result = await self.collection.find_one_and_update(
             {"_id": ObjectId(comment_id)}, {"$set": update_dict}, return_document=True
         )
+        if update_dict.get("is_adopted_user", comment.is_adopted_user) != comment.is_adopted_user:
+            await self.adopter_service.refresh_adopter(comment.solution_slug, comment.username)
         return CommentInDB(**result) if result else None
 
     async def delete_comment(self, comment_id: str, username: str, is_superuser: bool) -> bool:
@@ -204,6 +219,8 @@ class CommentService:
             )
 
         result = await self.collection.delete_one({"_id": ObjectId(comment_id)})
+        if result.deleted_count and comment.is_adopted_user:
+            await self.adopter_service.refresh_adopter(comment.solution_slug, comment.username)
         return result.deleted_count > 0
 
     async def count_solution_comments(self, solution_slug: str) -> int:
@@ -230,32 +247,4 @@ class CommentService:
 
         # Query for user's comments
         query = {"username": username}
-        cursor = self.collection.find(query).sort(sort_field, sort_direction).skip(skip).limit(limit)
-
-        # Convert to Comment objects with user full names
-        comments = []
-        async for comment in cursor:
-            comments.append(await self._convert_to_comment(comment))
-
-        total = await self.collection.count_documents(query)
-        return comments, total
-
-    async def get_solution_adopted_usernames(self, solution_slug: str) -> set[str]:
-        """Get unique usernames of adopted users who commented on a solution.
-
-        Args:
-            solution_slug: The slug of the solution
-
-        Returns:
-            Set of unique usernames who are marked as adopted users
-        """
-        pipeline = [
-            {"$match": {"solution_slug": solution_slug, "is_adopted_user": True}},
-            {"$group": {"_id": None, "usernames": {"$addToSet": "$username"}}},
-        ]
-
-        result = await self.collection.aggregate(pipeline).to_list(1)
-        if not result:
-            return set()
-
-        return set(result[0]["usernames"])
+        return await self._find_comments("get_user_comments", query, [(sort_field, sort_direction)], skip, limit)
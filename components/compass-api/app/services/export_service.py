@@ -0,0 +1,178 @@
+import csv
+import io
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from bson import ObjectId
+from pymongo import ASCENDING
+
+from app.core.config import settings
+from app.core.database import get_database
+from app.core.responses import dumps
+from app.models.export import ExportFormat, ExportResource
+
+# Collection, incremental-export timestamp field and exported fields (CSV columns) per resource
+EXPORT_DEFINITIONS: Dict[ExportResource, Dict[str, Any]] = {
+    ExportResource.SOLUTIONS: {
+        "collection": "solutions",
+        "since_field": "updated_at",
+        "columns": [
+            "_id",
+            "slug",
+            "name",
+            "brief",
+            "description",
+            "category",
+            "department",
+            "team",
+            "team_email",
+            "maintainer_id",
+            "maintainer_name",
+            "maintainer_email",
+            "official_website",
+            "documentation_url",
+            "demo_url",
+            "version",
+            "adoption_level",
+            "adoption_user_count",
+            "tags",
+            "pros",
+            "cons",
+            "stage",
+            "recommend_status",
+            "review_status",
+            "created_at",
+            "created_by",
+            "updated_at",
+            "updated_by",
+        ],
+    },
+    ExportResource.RATINGS: {
+        "collection": "ratings",
+        "since_field": "updated_at",
+        "columns": [
+            "_id",
+            "solution_slug",
+            "username",
+            "score",
+            "comment",
+            "is_adopted_user",
+            "created_at",
+            "updated_at",
+            "updated_by",
+        ],
+    },
+    ExportResource.COMMENTS: {
+        "collection": "comments",
+        "since_field": "updated_at",
+        "columns": [
+            "_id",
+            "solution_slug",
+            "username",
+            "type",
+            "content",
+            "is_adopted_user",
+            "created_at",
+            "created_by",
+            "updated_at",
+            "updated_by",
+        ],
+    },
+    ExportResource.HISTORY: {
+        "collection": "history",
+        "since_field": "created_at",
+        "columns": [
+            "_id",
+            "object_type",
+            "object_id",
+            "object_name",
+            "change_type",
+            "change_summary",
+            "changed_fields",
+            "created_at",
+            "created_by",
+        ],
+    },
+}
+
+
+def _csv_value(value: Any) -> Any:
+    """Flatten a document value into a CSV cell"""
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, list) and all(isinstance(item, str) for item in value):
+        return ";".join(value)
+    if isinstance(value, (list, dict)):
+        return dumps(value).decode()
+    return value
+
+
+class ExportService:
+    """Streams whole collections without paging through skip/limit"""
+
+    def __init__(self):
+        self.db = get_database()
+
+    async def iter_documents(
+        self, resource: ExportResource, since: Optional[datetime] = None
+    ) -> AsyncIterator[List[dict]]:
+        """Iterate over the documents of a resource in batches
+
+        Documents are read in _id order from a single cursor, so memory use
+        stays bounded by the batch size regardless of the collection size.
+        Only the fields listed in the resource's columns are read, which keeps
+        internal fields (search keys, precomputed counts) out of the export.
+
+        Args:
+            resource: Resource to export
+            since: Only include documents changed at or after this time
+
+        Yields:
+            Lists of at most EXPORT_BATCH_SIZE documents
+        """
+        definition = EXPORT_DEFINITIONS[resource]
+        query = {definition["since_field"]: {"$gte": since}} if since else {}
+        projection = dict.fromkeys(definition["columns"], 1)
+        batch_size = settings.EXPORT_BATCH_SIZE
+        cursor = self.db[definition["collection"]].find(query, projection).sort("_id", ASCENDING).batch_size(batch_size)
+
+        batch = []
+        async for document in cursor:
+            batch.append(document)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    async def stream_ndjson(self, resource: ExportResource, since: Optional[datetime] = None) -> AsyncIterator[bytes]:
+        """Stream a resource as newline-delimited JSON, one document per line"""
+        async for batch in self.iter_documents(resource, since):
+            yield b"".join(dumps(document) + b"\n" for document in batch)
+
+    async def stream_csv(self, resource: ExportResource, since: Optional[datetime] = None) -> AsyncIterator[bytes]:
+        """Stream a resource as CSV with a fixed set of columns"""
+        columns = EXPORT_DEFINITIONS[resource]["columns"]
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+
+        writer.writerow(columns)
+        yield buffer.getvalue().encode()
+
+        async for batch in self.iter_documents(resource, since):
+            buffer.seek(0)
+            buffer.truncate()
+            writer.writerows([_csv_value(document.get(column)) for column in columns] for document in batch)
+            yield buffer.getvalue().encode()
+
+    def stream(
+        self, resource: ExportResource, export_format: ExportFormat, since: Optional[datetime] = None
+    ) -> AsyncIterator[bytes]:
+        """Stream a resource in the requested format"""
+        if export_format == ExportFormat.CSV:
+            return self.stream_csv(resource, since)
+        return self.stream_ndjson(resource, since)
@@ -2,7 +2,9 @@ from typing import Dict, List, Optional
 
 from pymongo import DESCENDING
 
+from app.core.concurrency import fan_out
 from app.core.database import get_database
+from app.core.text_filters import backfill_derived_fields, normalize_text, text_filter
 from app.models.history import ChangeType, HistoryQuery, HistoryRecord
 
 
@@ -13,6 +15,13 @@ class HistoryService:
         self.db = get_database()
         self.collection = self.db.history
 
+    @staticmethod
+    def _to_document(record: HistoryRecord) -> dict:
+        document = record.model_dump(by_alias=True)
+        # Stored normalized for index-backed object_name filters
+        document["object_name_normalized"] = normalize_text(record.object_name)
+        return document
+
     async def create_history_record(self, record: HistoryRecord) -> str:
         """
         Create a new history record
@@ -23,9 +32,34 @@ class HistoryService:
         Returns:
             The ID of the created record
         """
-        result = await self.collection.insert_one(record.model_dump(by_alias=True))
+        result = await self.collection.insert_one(self._to_document(record))
         return str(result.inserted_id)
 
+    async def create_history_records(self, records: List[HistoryRecord]) -> List[str]:
+        """
+        Create several history records with a single insert
+
+        Args:
+            records: The history records to create
+
+        Returns:
+            The IDs of the created records
+        """
+        if not records:
+            return []
+        result = await self.collection.insert_many([self._to_document(record) for record in records])
+        return [str(inserted_id) for inserted_id in result.inserted_ids]
+
+    async def backfill_normalized_names(self) -> int:
+        """Store object_name_normalized on history records written before it existed
+
+        Returns:
+            Number of records updated
+        """
+        return await backfill_derived_fields(
+            self.collection, "object_name", lambda name: {"object_name_normalized": normalize_text(name)}
+        )
+
     async def get_history_records(self, query: HistoryQuery) -> tuple[List[HistoryRecord], int]:
         """
         Get history records based on query parameters
@@ -46,7 +80,7 @@ class HistoryService:
             filter_criteria["object_id"] = query.object_id
 
         if query.object_name:
-            filter_criteria["object_name"] = {"$regex": query.object_name, "$options": "i"}
+            filter_criteria["object_name_normalized"] = text_filter(query.object_name, query.object_name_match)
 
         if query.change_type:
             filter_criteria["change_type"] = query.change_type
@@ -64,22 +98,16 @@ class HistoryService:
         if date_criteria:
             filter_criteria["created_at"] = date_criteria
 
-        # Get total count
-        total = await self.collection.count_documents(filter_criteria)
-
-        # Get paginated records
-        cursor = self.collection.find(filter_criteria)
+        async def load_page() -> List[HistoryRecord]:
+            # Sort by created_at in descending order (newest first)
+            cursor = self.collection.find(filter_criteria).sort("created_at", DESCENDING)
+            cursor = cursor.skip(query.skip).limit(query.limit)
+            return [HistoryRecord.from_db(record) async for record in cursor]
 
-        # Sort by created_at in descending order (newest first)
-        cursor = cursor.sort("created_at", DESCENDING)
-
-        # Apply pagination
-        cursor = cursor.skip(query.skip).limit(query.limit)
-
-        # Convert to HistoryRecord objects
-        records = [HistoryRecord(**record) async for record in cursor]
-
-        return records, total
+        # The page and the total count are queried concurrently
+        return await fan_out(
+            "get_history_records", items=load_page(), total=self.collection.count_documents(filter_criteria)
+        )
 
     async def get_object_history(
         self, object_type: str, object_id: str, skip: int = 0, limit: int = 20
@@ -0,0 +1,234 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from bson import ObjectId
+from pymongo import ASCENDING, DESCENDING, ReturnDocument
+
+from app.core.config import settings
+from app.core.database import get_database
+from app.models.job import Job, JobStatusEnum, JobTypeEnum
+
+logger = logging.getLogger(__name__)
+
+# Called with (solutions processed, solutions to process) after each batch
+ProgressCallback = Callable[[int, int], Awaitable[None]]
+
+# Runs a job from its params; the returned dict is stored as the job result
+JobHandler = Callable[[Dict[str, Any], ProgressCallback], Awaitable[Optional[Dict[str, Any]]]]
+
+
+class JobService:
+    def __init__(self):
+        self.db = get_database()
+        self.collection = self.db.jobs
+
+    async def enqueue(self, job_type: JobTypeEnum, params: Dict[str, Any], username: Optional[str] = None) -> Job:
+        """Store a new job and wake up the workers of this process
+
+        Args:
+            job_type: Operation to run
+            params: Arguments passed to the job handler
+            username: Username requesting the operation
+
+        Returns:
+            The pending job
+        """
+        job_dict = Job(type=job_type, params=params, created_by=username, updated_by=username).model_dump(by_alias=True)
+        await self.collection.insert_one(job_dict)
+        job_runner.notify()
+        return Job.from_db(job_dict)
+
+    async def get_job_by_id(self, job_id: str) -> Optional[Job]:
+        """Get a job by ID"""
+        try:
+            job = await self.collection.find_one({"_id": ObjectId(job_id)})
+            if job:
+                return Job.from_db(job)
+            return None
+        except Exception:
+            return None
+
+    def _build_query(self, status: Optional[JobStatusEnum], job_type: Optional[JobTypeEnum]) -> dict:
+        query = {}
+        if status:
+            query["status"] = status
+        if job_type:
+            query["type"] = job_type
+        return query
+
+    async def get_jobs(
+        self,
+        skip: int = 0,
+        limit: int = 20,
+        status: Optional[JobStatusEnum] = None,
+        job_type: Optional[JobTypeEnum] = None,
+    ) -> List[Job]:
+        """Get jobs, newest first"""
+        cursor = (
+            self.collection.find(self._build_query(status, job_type))
+            .sort("created_at", DESCENDING)
+            .skip(skip)
+            .limit(limit)
+        )
+        return [Job.from_db(job) async for job in cursor]
+
+    async def count_jobs(self, status: Optional[JobStatusEnum] = None, job_type: Optional[JobTypeEnum] = None) -> int:
+        """Get total number of jobs"""
+        return await self.collection.count_documents(self._build_query(status, job_type))
+
+
+class JobRunner:
+    """In-process workers running the jobs stored in the jobs collection.
+
+    Jobs are claimed with an atomic find_one_and_update, so the workers of
+    several processes can share the collection. A running job holds a lease
+    renewed on every progress report; when its process stops, the job is
+    handed back (or its lease expires) and it is resumed by the next worker.
+    Handlers must therefore be idempotent and pick up whatever a previous
+    run left undone. Each progress report also sleeps JOB_BATCH_DELAY_SECONDS
+    to throttle the load jobs put on the database.
+    """
+
+    def __init__(self):
+        self._handlers: Dict[str, JobHandler] = {}
+        self._workers: List[asyncio.Task] = []
+        self._wakeup = asyncio.Event()
+
+    def handler(self, job_type: JobTypeEnum) -> Callable[[JobHandler], JobHandler]:
+        """Register the handler of a job type (decorator)"""
+
+        def register(handler: JobHandler) -> JobHandler:
+            self._handlers[job_type] = handler
+            return handler
+
+        return register
+
+    def notify(self) -> None:
+        """Wake up idle workers (a job was enqueued)"""
+        self._wakeup.set()
+
+    async def start(self, workers: int = settings.JOB_WORKERS) -> None:
+        """Start the workers (called at startup)"""
+        self._workers = [asyncio.create_task(self._work()) for _ in range(workers)]
+
+    async def stop(self) -> None:
+        """Stop the workers, handing running jobs back to the queue (called at shutdown)"""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def run_pending(self) -> int:
+        """Run the queued jobs one after another until none is left, without workers
+
+        Returns:
+            The number of jobs run
+        """
+        count = 0
+        while job := await self._claim():
+            await self._run(job)
+            count += 1
+        return count
+
+    async def _claim(self) -> Optional[dict]:
+        """Claim the oldest pending job, or a running one whose worker is gone"""
+        now = datetime.utcnow()
+        return await get_database().jobs.find_one_and_update(
+            {"$or": [{"status": "PENDING"}, {"status": "RUNNING", "lease_expires_at": {"$lt": now}}]},
+            {
+                "$set": {
+                    "status": "RUNNING",
+                    "started_at": now,
+                    "updated_at": now,
+                    "lease_expires_at": now + timedelta(seconds=settings.JOB_LEASE_SECONDS),
+                },
+                "$inc": {"attempts": 1},
+            },
+            sort=[("created_at", ASCENDING)],
+            return_document=ReturnDocument.AFTER,
+        )
+
+    async def _work(self) -> None:
+        while True:
+            try:
+                job = await self._claim()
+            except Exception as e:
+                logger.error(f"Error claiming job: {str(e)}")
+                job = None
+
+            if job is None:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=settings.JOB_POLL_INTERVAL_SECONDS)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            await self._run(job)
+
+    async def _run(self, job: dict) -> None:
+        jobs = get_database().jobs
+        # Updates only apply while this run still owns the job
+        owned = {"_id": job["_id"], "status": "RUNNING", "attempts": job["attempts"]}
+
+        async def progress(processed: int, total: int) -> None:
+            now = datetime.utcnow()
+            await jobs.update_one(
+                owned,
+                {
+                    "$set": {
+                        "processed": processed,
+                        "total": total,
+                        "updated_at": now,
+                        "lease_expires_at": now + timedelta(seconds=settings.JOB_LEASE_SECONDS),
+                    }
+                },
+            )
+            await asyncio.sleep(settings.JOB_BATCH_DELAY_SECONDS)
+
+        logger.info(f"Running job {job['_id']} ({job['type']}), attempt {job['attempts']}")
+        try:
+            handler = self._handlers.get(job["type"])
+            if handler is None:
+                raise ValueError(f"Unknown job type: {job['type']}")
+            result = await handler(job["params"], progress)
+        except asyncio.CancelledError:
+            # Shutting down: the next worker resumes the job
+            await jobs.update_one(owned, {"$set": {"status": "PENDING", "lease_expires_at": None}})
+            raise
+        except Exception as e:
+            logger.error(f"Job {job['_id']} ({job['type']}) failed: {str(e)}")
+            now = datetime.utcnow()
+            await jobs.update_one(
+                owned,
+                {
+                    "$set": {
+                        "status": "FAILED",
+                        "error": str(e),
+                        "finished_at": now,
+                        "updated_at": now,
+                        "lease_expires_at": None,
+                    }
+                },
+            )
+            return
+
+        now = datetime.utcnow()
+        await jobs.update_one(
+            owned,
+            {
+                "$set": {
+                    "status": "COMPLETED",
+                    "result": result,
+                    "finished_at": now,
+                    "updated_at": now,
+                    "lease_expires_at": None,
+                }
+            },
+        )
+        logger.info(f"Job {job['_id']} ({job['type']}) completed")
+
+
+job_runner = JobRunner()
@@ -1,21 +1,58 @@
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from bson import ObjectId
 from fastapi import HTTPException, status
-from pymongo import ASCENDING, DESCENDING
+from pymongo import ASCENDING, DESCENDING, DeleteMany, ReturnDocument
+from pymongo.errors import DuplicateKeyError
 
+from app.core.concurrency import fan_out
 from app.core.database import get_database
+from app.core.text_filters import MatchMode, text_filter
+from app.core.versioning import collection_versions
 from app.models.rating import Rating, RatingCreate, RatingInDB
+from app.services.adopter_service import AdopterService
+from app.services.catalog_service import catalog
+from app.services.solution_cache import SOLUTIONS_BULK, solution_version
 from app.services.user_service import UserService
 
 VALID_SORT_FIELDS = {"created_at", "updated_at", "score"}
+SCORES = range(1, 6)
+
+
+def rating_summary_pipeline(match: dict) -> List[dict]:
+    """Aggregation computing the stored rating summary of each solution matching the filter
+
+    Counts per score are conditional sums, so no stage holds more than one
+    document per solution however many ratings it has. The summary holds the
+    sum of the scores rather than their average, so rating writes can keep it
+    up to date with $inc (see RatingService._apply_to_summary).
+    """
+    return [
+        {"$match": match},
+        {
+            "$group": {
+                "_id": "$solution_slug",
+                "count": {"$sum": 1},
+                "sum": {"$sum": "$score"},
+                **{f"score_{score}": {"$sum": {"$cond": [{"$eq": ["$score", score]}, 1, 0]}} for score in SCORES},
+            }
+        },
+        {
+            "$project": {
+                "count": 1,
+                "sum": 1,
+                "distribution": {str(score): f"$score_{score}" for score in SCORES},
+            }
+        },
+    ]
 
 
 class RatingService:
     def __init__(self):
         self.db = get_database()
         self.user_service = UserService()
+        self.adopter_service = AdopterService()
 
     async def _convert_to_rating(self, rating_data: dict) -> Rating:
         """Private helper method to convert rating data to Rating model with full name"""
@@ -23,7 +60,33 @@ class RatingService:
         user_info = await self.user_service.get_user_info(rating_data["username"])
         if user_info:
             rating_data["full_name"] = user_info["full_name"]
-        return Rating(**rating_data)
+        return Rating.from_db(rating_data)
+
+    async def build_ratings(self, ratings: List[dict], user_infos: Optional[Dict[str, dict]] = None) -> List[Rating]:
+        """Convert several ratings at once, resolving the authors' full names in a single query
+
+        Args:
+            ratings: Rating documents as read from the database
+            user_infos: Already resolved user infos by username (see UserService.get_user_infos)
+        """
+        if user_infos is None:
+            user_infos = await self.user_service.get_user_infos(rating["username"] for rating in ratings)
+        for rating in ratings:
+            user_info = user_infos.get(rating["username"])
+            if user_info:
+                rating["full_name"] = user_info["full_name"]
+        return [Rating.from_db(rating) for rating in ratings]
+
+    async def _find_ratings(
+        self, label: str, query: dict, sort: List[Tuple[str, int]], skip: int, limit: int
+    ) -> Tuple[List[Rating], int]:
+        """Get a page of ratings and the total number of matches, queried concurrently"""
+
+        async def load_page() -> List[Rating]:
+            cursor = self.db.ratings.find(query).sort(sort).skip(skip).limit(limit)
+            return await self.build_ratings(await cursor.to_list(length=limit))
+
+        return await fan_out(label, items=load_page(), total=self.db.ratings.count_documents(query))
 
     async def get_ratings(
         self,
@@ -32,6 +95,7 @@ class RatingService:
         sort: str = "-created_at",  # Default sort by created_at desc
         solution_slug: Optional[str] = None,
         score: Optional[int] = None,
+        solution_slug_match: MatchMode = "prefix",
     ) -> Tuple[List[Rating], int]:
         """Get all ratings with pagination and sorting.
         Default sort is by created_at in descending order (newest first)."""
@@ -39,8 +103,8 @@ class RatingService:
         # Build query
         query = {}
         if solution_slug:
-            # Add case-insensitive partial matching for solution_slug
-            query["solution_slug"] = {"$regex": solution_slug, "$options": "i"}
+            # Case-insensitive (slugs are lowercase), index-backed unless substring matching is requested
+            query["solution_slug"] = text_filter(solution_slug, solution_slug_match)
         if score is not None:
             query["score"] = score  # Exact match for score
 
@@ -59,22 +123,14 @@ class RatingService:
         if sort_field not in VALID_SORT_FIELDS:
             raise ValueError(f"Invalid sort field: {sort_field}. Valid fields are: {', '.join(VALID_SORT_FIELDS)}")
 
-        # Execute query with sort
-        cursor = self.db.ratings.find(query).sort(sort_field, sort_direction).skip(skip).limit(limit)
-        ratings = [await self._convert_to_rating(rating) async for rating in cursor]
-        total = await self.db.ratings.count_documents(query)
-
-        return ratings, total
+        return await self._find_ratings("get_ratings", query, [(sort_field, sort_direction)], skip, limit)
 
     async def get_solution_ratings(
         self, solution_slug: str, skip: int, limit: int, sort_by: str
     ) -> Tuple[List[Rating], int]:
         query = {"solution_slug": solution_slug}
         sort_field = "created_at" if sort_by == "created_at" else "score"
-        cursor = self.db.ratings.find(query).sort(sort_field, DESCENDING).skip(skip).limit(limit)
-        ratings = [await self._convert_to_rating(rating) async for rating in cursor]
-        total = await self.db.ratings.count_documents(query)
-        return ratings, total
+        return await self._find_ratings("get_solution_ratings", query, [(sort_field, DESCENDING)], skip, limit)
 
     async def get_user_rating(self, solution_slug: str, username: str) -> Optional[Rating]:
         rating = await self.db.ratings.find_one({"solution_slug": solution_slug, "username": username})
@@ -83,80 +139,138 @@ class RatingService:
         return None
 
     async def get_rating_summary(self, solution_slug: str) -> Dict:
-        """Get rating summary statistics for a solution"""
-        pipeline = [
-            {"$match": {"solution_slug": solution_slug}},
-            {
-                "$group": {
-                    "_id": None,
-                    "average": {"$avg": "$score"},
-                    "count": {"$sum": 1},
-                    "scores": {"$push": "$score"},
-                }
-            },
-        ]
-
-        result = await self.db.ratings.aggregate(pipeline).to_list(1)
-        if not result:
-            return {
-                "average": 0,
-                "count": 0,
-                "distribution": {str(i): 0 for i in range(1, 6)},
-            }
-
-        summary = result[0]
-        # Calculate distribution
-        distribution = {str(i): 0 for i in range(1, 6)}
-        for score in summary["scores"]:
-            distribution[str(score)] += 1
+        """Get rating summary statistics for a solution
 
+        Summaries are stored in the rating_summaries collection and updated
+        by every rating write.
+        """
+        summary = await self.db.rating_summaries.find_one({"_id": solution_slug}) or {}
+        count = summary.get("count", 0)
+        distribution = summary.get("distribution", {})
         return {
-            "average": round(summary["average"], 2),
-            "count": summary["count"],
-            "distribution": distribution,
+            "average": round(summary["sum"] / count, 2) if count else 0,
+            "count": count,
+            "distribution": {str(score): distribution.get(str(score), 0) for score in SCORES},
         }
 
+    async def _apply_to_summary(self, solution_slug: str, removed: Optional[int], added: Optional[int]) -> None:
+        """Apply one rating write to the stored summary of its solution with a single $inc
+
+        Args:
+            solution_slug: Solution of the rating
+            removed: Score of the rating replaced or deleted, None if the rating was created
+            added: Score of the rating written, None if the rating was deleted
+        """
+        increments: Dict[str, int] = {}
+        for score, sign in ((removed, -1), (added, 1)):
+            if score is None:
+                continue
+            for field, value in (("count", 1), ("sum", score), (f"distribution.{score}", 1)):
+                increments[field] = increments.get(field, 0) + sign * value
+        increments = {field: value for field, value in increments.items() if value}
+        if increments:
+            await self.db.rating_summaries.update_one({"_id": solution_slug}, {"$inc": increments}, upsert=True)
+
+    async def refresh_rating_summaries(self, solution_slugs: Optional[Iterable[str]] = None) -> None:
+        """Recompute stored rating summaries with a $merge into rating_summaries
+
+        Rating writes keep the summaries up to date; this rebuild is only run
+        by scripts/rebuild_rating_summaries.py, for summaries that drifted (e.g.
+        after ratings were edited directly in MongoDB).
+
+        Args:
+            solution_slugs: Solutions whose summaries to rebuild (all solutions if None)
+        """
+        match = {} if solution_slugs is None else {"solution_slug": {"$in": list(solution_slugs)}}
+        pipeline = rating_summary_pipeline(match) + [
+            {"$merge": {"into": "rating_summaries", "on": "_id", "whenMatched": "replace", "whenNotMatched": "insert"}}
+        ]
+        await self.db.ratings.aggregate(pipeline).to_list(None)
+
+        # Solutions left without ratings produce no summary to merge
+        rated_slugs = await self.db.ratings.distinct("solution_slug", match)
+        stale = {"_id": {"$nin": rated_slugs}}
+        if solution_slugs is not None:
+            stale["_id"]["$in"] = match["solution_slug"]["$in"]
+        await self.db.rating_summaries.delete_many(stale)
+
     async def create_or_update_rating(self, solution_slug: str, rating: RatingCreate, username: str) -> RatingInDB:
+        """Create a user's rating of a solution or replace the existing one
+
+        The rating is written with a single upsert; the unique
+        (solution_slug, username) index guarantees one rating per user.
+        """
         # First check if solution exists
-        solution = await self.db.solutions.find_one({"slug": solution_slug})
-        if not solution:
+        if not await catalog.solution_exists(solution_slug):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Solution with slug '{solution_slug}' not found",
             )
 
+        # Mongo stores milliseconds: the returned rating matches the stored one
         now = datetime.utcnow()
+        now = now.replace(microsecond=now.microsecond // 1000 * 1000)
         rating_data = rating.model_dump()
+        written = {
+            "score": rating_data["score"],
+            "comment": rating_data.get("comment"),
+            "is_adopted_user": rating_data.get("is_adopted_user", False),
+            "updated_at": now,
+        }
+        inserted = {"_id": ObjectId(), "created_at": now}
+        for attempt in range(2):
+            try:
+                # The pre-image gives the score the summary has to replace
+                previous = await self.db.ratings.find_one_and_update(
+                    {"solution_slug": solution_slug, "username": username},
+                    {"$set": written, "$setOnInsert": inserted},
+                    upsert=True,
+                    return_document=ReturnDocument.BEFORE,
+                )
+                break
+            except DuplicateKeyError:
+                # A concurrent first rating by the same user won the insert; update it instead
+                if attempt:
+                    raise
+
+        await self._apply_to_summary(solution_slug, previous["score"] if previous else None, written["score"])
+        await collection_versions.bump("ratings", solution_version(solution_slug))
+        # Adoption only changes with the flag (the replaced rating may have been the one marking the user)
+        if written["is_adopted_user"] != (previous or {}).get("is_adopted_user", False):
+            await self.adopter_service.refresh_adopter(solution_slug, username)
+        return RatingInDB.from_db(
+            {**(previous or inserted), "solution_slug": solution_slug, "username": username, **written}
+        )
+
+    async def remove_duplicate_ratings(self) -> int:
+        """Keep only the latest rating of each user for each solution
 
-        # Try to update existing rating first
-        result = await self.db.ratings.update_one(
-            {"solution_slug": solution_slug, "username": username},
+        Needed before the unique (solution_slug, username) index can be built
+        on data written by versions that could store duplicates.
+
+        Returns:
+            The number of ratings removed
+        """
+        pipeline = [
+            {"$sort": {"updated_at": DESCENDING}},
             {
-                "$set": {
-                    "score": rating_data["score"],
-                    "comment": rating_data.get("comment"),
-                    "is_adopted_user": rating_data.get("is_adopted_user", False),
-                    "updated_at": now,
+                "$group": {
+                    "_id": {"solution_slug": "$solution_slug", "username": "$username"},
+                    "ids": {"$push": "$_id"},
+                    "count": {"$sum": 1},
                 }
             },
-        )
-
-        # If no existing rating was updated, create a new one
-        if result.modified_count == 0:
-            new_rating = {
-                "solution_slug": solution_slug,
-                "username": username,
-                "score": rating_data["score"],
-                "comment": rating_data.get("comment"),
-                "is_adopted_user": rating_data.get("is_adopted_user", False),
-                "created_at": now,
-                "updated_at": now,
-            }
-            await self.db.ratings.insert_one(new_rating)
-            return RatingInDB(**new_rating)
-
-        # Return the updated rating
-        return await self.get_user_rating(solution_slug, username)
+            {"$match": {"count": {"$gt": 1}}},
+        ]
+        groups = await self.db.ratings.aggregate(pipeline).to_list(None)
+        if not groups:
+            return 0
+        operations = [DeleteMany({"_id": {"$in": group["ids"][1:]}}) for group in groups]
+        result = await self.db.ratings.bulk_write(operations, ordered=False)
+        await self.refresh_rating_summaries({group["_id"]["solution_slug"] for group in groups})
+        await self.adopter_service.rebuild_adopters()
+        await collection_versions.bump("ratings", SOLUTIONS_BULK)
+        return result.deleted_count
 
     async def get_user_ratings(
         self, username: str, skip: int = 0, limit: int = 20, sort: str = "-created_at"
@@ -178,13 +292,7 @@ class RatingService:
 
         # Query for user's ratings
         query = {"username": username}
-        cursor = self.db.ratings.find(query).sort(sort_field, sort_direction).skip(skip).limit(limit)
-
-        # Convert to Rating objects with user full names
-        ratings = [await self._convert_to_rating(rating) async for rating in cursor]
-        total = await self.db.ratings.count_documents(query)
-
-        return ratings, total
+        return await self._find_ratings("get_user_ratings", query, [(sort_field, sort_direction)], skip, limit)
 
     async def _get_rating_or_404(self, rating_id: str) -> RatingInDB:
         """Get a rating by ID or raise 404 if not found."""
@@ -192,7 +300,7 @@ class RatingService:
             rating = await self.db.ratings.find_one({"_id": ObjectId(rating_id)})
             if not rating:
                 raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Rating not found")
-            return RatingInDB(**rating)
+            return RatingInDB.from_db(rating)
         except Exception:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Invalid rating ID")
 
@@ -230,10 +338,17 @@ class RatingService:
         update_dict = rating_update.model_dump()
         update_dict.update({"updated_at": datetime.utcnow(), "updated_by": username})
 
-        result = await self.db.ratings.find_one_and_update(
-            {"_id": ObjectId(rating_id)}, {"$set": update_dict}, return_document=True
+        # The pre-image gives the score the summary has to replace
+        previous = await self.db.ratings.find_one_and_update(
+            {"_id": ObjectId(rating_id)}, {"$set": update_dict}, return_document=ReturnDocument.BEFORE
         )
-        return RatingInDB(**result) if result else None
+        if not previous:
+            return None
+        await self._apply_to_summary(rating.solution_slug, previous["score"], update_dict["score"])
+        await collection_versions.bump("ratings", solution_version(rating.solution_slug))
+        if update_dict["is_adopted_user"] != previous.get("is_adopted_user", False):
+            await self.adopter_service.refresh_adopter(rating.solution_slug, rating.username)
+        return RatingInDB.from_db({**previous, **update_dict})
 
     async def delete_rating(self, rating_id: str, username: str, is_superuser: bool) -> bool:
         """Delete a rating.
@@ -247,25 +362,11 @@ class RatingService:
                 detail="You don't have permission to delete this rating",
             )
 
-        result = await self.db.ratings.delete_one({"_id": ObjectId(rating_id)})
-        return result.deleted_count > 0
-
-    async def get_solution_adopted_usernames(self, solution_slug: str) -> set[str]:
-        """Get unique usernames of adopted users who rated a solution.
-
-        Args:
-            solution_slug: The slug of the solution
-
-        Returns:
-            Set of unique usernames who are marked as adopted users
-        """
-        pipeline = [
-            {"$match": {"solution_slug": solution_slug, "is_adopted_user": True}},
-            {"$group": {"_id": None, "usernames": {"$addToSet": "$username"}}},
-        ]
-
-        result = await self.db.ratings.aggregate(pipeline).to_list(1)
-        if not result:
-            return set()
-
-        return set(result[0]["usernames"])
+        # The deleted document gives the score to remove from the summary
+        deleted = await self.db.ratings.find_one_and_delete({"_id": ObjectId(rating_id)})
+        if deleted:
+            await self._apply_to_summary(rating.solution_slug, deleted["score"], None)
+            await collection_versions.bump("ratings", solution_version(rating.solution_slug))
+            if deleted.get("is_adopted_user"):
+                await self.adopter_service.refresh_adopter(rating.solution_slug, rating.username)
+        return deleted is not None
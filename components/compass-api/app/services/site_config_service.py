@@ -1,42 +1,87 @@
+import asyncio
 from datetime import datetime
 from typing import Optional
 
 from bson import ObjectId
+from pymongo import ReturnDocument
 
 from app.core.database import get_database
+from app.core.versioning import collection_versions
 from app.models.site_config import SiteConfigBase, SiteConfigInDB, SiteConfigUpdate
 
+# Marks a configuration that has never been loaded (None is a valid version stamp)
+_NOT_LOADED = object()
+
+
+class SiteConfigStore:
+    """Process-wide in-memory copy of the site configuration.
+
+    The configuration is loaded once and kept together with the "site_config"
+    version stamp it was read at. Writes in this worker replace it right away;
+    writes in other workers bump the stamp and are picked up within
+    VERSION_CHECK_INTERVAL_SECONDS. The (stamp, config) pair is swapped in a
+    single assignment, so readers never see a half-updated configuration.
+    The cached configuration is shared: callers must not modify it.
+    """
+
+    def __init__(self):
+        self._state = (_NOT_LOADED, None)
+        self._lock = asyncio.Lock()
+
+    async def get(self) -> Optional[SiteConfigInDB]:
+        """Get the configuration, reloading it when its version stamp changed"""
+        (stamp,) = await collection_versions.get("site_config")
+        if self._state[0] == stamp:
+            return self._state[1]
+        async with self._lock:
+            if self._state[0] == stamp:
+                return self._state[1]
+            config = await get_database().site_config.find_one({})
+            self._state = (stamp, SiteConfigInDB(**config) if config else None)
+            return self._state[1]
+
+    async def replace(self, config: Optional[SiteConfigInDB]) -> None:
+        """Publish a configuration written by this worker to all workers"""
+        await collection_versions.bump("site_config")
+        (stamp,) = await collection_versions.get("site_config")
+        self._state = (stamp, config)
+
+
+site_config_store = SiteConfigStore()
+
 
 class SiteConfigService:
     def __init__(self):
         self.db = get_database()
 
     async def get_site_config(self) -> Optional[SiteConfigInDB]:
-        """Get the current site configuration"""
-        config = await self.db.site_config.find_one({})
-        if config:
-            return SiteConfigInDB(**config)
-        return None
-
-    async def create_site_config(self, config: SiteConfigBase, username: str) -> SiteConfigInDB:
-        """Create initial site configuration"""
-        # Check if config already exists
-        existing = await self.get_site_config()
-        if existing:
-            raise ValueError("Site configuration already exists. Use update instead.")
+        """Get the current site configuration (served from memory)"""
+        return await site_config_store.get()
 
+    @staticmethod
+    def _new_config(config: SiteConfigBase, username: str) -> dict:
         now = datetime.utcnow()
-        config_dict = config.model_dump()
-        new_config = {
+        return {
             "id": str(ObjectId()),
-            **config_dict,
+            **config.model_dump(),
             "created_at": now,
             "updated_at": now,
             "updated_by": username,
         }
 
+    async def create_site_config(self, config: SiteConfigBase, username: str) -> SiteConfigInDB:
+        """Create initial site configuration"""
+        # Checked against the database, another worker may have created it moments ago
+        existing = await self.db.site_config.find_one({}, {"_id": 1})
+        if existing:
+            raise ValueError("Site configuration already exists. Use update instead.")
+
+        new_config = self._new_config(config, username)
         await self.db.site_config.insert_one(new_config)
-        return SiteConfigInDB(**new_config)
+
+        created = SiteConfigInDB(**new_config)
+        await site_config_store.replace(created)
+        return created
 
     async def update_site_config(self, config_update: SiteConfigUpdate, username: str) -> Optional[SiteConfigInDB]:
         """Update site configuration"""
@@ -52,19 +97,17 @@ class SiteConfigService:
         result = await self.db.site_config.find_one_and_update(
             {},  # Update the first (and only) config document
             {"$set": update_dict},
-            return_document=True,
+            return_document=ReturnDocument.AFTER,
         )
+        if not result:
+            return None
 
-        if result:
-            return SiteConfigInDB(**result)
-        return None
+        updated = SiteConfigInDB(**result)
+        await site_config_store.replace(updated)
+        return updated
 
     async def reset_site_config(self, username: str) -> SiteConfigInDB:
         """Reset site configuration to defaults"""
-        # Delete existing config
-        await self.db.site_config.delete_many({})
-
-        # Create default config
         default_config = SiteConfigBase(
             site_name="Tech Compass",
             site_description="Navigate your technology landscape",
@@ -77,4 +120,14 @@ class SiteConfigService:
             },
         )
 
-        return await self.create_site_config(default_config, username)
+        # Replaced in place, so readers never find the configuration missing
+        new_config = self._new_config(default_config, username)
+        result = await self.db.site_config.find_one_and_replace(
+            {}, new_config, upsert=True, return_document=ReturnDocument.AFTER
+        )
+        # Drop any extra documents left by concurrent creates
+        await self.db.site_config.delete_many({"_id": {"$ne": result["_id"]}})
+
+        reset = SiteConfigInDB(**result)
+        await site_config_store.replace(reset)
+        return reset
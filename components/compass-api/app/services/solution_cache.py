@@ -0,0 +1,50 @@
+from typing import Awaitable, Callable, Optional, Tuple
+
+from cachetools import TTLCache
+
+from app.core.config import settings
+from app.core.versioning import collection_versions
+from app.models.solution import Solution
+
+# Stamp bumped by writes rewriting many solutions at once (tag and category
+# changes, updates and deletions by name), which invalidates every solution
+SOLUTIONS_BULK = "solutions_bulk"
+
+
+def solution_version(slug: str) -> str:
+    """Name of the version stamp of a single solution, bumped when it or its ratings change"""
+    return f"solution:{slug}"
+
+
+def solution_depends_on(slug: str) -> Tuple[str, str]:
+    """Version stamps an assembled solution (document and rating summary) depends on"""
+    return solution_version(slug), SOLUTIONS_BULK
+
+
+class SolutionCache:
+    """Process-wide read-through cache of assembled solutions, keyed by slug.
+
+    Entries are validated against the solution's own version stamp and the
+    bulk stamp, so a write to one solution only invalidates that solution, in
+    this worker immediately and in other workers within
+    VERSION_CHECK_INTERVAL_SECONDS. A renamed solution bumps both its old and
+    its new slug. Cached solutions are shared: callers must not modify them.
+    """
+
+    def __init__(self, maxsize: int = 1000, ttl: int = 600):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    async def get_or_build(self, slug: str, build: Callable[[], Awaitable[Optional[Solution]]]) -> Optional[Solution]:
+        """Get a cached solution or assemble it with build() (missing solutions are not cached)"""
+        # Stamps are read before building, so a write during the build leaves a stale entry behind
+        stamps = await collection_versions.get(*solution_depends_on(slug))
+        entry = self._cache.get(slug)
+        if entry is not None and entry[0] == stamps:
+            return entry[1]
+        solution = await build()
+        if solution is not None:
+            self._cache[slug] = (stamps, solution)
+        return solution
+
+
+solution_cache = SolutionCache(maxsize=settings.SOLUTION_CACHE_MAX_ENTRIES, ttl=settings.PAYLOAD_CACHE_TTL_SECONDS)
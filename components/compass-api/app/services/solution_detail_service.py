@@ -0,0 +1,124 @@
+from typing import Iterable, List, Optional
+
+from pymongo import ASCENDING, DESCENDING
+
+from app.core.concurrency import fan_out
+from app.core.database import get_database
+from app.models.solution_detail import SOLUTION_DETAIL_PARTS, SolutionDetail
+from app.models.tag import Tag
+from app.services.catalog_service import catalog
+from app.services.comment_service import CommentService
+from app.services.rating_service import RatingService
+from app.services.solution_service import SolutionService
+from app.services.user_service import UserService
+
+
+async def _nothing() -> None:
+    return None
+
+
+class SolutionDetailService:
+    """Assembles the solution page (solution, ratings, comments, tags, adopters) in one pass"""
+
+    def __init__(self):
+        self.db = get_database()
+        self.solution_service = SolutionService()
+        self.comment_service = CommentService()
+        self.rating_service = RatingService()
+        self.user_service = UserService()
+
+    @staticmethod
+    def parse_include(include: Optional[str]) -> List[str]:
+        """Parse a comma-separated include= value (all parts if empty)
+
+        Raises:
+            ValueError: If an unknown part is requested
+        """
+        if not include:
+            return list(SOLUTION_DETAIL_PARTS)
+        parts = [part.strip() for part in include.split(",") if part.strip()]
+        unknown = [part for part in parts if part not in SOLUTION_DETAIL_PARTS]
+        if unknown:
+            raise ValueError(
+                f"Invalid include part(s): {', '.join(unknown)}. Valid parts are: {', '.join(SOLUTION_DETAIL_PARTS)}"
+            )
+        return parts
+
+    async def _adopted_usernames(self, slug: str, limit: int) -> List[str]:
+        cursor = self.db.solution_adopters.find({"solution_slug": slug}, {"username": 1}).sort("username", ASCENDING)
+        return [adopter["username"] async for adopter in cursor.limit(limit)]
+
+    async def _comment_documents(self, slug: str, limit: int) -> List[dict]:
+        cursor = self.db.comments.find({"solution_slug": slug}).sort("created_at", DESCENDING).limit(limit)
+        return await cursor.to_list(length=limit)
+
+    async def _tags(self, names: Iterable[str]) -> List[Tag]:
+        return [Tag.from_db(tag) for tag in await catalog.get_tags_by_names(names)]
+
+    async def get_solution_detail(
+        self,
+        slug: str,
+        include: Iterable[str] = SOLUTION_DETAIL_PARTS,
+        username: Optional[str] = None,
+        comments_limit: int = 20,
+        adopted_users_limit: int = 100,
+    ) -> Optional[SolutionDetail]:
+        """Get the selected parts of a solution page
+
+        The slug is resolved once (through the solution cache); the parts are
+        then queried concurrently and every user they mention is loaded with a
+        single users query.
+
+        Args:
+            slug: The solution slug
+            include: Parts to assemble (see SolutionDetailPart)
+            username: The current user, for my_rating (None for anonymous requests)
+            comments_limit: Size of the first comment page
+            adopted_users_limit: Size of the first page of adopted users (see solution.adopter_count for the total)
+
+        Returns:
+            The solution detail, None if the solution is not found
+        """
+        include = set(include)
+        solution = await self.solution_service.get_solution_by_slug_with_rating(slug)
+        if not solution:
+            return None
+
+        want_my_rating = "my_rating" in include and username is not None
+        summary, my_rating, comments, comments_total, tags, adopted = await fan_out(
+            "get_solution_detail",
+            summary=self.rating_service.get_rating_summary(slug) if "rating_summary" in include else _nothing(),
+            my_rating=(
+                self.db.ratings.find_one({"solution_slug": slug, "username": username})
+                if want_my_rating
+                else _nothing()
+            ),
+            comments=self._comment_documents(slug, comments_limit) if "comments" in include else _nothing(),
+            comments_total=(
+                self.comment_service.count_solution_comments(slug) if "comments" in include else _nothing()
+            ),
+            tags=self._tags(solution.tags or []) if "tags" in include else _nothing(),
+            adopted=self._adopted_usernames(slug, adopted_users_limit) if "adopted_users" in include else _nothing(),
+        )
+
+        # One users query for comment authors, the rating author and adopted users
+        usernames = set(adopted or ())
+        usernames.update(comment.get("username") or comment["created_by"] for comment in comments or ())
+        if my_rating:
+            usernames.add(my_rating["username"])
+        users = {user.username: user for user in await self.user_service.get_users_by_usernames(list(usernames))}
+        user_infos = {name: {"username": name, "full_name": user.full_name} for name, user in users.items()}
+
+        detail = SolutionDetail(
+            solution=solution if "solution" in include else None,
+            rating_summary=summary,
+            tags=tags,
+        )
+        if comments is not None:
+            detail.comments = await self.comment_service.build_comments(comments, user_infos)
+            detail.comments_total = comments_total
+        if my_rating:
+            detail.my_rating = (await self.rating_service.build_ratings([my_rating], user_infos))[0]
+        if adopted is not None:
+            detail.adopted_users = [users[name] for name in adopted if name in users]
+        return detail
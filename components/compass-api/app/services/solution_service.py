@@ -1,21 +1,43 @@
 import re
 from datetime import datetime
-from typing import List, Optional
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Set, Tuple, TypeVar
 
 from bson import ObjectId
 from fastapi import logger
-from pymongo import ASCENDING, DESCENDING
+from pydantic import ValidationError
+from pymongo import ASCENDING, DESCENDING, InsertOne, ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError
 
 from app.core.database import get_database
-from app.models.history import ChangeType
-from app.models.solution import Solution, SolutionCreate, SolutionInDB, SolutionUpdate
+from app.core.identity_map import find_one_by
+from app.core.text_filters import backfill_derived_fields, normalize_text, trigrams
+from app.core.versioning import collection_versions
+from app.models.history import ChangeType, HistoryRecord
+from app.models.solution import (
+    SimilarSolutionName,
+    Solution,
+    SolutionCreate,
+    SolutionImportResult,
+    SolutionImportSummary,
+    SolutionInDB,
+    SolutionUpdate,
+)
+from app.services.catalog_service import CATEGORY_USAGE, category_usage_stamps
 from app.services.category_service import CategoryService
 from app.services.history_service import HistoryService
 from app.services.rating_service import RatingService
-from app.services.tag_service import TagService
+from app.services.solution_cache import SOLUTIONS_BULK, solution_cache, solution_version
+from app.services.tag_service import TagService, counted_tags, usage_deltas
 
 VALID_SORT_FIELDS = {"name", "category", "created_at", "updated_at"}
 
+T = TypeVar("T")
+
+# Slug allocations tried before giving up when concurrent writes keep taking the allocated slug
+SLUG_ALLOCATION_ATTEMPTS = 5
+
+DUPLICATE_KEY_ERROR = 11000
+
 
 def generate_slug(name: str) -> str:
     """Generate a URL-friendly slug from solution name
@@ -29,6 +51,40 @@ def generate_slug(name: str) -> str:
     return name_slug
 
 
+def name_search_fields(name: str) -> dict:
+    """Fields stored with a solution name for indexed duplicate and similar name lookups"""
+    return {"name_normalized": normalize_text(name), "name_trigrams": trigrams(name)}
+
+
+def next_free_slug(base_slug: str, taken_slugs: Set[str]) -> str:
+    """Get the first of base_slug, base_slug-1, base_slug-2, ... not in taken_slugs"""
+    slug, counter = base_slug, 1
+    while slug in taken_slugs:
+        slug = f"{base_slug}-{counter}"
+        counter += 1
+    return slug
+
+
+def with_name_search_fields(document: dict) -> dict:
+    """Copy a solution document or $set update with the search fields of the name it sets (if any)"""
+    if "name" not in document:
+        return document
+    return {**document, **name_search_fields(document["name"])}
+
+
+def history_changes(solution: SolutionInDB, update: dict) -> Tuple[dict, dict]:
+    """Get the fields of a $set update that change the solution, and their previous values
+
+    Derived fields (slug, updated_at, updated_by) are not recorded in history.
+    """
+    changes = {
+        field: value
+        for field, value in update.items()
+        if field not in ("slug", "updated_at", "updated_by") and value != getattr(solution, field, None)
+    }
+    return changes, {field: getattr(solution, field, None) for field in changes}
+
+
 class SolutionService:
     def __init__(self):
         self.db = get_database()
@@ -70,21 +126,10 @@ class SolutionService:
             username: The username performing the operation
 
         Returns:
-            List of processed tag names
+            List of processed tag names, without duplicates
         """
-        formatted_tags = []
-        # Get unique tags first
-        unique_tags = list(set(tags))
-        for tag_name in unique_tags:
-            # Create tag if it doesn't exist
-            tag = await self.tag_service.get_tag_by_name(tag_name)
-            if not tag:
-                from app.models.tag import TagCreate
-
-                tag_create = TagCreate(name=tag_name, description=f"Tag for {tag_name}")
-                tag = await self.tag_service.create_tag(tag_create, username)
-            formatted_tags.append(tag.name)
-        return formatted_tags
+        tag_names = await self.tag_service.resolve_tags(tags, username)
+        return list(dict.fromkeys(tag_names[tag_name] for tag_name in tags))
 
     async def _process_solution_update(
         self,
@@ -136,24 +181,97 @@ class SolutionService:
     async def check_name_exists(self, name: str) -> tuple[bool, int]:
         """Check if a solution name exists and count how many solutions have similar names
 
+        Both answers come from a single query on the indexed name_normalized field.
+
         Args:
             name: The solution name to check
 
         Returns:
             A tuple of (exists: bool, count: int) where:
             - exists: True if the exact name exists
-            - count: Number of solutions with similar names (case-insensitive)
+            - count: Number of solutions with similar names (case-insensitive, whitespace-insensitive)
         """
-        # Check for exact match
-        exact_match = await self.collection.find_one({"name": name})
-        exists = exact_match is not None
+        cursor = self.collection.find({"name_normalized": normalize_text(name)}, {"name": 1, "_id": 0})
+        names = [solution["name"] async for solution in cursor]
+        return name in names, len(names)
 
-        # Count similar names (case-insensitive)
-        similar_count = await self.collection.count_documents(
-            {"name": {"$regex": f"^{re.escape(name)}$", "$options": "i"}}
-        )
+    async def find_similar_names(self, name: str, limit: int = 10, threshold: float = 0.3) -> List[SimilarSolutionName]:
+        """Find solutions with a name close to the given one (fuzzy, e.g. for typos)
+
+        Candidates sharing a trigram with the name are found through the
+        multikey index on name_trigrams, then ranked by trigram similarity
+        (shared trigrams / all trigrams of both names).
 
-        return exists, similar_count
+        Args:
+            name: The name to compare with
+            limit: Maximum number of solutions to return
+            threshold: Minimum similarity, between 0 and 1
+
+        Returns:
+            The most similar solutions first
+        """
+        grams = trigrams(name)
+        if not grams:
+            return []
+        pipeline = [
+            {"$match": {"name_trigrams": {"$in": grams}}},
+            {
+                "$project": {
+                    "_id": 0,
+                    "name": 1,
+                    "slug": 1,
+                    "shared": {"$size": {"$filter": {"input": "$name_trigrams", "cond": {"$in": ["$$this", grams]}}}},
+                    "size": {"$size": "$name_trigrams"},
+                }
+            },
+            {
+                "$addFields": {
+                    "similarity": {"$divide": ["$shared", {"$subtract": [{"$add": ["$size", len(grams)]}, "$shared"]}]}
+                }
+            },
+            {"$match": {"similarity": {"$gte": threshold}}},
+            {"$sort": {"similarity": DESCENDING, "name": ASCENDING}},
+            {"$limit": limit},
+        ]
+        return [SimilarSolutionName(**solution) async for solution in self.collection.aggregate(pipeline)]
+
+    async def backfill_name_search_fields(self) -> int:
+        """Store name_normalized and name_trigrams on solutions written before they existed
+
+        Returns:
+            Number of solutions updated
+        """
+        return await backfill_derived_fields(self.collection, "name", name_search_fields)
+
+    async def remove_duplicate_slugs(self) -> int:
+        """Give every solution sharing a slug with an older one a free numbered slug
+
+        Needed before the unique slug index can be built on data written by
+        versions that could allocate one slug twice. The oldest solution keeps
+        the slug, so comments and ratings stored under it stay with it.
+
+        Returns:
+            The number of solutions given a new slug
+        """
+        pipeline = [
+            {"$sort": {"created_at": ASCENDING, "_id": ASCENDING}},
+            {"$group": {"_id": "$slug", "ids": {"$push": "$_id"}, "count": {"$sum": 1}}},
+            {"$match": {"count": {"$gt": 1}}},
+        ]
+        duplicates = {group["_id"]: group["ids"][1:] async for group in self.collection.aggregate(pipeline)}
+        if not duplicates:
+            return 0
+        taken = await self._get_taken_slugs(duplicates)
+        operations = []
+        for base_slug, ids in duplicates.items():
+            for solution_id in ids:
+                slug = next_free_slug(base_slug, taken)
+                taken.add(slug)
+                operations.append(UpdateOne({"_id": solution_id}, {"$set": {"slug": slug}}))
+        result = await self.collection.bulk_write(operations, ordered=False)
+        # Publish the change to the catalog and cached responses
+        await collection_versions.bump("solutions", SOLUTIONS_BULK)
+        return result.modified_count
 
     async def delete_solutions_by_name(self, name: str, username: Optional[str] = None) -> int:
         """Delete all solutions with the exact name (case-sensitive)
@@ -167,12 +285,20 @@ class SolutionService:
         """
         # Get solutions before deleting for history records
         cursor = self.collection.find({"name": name})
-        solutions = [SolutionInDB(**solution) async for solution in cursor]
+        solutions = [SolutionInDB.from_db(solution) async for solution in cursor]
 
         if not solutions:
             return 0
 
         result = await self.collection.delete_many({"name": name})
+        await collection_versions.bump("solutions", SOLUTIONS_BULK, CATEGORY_USAGE)
+        await collection_versions.retire(*{solution_version(solution.slug) for solution in solutions})
+
+        deltas = {}
+        for solution in solutions:
+            for tag_name in counted_tags(solution.tags, solution.review_status):
+                deltas[tag_name] = deltas.get(tag_name, 0) - 1
+        await self.tag_service.adjust_usage_counts(deltas)
 
         # Record history for each deleted solution
         for solution in solutions:
@@ -192,6 +318,11 @@ class SolutionService:
     ) -> List[SolutionInDB]:
         """Update all solutions with the exact name (case-sensitive)
 
+        The update is processed once (category, tags, timestamps) and applied
+        to all solutions with a single bulk write; the results are read back
+        with one query and history is recorded with a single insert. Tag usage
+        counts are adjusted from the state each write replaced.
+
         Args:
             name: The solution name to update
             solution_update: The update data
@@ -201,17 +332,134 @@ class SolutionService:
             List of updated solutions
         """
         # Get all solutions with the same name
-        solutions = []
-        async for solution in self.collection.find({"name": name}):
-            solutions.append(SolutionInDB(**solution))
+        documents = await self.collection.find({"name": name}).to_list(length=None)
+        solutions = [SolutionInDB.from_db(document) for document in documents]
+        if not solutions:
+            return []
 
-        # Update each solution individually
-        updated_solutions = []
-        for solution in solutions:
-            updated = await self.update_solution(solution, solution_update, username)
-            if updated:
-                updated_solutions.append(updated)
+        update_dict = solution_update.model_dump(exclude_unset=True)
 
+        # Process common update operations once for all solutions
+        await self._process_solution_update(update_dict, username)
+
+        # Slugs already matching the new name are kept, the others are assigned in memory
+        slugs = {}
+        base_slug = None
+        if "name" in update_dict:
+            base_slug = generate_slug(update_dict["name"])
+            slug_pattern = re.compile(f"^{re.escape(base_slug)}(-\\d+)?$")
+            taken_slugs = await self._get_taken_slugs([base_slug])
+            for solution in solutions:
+                if solution.slug and slug_pattern.match(solution.slug):
+                    continue
+                slugs[solution.id] = next_free_slug(base_slug, taken_slugs)
+                taken_slugs.add(slugs[solution.id])
+
+        # Solutions without maintainer default to the current user (looked up once)
+        maintainer_fields = ("maintainer_id", "maintainer_name", "maintainer_email")
+        default_maintainer = {}
+        if username and not any(field in update_dict for field in maintainer_fields):
+            if any(not any(getattr(solution, field) for field in maintainer_fields) for solution in solutions):
+                user = await self.db.users.find_one({"username": username})
+                if user:
+                    default_maintainer = {
+                        "maintainer_id": username,
+                        "maintainer_name": user.get("full_name"),
+                        "maintainer_email": user.get("email"),
+                    }
+
+        def changes_for(solution: SolutionInDB) -> dict:
+            solution_update_dict = dict(update_dict)
+            if solution.id in slugs:
+                solution_update_dict["slug"] = slugs[solution.id]
+            if default_maintainer and not any(getattr(solution, field) for field in maintainer_fields):
+                solution_update_dict.update(default_maintainer)
+            return solution_update_dict
+
+        # Mongo stores milliseconds: the stored value identifies the solutions this call wrote
+        update_dict["updated_at"] = update_dict["updated_at"].replace(
+            microsecond=update_dict["updated_at"].microsecond // 1000 * 1000
+        )
+
+        # Each update only applies while the solution still has the tags and review status it was
+        # read with, so usage deltas are computed from the write's pre-image. Solutions changed
+        # concurrently are read again and retried.
+        def counted_state(document: dict) -> dict:
+            # Stored values, as model defaults would not match missing fields
+            return {"tags": document.get("tags"), "review_status": document.get("review_status")}
+
+        pre_images = {solution.id: solution for solution in solutions}
+        filters = {document["_id"]: counted_state(document) for document in documents}
+        pending = dict(pre_images)
+        solution_updates = {}
+        written = set()
+        try:
+            for _ in range(SLUG_ALLOCATION_ATTEMPTS):
+                for solution_id, solution in pending.items():
+                    solution_updates[solution_id] = changes_for(solution)
+                matched_count = await self._bulk_update_with_unique_slugs(
+                    {solution_id: solution_updates[solution_id] for solution_id in pending}, base_slug, filters
+                )
+                if matched_count == len(pending):
+                    written.update(pending)
+                    break
+                # Solutions deleted in the meantime are dropped
+                cursor = self.collection.find({"_id": {"$in": list(pending)}})
+                pending = {}
+                async for solution in cursor:
+                    if solution.get("updated_at") == update_dict["updated_at"]:
+                        written.add(solution["_id"])
+                    else:
+                        pending[solution["_id"]] = pre_images[solution["_id"]] = SolutionInDB.from_db(solution)
+                        filters[solution["_id"]] = counted_state(solution)
+                if not pending:
+                    break
+        finally:
+            # Publish the change to the catalog and cached responses, including partially applied batches
+            await collection_versions.bump("solutions", SOLUTIONS_BULK, *category_usage_stamps(update_dict))
+        written = [solution.id for solution in solutions if solution.id in written]
+        # Slugs the renamed solutions no longer use (solutions keeping theirs get no new slug)
+        await collection_versions.retire(
+            *{
+                solution_version(pre_images[solution_id].slug)
+                for solution_id in written
+                if "slug" in solution_updates[solution_id]
+            }
+        )
+
+        # Read back the written solutions that still exist, in their original order
+        cursor = self.collection.find({"_id": {"$in": written}})
+        updated_by_id = {solution["_id"]: SolutionInDB.from_db(solution) async for solution in cursor}
+        updated_solutions = [updated_by_id[solution_id] for solution_id in written if solution_id in updated_by_id]
+
+        deltas = {}
+        history_records = []
+        for solution_id in written:
+            solution, changes = pre_images[solution_id], solution_updates[solution_id]
+            old_tags = counted_tags(solution.tags, solution.review_status)
+            new_tags = counted_tags(
+                changes.get("tags", solution.tags), changes.get("review_status", solution.review_status)
+            )
+            for tag_name, delta in usage_deltas(old_tags, new_tags).items():
+                deltas[tag_name] = deltas.get(tag_name, 0) + delta
+
+            # Record history only for solutions the update changed
+            changes, old_values = history_changes(solution, changes)
+            if changes:
+                history_records.append(
+                    HistoryRecord.create_record(
+                        object_type="solution",
+                        object_id=str(solution_id),
+                        object_name=changes.get("name", solution.name),
+                        change_type=ChangeType.UPDATE,
+                        username=username or "system",
+                        changes=changes,
+                        old_values=old_values,
+                    )
+                )
+
+        await self.tag_service.adjust_usage_counts(deltas)
+        await self.history_service.create_history_records(history_records)
         return updated_solutions
 
     async def create_solution(self, solution: SolutionCreate, username: Optional[str] = None) -> SolutionInDB:
@@ -219,10 +467,6 @@ class SolutionService:
         solution_dict = solution.model_dump(exclude_unset=True)
         solution_dict["review_status"] = "PENDING"
 
-        # Generate and ensure unique slug
-        base_slug = generate_slug(solution_dict["name"])
-        solution_dict["slug"] = await self.ensure_unique_slug(base_slug)
-
         # Process common solution fields
         await self._process_solution_update(solution_dict, username)
 
@@ -231,7 +475,13 @@ class SolutionService:
         if username:
             solution_dict["created_by"] = username
 
-        result = await self.collection.insert_one(solution_dict)
+        async def insert(slug: str):
+            solution_dict["slug"] = slug
+            return await self.collection.insert_one(with_name_search_fields(solution_dict))
+
+        result = await self._write_with_unique_slug(generate_slug(solution_dict["name"]), insert)
+        # A fresh stamp, also when the slug belonged to a deleted solution
+        await collection_versions.bump("solutions", CATEGORY_USAGE, solution_version(solution_dict["slug"]))
         created_solution = await self.get_solution_by_id(str(result.inserted_id))
 
         # Record history for creation
@@ -248,11 +498,246 @@ class SolutionService:
 
         return created_solution
 
+    async def _get_taken_slugs(self, base_slugs: Iterable[str], exclude_id: Optional[str] = None) -> Set[str]:
+        """Get every existing slug equal to one of the base slugs or to a numbered variant of it
+
+        The patterns are anchored, so the query scans only the matching range of the unique slug index.
+        """
+        patterns = [{"slug": {"$regex": f"^{re.escape(base_slug)}(-\\d+)?$"}} for base_slug in set(base_slugs)]
+        if not patterns:
+            return set()
+        query = {"$or": patterns}
+        if exclude_id:
+            query["_id"] = {"$ne": ObjectId(exclude_id)}
+        cursor = self.collection.find(query, {"slug": 1})
+        return {solution["slug"] async for solution in cursor}
+
+    async def _bulk_update_with_unique_slugs(
+        self,
+        solution_updates: Dict[ObjectId, dict],
+        base_slug: Optional[str] = None,
+        filters: Optional[Dict[ObjectId, dict]] = None,
+    ) -> int:
+        """Apply $set updates to solutions with one bulk write, allocating again the slugs concurrent writes took first
+
+        The unique index on slug makes the conflicting updates fail with duplicate
+        key errors; only those are replayed with newly allocated slugs. The new
+        slugs are stored in solution_updates.
+
+        Args:
+            solution_updates: Changes to set, by solution ID
+            base_slug: Slug generated from the new name, if the updates rename the solutions
+            filters: Extra conditions a solution must still meet to be updated, by solution ID
+
+        Returns:
+            Number of solutions matched by the updates
+        """
+        filters = filters or {}
+        pending = list(solution_updates)
+        matched_count = 0
+        for attempt in range(SLUG_ALLOCATION_ATTEMPTS):
+            operations = [
+                UpdateOne(
+                    {"_id": solution_id, **filters.get(solution_id, {})},
+                    {"$set": with_name_search_fields(solution_updates[solution_id])},
+                )
+                for solution_id in pending
+            ]
+            try:
+                result = await self.collection.bulk_write(operations, ordered=False)
+                return matched_count + result.matched_count
+            except BulkWriteError as e:
+                errors = e.details.get("writeErrors", [])
+                failed = [pending[error["index"]] for error in errors]
+                if (
+                    attempt == SLUG_ALLOCATION_ATTEMPTS - 1
+                    or base_slug is None
+                    or any(error.get("code") != DUPLICATE_KEY_ERROR for error in errors)
+                    or any("slug" not in solution_updates[solution_id] for solution_id in failed)
+                ):
+                    raise
+                matched_count += e.details.get("nMatched", 0)
+            taken_slugs = await self._get_taken_slugs([base_slug])
+            for solution_id in failed:
+                solution_updates[solution_id]["slug"] = next_free_slug(base_slug, taken_slugs)
+                taken_slugs.add(solution_updates[solution_id]["slug"])
+            pending = failed
+        return matched_count
+
+    async def _write_with_unique_slug(
+        self, base_slug: str, write: Callable[[str], Awaitable[T]], exclude_id: Optional[str] = None
+    ) -> T:
+        """Run a write with a free slug, allocating again if a concurrent write took it first
+
+        The unique index on slug makes the losing write fail with a duplicate key error.
+
+        Args:
+            base_slug: Slug generated from the solution name
+            write: Writes the solution with the given slug
+            exclude_id: ID of the solution being renamed (its own slug stays available)
+
+        Returns:
+            The result of the write
+        """
+        for attempt in range(SLUG_ALLOCATION_ATTEMPTS):
+            slug = await self.ensure_unique_slug(base_slug, exclude_id)
+            try:
+                return await write(slug)
+            except DuplicateKeyError:
+                if attempt == SLUG_ALLOCATION_ATTEMPTS - 1:
+                    raise
+
+    async def _bulk_insert_with_unique_slugs(self, documents: List[dict], base_slugs: List[str]) -> Dict[int, str]:
+        """Insert solutions with one bulk write, allocating again the slugs concurrent writes took first
+
+        As in _bulk_update_with_unique_slugs, only the inserts failing with
+        duplicate key errors are replayed with newly allocated slugs. The new
+        slugs are stored in the documents.
+
+        Args:
+            documents: Solutions to insert, with slugs allocated from base_slugs
+            base_slugs: Slug generated from the name of each solution
+
+        Returns:
+            Error messages of the inserts that failed, by position in documents
+        """
+        failures: Dict[int, str] = {}
+        pending = list(range(len(documents)))
+        for attempt in range(SLUG_ALLOCATION_ATTEMPTS):
+            try:
+                await self.collection.bulk_write(
+                    [InsertOne(with_name_search_fields(documents[position])) for position in pending], ordered=False
+                )
+                return failures
+            except BulkWriteError as e:
+                conflicts = []
+                for error in e.details.get("writeErrors", []):
+                    position = pending[error["index"]]
+                    if error.get("code") == DUPLICATE_KEY_ERROR and attempt < SLUG_ALLOCATION_ATTEMPTS - 1:
+                        conflicts.append(position)
+                    else:
+                        failures[position] = error.get("errmsg", "Write failed")
+            if not conflicts:
+                return failures
+            taken_slugs = await self._get_taken_slugs(base_slugs[position] for position in conflicts)
+            for position in conflicts:
+                documents[position]["slug"] = next_free_slug(base_slugs[position], taken_slugs)
+                taken_slugs.add(documents[position]["slug"])
+            pending = conflicts
+        return failures
+
+    async def import_solutions(self, items: List[dict], username: Optional[str] = None) -> SolutionImportSummary:
+        """Create a batch of solutions with a single bulk write
+
+        Items are validated individually, so invalid ones are reported without
+        failing the rest of the batch. Categories and tags of the whole batch are
+        resolved in one pass, slugs are assigned in memory (and allocated again
+        when a concurrent write took one first) and history records are written
+        with a single insert.
+
+        Args:
+            items: Raw solution payloads (SolutionCreate fields)
+            username: The username performing the import
+
+        Returns:
+            Counts and per-item results in batch order
+        """
+        results: List[Optional[SolutionImportResult]] = [None] * len(items)
+        valid: List[Tuple[int, dict]] = []
+        for index, item in enumerate(items):
+            try:
+                solution_dict = SolutionCreate.model_validate(item).model_dump(exclude_unset=True)
+            except ValidationError as e:
+                errors = "; ".join(f"{'.'.join(map(str, error['loc']))}: {error['msg']}" for error in e.errors())
+                results[index] = SolutionImportResult(index=index, success=False, error=errors)
+                continue
+            if "category" in solution_dict:
+                solution_dict["category"] = (solution_dict["category"] or "").strip()
+                if not solution_dict["category"]:
+                    results[index] = SolutionImportResult(
+                        index=index, success=False, error="category: Category name cannot be empty"
+                    )
+                    continue
+            valid.append((index, solution_dict))
+
+        if valid:
+            # Resolve categories and tags for the whole batch at once
+            await self.category_service.ensure_categories(
+                (solution_dict["category"] for _, solution_dict in valid if "category" in solution_dict), username
+            )
+            tag_names = await self.tag_service.resolve_tags(
+                (tag for _, solution_dict in valid for tag in solution_dict.get("tags", [])), username
+            )
+
+            # Assign unique slugs in memory, against the existing ones and within the batch
+            base_slugs = [generate_slug(solution_dict["name"]) for _, solution_dict in valid]
+            taken_slugs = await self._get_taken_slugs(base_slugs)
+
+            now = datetime.utcnow()
+            documents = []
+            for (index, solution_dict), base_slug in zip(valid, base_slugs):
+                slug = next_free_slug(base_slug, taken_slugs)
+                taken_slugs.add(slug)
+
+                if "tags" in solution_dict:
+                    solution_dict["tags"] = list(dict.fromkeys(tag_names[tag] for tag in solution_dict["tags"]))
+                if solution_dict.get("maintainer_id"):
+                    solution_dict["maintainer_id"] = solution_dict["maintainer_id"].lower()
+                solution_dict.update(
+                    {
+                        "_id": ObjectId(),
+                        "slug": slug,
+                        "review_status": "PENDING",
+                        "created_at": now,
+                        "updated_at": now,
+                    }
+                )
+                if username:
+                    solution_dict["created_by"] = username
+                    solution_dict["updated_by"] = username
+                documents.append((index, solution_dict))
+
+            write_errors = await self._bulk_insert_with_unique_slugs(
+                [solution_dict for _, solution_dict in documents], base_slugs
+            )
+
+            history_records = []
+            for position, (index, solution_dict) in enumerate(documents):
+                if position in write_errors:
+                    results[index] = SolutionImportResult(index=index, success=False, error=write_errors[position])
+                    continue
+                results[index] = SolutionImportResult(
+                    index=index, success=True, id=str(solution_dict["_id"]), slug=solution_dict["slug"]
+                )
+                history_records.append(
+                    HistoryRecord.create_record(
+                        object_type="solution",
+                        object_id=str(solution_dict["_id"]),
+                        object_name=solution_dict["name"],
+                        change_type=ChangeType.CREATE,
+                        username=username or "system",
+                        changes=solution_dict,
+                    )
+                )
+
+            if history_records:
+                # Fresh stamps, also for slugs that belonged to deleted solutions
+                inserted_slugs = (
+                    solution_dict["slug"]
+                    for position, (_, solution_dict) in enumerate(documents)
+                    if position not in write_errors
+                )
+                await collection_versions.bump("solutions", CATEGORY_USAGE, *map(solution_version, inserted_slugs))
+                await self.history_service.create_history_records(history_records)
+
+        created = sum(1 for result in results if result.success)
+        return SolutionImportSummary(created=created, failed=len(results) - created, results=results)
+
     async def get_solution_by_id(self, solution_id: str) -> Optional[SolutionInDB]:
-        """Get a solution by ID"""
-        solution = await self.collection.find_one({"_id": ObjectId(solution_id)})
+        """Get a solution by ID (loaded at most once per request)"""
+        solution = await find_one_by(self.collection, "_id", ObjectId(solution_id))
         if solution:
-            return SolutionInDB(**solution)
+            return SolutionInDB.from_db(solution)
         return None
 
     async def get_solutions(
@@ -269,6 +754,34 @@ class SolutionService:
         sort: str = "name",
     ) -> List[SolutionInDB]:
         """Get all solutions with filtering and pagination"""
+        solutions = await self._get_solution_documents(
+            skip=skip,
+            limit=limit,
+            category=category,
+            department=department,
+            team=team,
+            recommend_status=recommend_status,
+            stage=stage,
+            review_status=review_status,
+            tags=tags,
+            sort=sort,
+        )
+        return [SolutionInDB.from_db(solution) for solution in solutions]
+
+    async def _get_solution_documents(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        category: Optional[str] = None,
+        department: Optional[str] = None,
+        team: Optional[str] = None,
+        recommend_status: Optional[str] = None,
+        stage: Optional[str] = None,
+        review_status: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        sort: str = "name",
+    ) -> List[dict]:
+        """Get raw solution documents with filtering and pagination"""
         query = {}
 
         # Add filters if provided
@@ -303,37 +816,28 @@ class SolutionService:
             raise ValueError(f"Invalid sort field: {sort_field}. Valid fields are: {', '.join(VALID_SORT_FIELDS)}")
 
         cursor = self.collection.find(query).sort(sort_field, sort_direction).skip(skip).limit(limit)
-        solutions = await cursor.to_list(length=limit)
-        return [SolutionInDB(**solution) for solution in solutions]
+        return await cursor.to_list(length=limit)
 
     async def get_solution_by_slug(self, slug: str) -> Optional[SolutionInDB]:
-        """Get a solution by slug"""
-        solution = await self.collection.find_one({"slug": slug})
+        """Get a solution by slug (loaded at most once per request)"""
+        solution = await find_one_by(self.collection, "slug", slug)
         if solution:
-            return SolutionInDB(**solution)
+            return SolutionInDB.from_db(solution)
         return None
 
     async def ensure_unique_slug(self, slug: str, exclude_id: Optional[str] = None) -> str:
-        """Ensure the slug is unique by appending a number if necessary"""
-        base_slug = slug
-        counter = 1
-        while True:
-            # Check if slug exists
-            query = {"slug": slug}
-            if exclude_id:
-                query["_id"] = {"$ne": ObjectId(exclude_id)}
-            existing = await self.collection.find_one(query)
-            if not existing:
-                return slug
-            # If exists, append counter and try again
-            slug = f"{base_slug}-{counter}"
-            counter += 1
+        """Ensure the slug is unique by appending a number if necessary
+
+        The taken variants (slug, slug-1, slug-2, ...) are read with a single query.
+        """
+        return next_free_slug(slug, await self._get_taken_slugs([slug], exclude_id))
 
     async def update_solution(
         self,
         existing_solution: SolutionInDB,
         solution_update: SolutionUpdate,
         username: Optional[str] = None,
+        permission_filter: Optional[dict] = None,
     ) -> Optional[SolutionInDB]:
         """Update a solution
 
@@ -341,45 +845,58 @@ class SolutionService:
             existing_solution: The existing solution to update
             solution_update: The update data
             username: The username of the user making the update
+            permission_filter: Extra write filter (see solution_permission_filter), so the
+                update is refused if the user lost the permission since existing_solution was read
 
         Returns:
             Updated solution if successful, None otherwise
         """
         update_dict = solution_update.model_dump(exclude_unset=True)
 
-        # Store original values for history tracking
-        old_values = {field: getattr(existing_solution, field) for field in update_dict.keys()}
-
-        # Handle slug update if name changes
-        if "name" in update_dict:
-            base_slug = generate_slug(update_dict["name"])
-            update_dict["slug"] = await self.ensure_unique_slug(base_slug, str(existing_solution.id))
-
         # Process common update operations
         await self._process_solution_update(update_dict, username, existing_solution)
 
-        result = await self.collection.update_one({"_id": existing_solution.id}, {"$set": update_dict})
-        if result.modified_count:
-            updated_solution = await self.get_solution_by_id(str(existing_solution.id))
-
-            # Record history
-            if updated_solution:
-                # remove field: slug, updated_at, updated_by
-                update_dict.pop("slug", None)
-                update_dict.pop("updated_at", None)
-                update_dict.pop("updated_by", None)
+        async def update(slug: Optional[str] = None) -> Optional[dict]:
+            if slug:
+                update_dict["slug"] = slug
+            # The pre-image is the state the write replaced, which may differ from existing_solution
+            return await self.collection.find_one_and_update(
+                {"_id": existing_solution.id, **(permission_filter or {})},
+                {"$set": with_name_search_fields(update_dict)},
+                return_document=ReturnDocument.BEFORE,
+            )
 
-                # record change if update_dict is not empty
-                if update_dict:
-                    await self.history_service.record_object_change(
-                        object_type="solution",
-                        object_id=str(existing_solution.id),
-                        object_name=updated_solution.name,
-                        change_type=ChangeType.UPDATE,
-                        username=username or "system",
-                        changes=update_dict,
-                        old_values=old_values,
-                    )
+        # Handle slug update if name changes
+        if "name" in update_dict:
+            base_slug = generate_slug(update_dict["name"])
+            result = await self._write_with_unique_slug(base_slug, update, str(existing_solution.id))
+        else:
+            result = await update()
+        if result:
+            previous_solution = SolutionInDB.from_db(result)
+            updated_solution = SolutionInDB.from_db({**result, **with_name_search_fields(update_dict)})
+            await collection_versions.bump(
+                "solutions", *category_usage_stamps(update_dict), solution_version(updated_solution.slug)
+            )
+            # A renamed solution invalidates its old slug too, which is no longer used
+            old_slugs = {existing_solution.slug, previous_solution.slug} - {updated_solution.slug}
+            await collection_versions.retire(*(solution_version(slug) for slug in old_slugs))
+            old_tags = counted_tags(previous_solution.tags, previous_solution.review_status)
+            new_tags = counted_tags(updated_solution.tags, updated_solution.review_status)
+            await self.tag_service.adjust_usage_counts(usage_deltas(old_tags, new_tags))
+
+            # Record history only if the update changed the state it replaced
+            changes, old_values = history_changes(previous_solution, update_dict)
+            if changes:
+                await self.history_service.record_object_change(
+                    object_type="solution",
+                    object_id=str(existing_solution.id),
+                    object_name=updated_solution.name,
+                    change_type=ChangeType.UPDATE,
+                    username=username or "system",
+                    changes=changes,
+                    old_values=old_values,
+                )
 
             return updated_solution
         return None
@@ -403,6 +920,11 @@ class SolutionService:
         result = await self.collection.delete_one({"_id": ObjectId(solution_id)})
 
         if result.deleted_count > 0:
+            await collection_versions.bump("solutions", CATEGORY_USAGE)
+            await collection_versions.retire(solution_version(solution.slug))
+            await self.tag_service.adjust_usage_counts(
+                usage_deltas(counted_tags(solution.tags, solution.review_status), set())
+            )
             # Record deletion in history
             await self.history_service.record_object_change(
                 object_type="solution",
@@ -425,6 +947,11 @@ class SolutionService:
         result = await self.collection.delete_one({"slug": slug})
 
         if result.deleted_count > 0:
+            await collection_versions.bump("solutions", CATEGORY_USAGE)
+            await collection_versions.retire(solution_version(slug))
+            await self.tag_service.adjust_usage_counts(
+                usage_deltas(counted_tags(solution.tags, solution.review_status), set())
+            )
             # Record deletion in history
             await self.history_service.record_object_change(
                 object_type="solution",
@@ -466,7 +993,7 @@ class SolutionService:
         sort: str = "name",
     ) -> List[Solution]:
         """Get solutions with ratings"""
-        solutions = await self.get_solutions(
+        solutions = await self._get_solution_documents(
             skip=skip,
             limit=limit,
             category=category,
@@ -480,40 +1007,32 @@ class SolutionService:
         )
 
         # Convert to Solution model and add ratings
-        result = []
-        for solution_in_db in solutions:
-            # Convert to dict to allow adding rating fields
-            solution_dict = solution_in_db.model_dump()
-            rating_summary = await self.rating_service.get_rating_summary(solution_in_db.slug)
-            solution_dict["rating"] = rating_summary["average"]
-            solution_dict["rating_count"] = rating_summary["count"]
-            result.append(Solution(**solution_dict))
-
-        return result
-
-    async def get_solution_by_id_with_rating(self, solution_id: str) -> Optional[Solution]:
-        """Get a solution by ID with rating"""
-        solution = await self.get_solution_by_id(solution_id)
-        if solution:
-            # Convert to dict to allow adding rating fields
-            solution_dict = solution.model_dump()
-            rating_summary = await self.rating_service.get_rating_summary(solution.slug)
-            solution_dict["rating"] = rating_summary["average"]
-            solution_dict["rating_count"] = rating_summary["count"]
-            return Solution(**solution_dict)
-        return None
+        return [await self._to_solution_with_rating(solution) for solution in solutions]
+
+    async def _to_solution_with_rating(self, solution: dict) -> Solution:
+        """Build a Solution from a raw solution document, adding its rating summary
+
+        Args:
+            solution: The solution document as read from the database
+
+        Returns:
+            Solution model with rating fields populated
+        """
+        rating_summary = await self.rating_service.get_rating_summary(solution["slug"])
+        solution["rating"] = rating_summary["average"]
+        solution["rating_count"] = rating_summary["count"]
+        return Solution.from_db(solution)
 
     async def get_solution_by_slug_with_rating(self, slug: str) -> Optional[Solution]:
-        """Get a solution by slug with rating"""
-        solution = await self.get_solution_by_slug(slug)
-        if solution:
-            # Convert to dict to allow adding rating fields
-            solution_dict = solution.model_dump()
-            rating_summary = await self.rating_service.get_rating_summary(solution.slug)
-            solution_dict["rating"] = rating_summary["average"]
-            solution_dict["rating_count"] = rating_summary["count"]
-            return Solution(**solution_dict)
-        return None
+        """Get a solution by slug with rating (served from the solution cache, do not modify)"""
+
+        async def build() -> Optional[Solution]:
+            solution = await self.collection.find_one({"slug": slug})
+            if solution:
+                return await self._to_solution_with_rating(solution)
+            return None
+
+        return await solution_cache.get_or_build(slug, build)
 
     async def search_solutions(self, keyword: str) -> List[Solution]:
         """Search solutions by keyword using text similarity
@@ -571,10 +1090,7 @@ class SolutionService:
 
         # Add ratings and group by status
         for solution in solutions:
-            rating_summary = await self.rating_service.get_rating_summary(solution["slug"])
-            solution["rating"] = rating_summary["average"]
-            solution["rating_count"] = rating_summary["count"]
-            solution_obj = Solution(**solution)
+            solution_obj = await self._to_solution_with_rating(solution)
 
             # Group by recommendation status
             if solution["recommend_status"] == "ADOPT":
@@ -636,16 +1152,7 @@ class SolutionService:
         solutions = await cursor.to_list(length=limit)
 
         # Convert to Solution model and add ratings
-        result = []
-        for solution in solutions:
-            # Convert to dict to allow adding rating fields
-            solution_dict = solution
-            rating_summary = await self.rating_service.get_rating_summary(solution["slug"])
-            solution_dict["rating"] = rating_summary["average"]
-            solution_dict["rating_count"] = rating_summary["count"]
-            result.append(Solution(**solution_dict))
-
-        return result
+        return [await self._to_solution_with_rating(solution) for solution in solutions]
 
     async def count_user_solutions(self, username: str) -> int:
         """Get total number of solutions created by or maintained by the user"""
@@ -667,3 +1174,10 @@ class SolutionService:
             return True
 
         return solution.created_by == username or solution.maintainer_id == username
+
+    @staticmethod
+    def solution_permission_filter(username: str, is_superuser: bool) -> dict:
+        """Write filter matching the solutions a user may modify (see check_user_solution_permission)"""
+        if is_superuser:
+            return {}
+        return {"$or": [{"created_by": username}, {"maintainer_id": username}]}
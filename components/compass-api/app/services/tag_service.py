@@ -1,19 +1,47 @@
+import logging
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Set
 
 from bson import ObjectId
-from cachetools import TTLCache, keys
+from pymongo import ReturnDocument, UpdateMany, UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError
 
-from app.core.database import get_database
+from app.core.config import settings
+from app.core.database import get_database, transaction
+from app.core.versioning import collection_versions
+from app.models.job import Job
 from app.models.tag import Tag, TagCreate, TagInDB, TagUpdate, format_tag_name
+from app.services.catalog_service import TAG_USAGE, catalog
+from app.services.job_service import JobService, ProgressCallback, job_runner
+from app.services.solution_cache import SOLUTIONS_BULK, solution_version
+
+logger = logging.getLogger(__name__)
+
+DUPLICATE_KEY_ERROR = 11000
+
+
+def counted_tags(tags: Optional[Iterable[str]], review_status: Optional[str]) -> Set[str]:
+    """Tags a solution contributes to usage counts (only approved solutions count)"""
+    return set(tags or []) if review_status == "APPROVED" else set()
+
+
+def usage_deltas(old_tags: Set[str], new_tags: Set[str]) -> Dict[str, int]:
+    """Usage count changes caused by a solution's counted tags going from old_tags to new_tags"""
+    deltas = {name: 1 for name in new_tags - old_tags}
+    deltas.update({name: -1 for name in old_tags - new_tags})
+    return deltas
+
+
+def replace_tag(tags: List[str], source: str, target: Optional[str]) -> List[str]:
+    """Replace every occurrence of source with target (remove it if None), keeping the order and dropping duplicates"""
+    replaced = (target if name == source else name for name in tags)
+    return list(dict.fromkeys(name for name in replaced if name is not None))
 
 
 class TagService:
     def __init__(self):
         self.db = get_database()
         self.collection = self.db.tags
-        # Create a cache with 1-hour TTL
-        self.tags_cache = TTLCache(maxsize=100, ttl=3600)
 
     async def create_tag(self, tag: TagCreate, username: Optional[str] = None) -> TagInDB:
         """Create a new tag"""
@@ -33,10 +61,17 @@ class TagService:
             tag_dict["created_by"] = username
             tag_dict["updated_by"] = username
 
-        result = await self.collection.insert_one(tag_dict)
-        # Clear cache since data has been updated
-        self.tags_cache.clear()
-        return await self.get_tag_by_id(str(result.inserted_id))
+        try:
+            result = await self.collection.insert_one(tag_dict)
+        except DuplicateKeyError:
+            # Created concurrently since the check above (names are unique)
+            raise ValueError(f"Tag '{formatted_name}' already exists")
+        # Solutions may already reference this name
+        await self.refresh_usage_counts([formatted_name])
+        # Publish the change to the catalog and cached responses
+        await collection_versions.bump("tags")
+        tag_dict["_id"] = result.inserted_id
+        return TagInDB(**tag_dict)
 
     async def get_tag_by_id(self, tag_id: str) -> Optional[TagInDB]:
         """Get a tag by ID"""
@@ -52,13 +87,84 @@ class TagService:
         """Get a tag by name (case-insensitive) - internal use only"""
         # Format the name for consistency
         formatted_name = format_tag_name(name)
-        tag = await self.collection.find_one({"name": formatted_name})
+        tag = await catalog.get_tag(formatted_name)
         if tag:
             return TagInDB(**tag)
         return None
 
+    async def resolve_tags(self, names: Iterable[str], username: Optional[str] = None) -> Dict[str, str]:
+        """Resolve several tag names at once, creating the missing tags
+
+        Existing tags are looked up in the catalog and missing ones are created
+        with one ordered batch of upserts. Upserts keyed on the unique
+        tag name make concurrent resolvers converge on the same documents
+        instead of inserting duplicates.
+
+        Args:
+            names: Tag names as provided by the client
+            username: The username performing the operation
+
+        Returns:
+            A mapping from each provided name to its formatted tag name
+        """
+        formatted = {name: format_tag_name(name) for name in set(names)}
+        if not formatted:
+            return {}
+
+        wanted = set(formatted.values())
+        existing = {tag["name"] for tag in await catalog.get_tags_by_names(wanted)}
+
+        missing = sorted(wanted - existing)
+        if missing:
+            # Describe new tags by the name the client used, like create_tag callers do
+            original_names = {}
+            for name in sorted(formatted):
+                original_names.setdefault(formatted[name], name)
+
+            now = datetime.utcnow()
+            operations = []
+            for name in missing:
+                tag_dict = TagCreate(name=name, description=f"Tag for {original_names[name]}").model_dump()
+                tag_dict.update({"created_at": now, "updated_at": now, "usage_count": 0})
+                if username:
+                    tag_dict.update({"created_by": username, "updated_by": username})
+                del tag_dict["name"]
+                operations.append(UpdateOne({"name": name}, {"$setOnInsert": tag_dict}, upsert=True))
+
+            upserted_count = await self._upsert_tags(operations)
+            if upserted_count:
+                # Publish the change to the catalog and cached responses
+                await collection_versions.bump("tags")
+
+        return formatted
+
+    async def _upsert_tags(self, operations: List[UpdateOne], attempts: int = 3) -> int:
+        """Run a batch of tag upserts, retrying when a concurrent writer won the race
+
+        Two upserts of the same new name can both miss and race to insert; the
+        loser fails with a duplicate key error. The batch is idempotent, so it is
+        simply replayed and the retry matches the winner's document.
+
+        Returns:
+            The number of tags created by this call
+        """
+        upserted_count = 0
+        for attempt in range(attempts):
+            try:
+                result = await self.collection.bulk_write(operations, ordered=True)
+                return upserted_count + result.upserted_count
+            except BulkWriteError as e:
+                errors = e.details.get("writeErrors", [])
+                if attempt == attempts - 1 or any(error.get("code") != DUPLICATE_KEY_ERROR for error in errors):
+                    raise
+                upserted_count += e.details.get("nUpserted", 0)
+        return upserted_count
+
     async def get_tag_usage_counts(self, tag_names: List[str] = None) -> dict:
-        """Get usage counts for multiple tags in a single query
+        """Count tag usage from the solutions in a single aggregation
+
+        Only used to (re)compute the usage_count stored on tag documents;
+        read paths use the stored counts.
 
         Args:
             tag_names: Optional list of tag names to get counts for. If None, gets counts for all tags.
@@ -83,6 +189,53 @@ class TagService:
         # Convert to dictionary
         return {doc["_id"]: doc["count"] for doc in results}
 
+    async def adjust_usage_counts(self, deltas: Dict[str, int]) -> None:
+        """Apply usage count changes to the stored tag documents
+
+        Args:
+            deltas: Mapping from tag name to the change of its usage count
+        """
+        operations = [
+            UpdateOne({"name": name}, {"$inc": {"usage_count": delta}}) for name, delta in deltas.items() if delta
+        ]
+        if not operations:
+            return
+        await self.collection.bulk_write(operations, ordered=False)
+        # Publish the change to the catalog and cached responses
+        await collection_versions.bump(TAG_USAGE)
+
+    async def refresh_usage_counts(self, tag_names: List[str]) -> None:
+        """Recompute the stored usage counts of the given tags from the solutions"""
+        if not tag_names:
+            return
+        usage_counts = await self.get_tag_usage_counts(tag_names)
+        operations = [
+            UpdateOne({"name": name}, {"$set": {"usage_count": usage_counts.get(name, 0)}}) for name in tag_names
+        ]
+        await self.collection.bulk_write(operations, ordered=False)
+        # Publish the change to the catalog and cached responses
+        await collection_versions.bump(TAG_USAGE)
+
+    async def rebuild_usage_counts(self) -> int:
+        """Recompute every stored usage count from the solutions
+
+        Returns:
+            Number of tags whose stored count was corrected
+        """
+        usage_counts = await self.get_tag_usage_counts()
+        operations = [
+            UpdateOne({"name": name, "usage_count": {"$ne": count}}, {"$set": {"usage_count": count}})
+            for name, count in usage_counts.items()
+        ]
+        operations.append(
+            UpdateMany({"name": {"$nin": list(usage_counts)}, "usage_count": {"$ne": 0}}, {"$set": {"usage_count": 0}})
+        )
+        result = await self.collection.bulk_write(operations, ordered=False)
+        if result.modified_count:
+            # Publish the change to the catalog and cached responses
+            await collection_versions.bump(TAG_USAGE)
+        return result.modified_count
+
     async def get_tags(self, skip: int = 0, limit: int = 100, show_all: bool = False) -> List[Tag]:
         """Get all tags with pagination
         Args:
@@ -90,66 +243,117 @@ class TagService:
             limit: Maximum number of items to return
             show_all: If True, return all tags; if False, only return tags with usage_count > 0
         """
-        # Generate cache key
-        cache_key = keys.hashkey(skip, limit, show_all)
-
-        # Try to get data from cache
-        if cache_key in self.tags_cache:
-            return self.tags_cache[cache_key]
-
-        # Get all tags first
-        cursor = self.collection.find().sort("name", 1).skip(skip).limit(limit)
-        tags = await cursor.to_list(length=limit)
-
-        if not tags:
-            return []
-
-        # Get usage counts for all tags in a single query
-        tag_names = [tag["name"] for tag in tags]
-        usage_counts = await self.get_tag_usage_counts(tag_names)
-
-        # Convert to Tag models with usage counts
-        result = []
-        for tag in tags:
-            tag_model = TagInDB(**tag)
-            usage_count = usage_counts.get(tag_model.name, 0)
-
-            # Only include tags with usage_count > 0 if show_all is False
-            if show_all or usage_count > 0:
-                tag_dict = tag_model.model_dump()
-                tag_dict["usage_count"] = usage_count
-                result.append(Tag(**tag_dict))
-
-        # Store result in cache
-        self.tags_cache[cache_key] = result
-        return result
+        tags = await catalog.list_tags(show_all=show_all)
+        return [Tag.from_db(tag) for tag in tags[skip : skip + limit]]
 
     async def get_tag_with_usage(self, tag: TagInDB) -> Tag:
         """Convert TagInDB to Tag with usage count"""
         tag_dict = tag.model_dump()
-        usage_counts = await self.get_tag_usage_counts([tag.name])
-        tag_dict["usage_count"] = usage_counts.get(tag.name, 0)
+        stored = await catalog.get_tag(tag.name)
+        tag_dict["usage_count"] = stored.get("usage_count", 0) if stored else 0
         return Tag(**tag_dict)
 
-    async def get_tag_usage_count(self, name: str) -> int:
-        """Get the number of solutions using this tag"""
-        return await self.db.solutions.count_documents({"tags": name, "review_status": "APPROVED"})
+    async def replace_solution_tag(
+        self,
+        source: str,
+        target: Optional[str],
+        username: Optional[str] = None,
+        progress: Optional[ProgressCallback] = None,
+    ) -> int:
+        """Replace a tag with another one, or remove it, in every solution using it
+
+        Solutions are rewritten in batches of JOB_BATCH_SIZE, one
+        bulk_write per batch and a single update per solution. Each batch runs
+        in its own transaction when the deployment supports it (none is held
+        open across batches or progress pauses), so an interrupted run leaves
+        only finished batches behind and a new run picks up the solutions
+        still using the tag. An update only applies while the solution's tags
+        are the ones that were read, so a solution changed concurrently keeps
+        matching and is picked up again by a following batch.
+
+        Args:
+            source: Name of the tag to replace
+            target: Name of the replacement tag, None to remove the tag
+            username: Username performing the change
+            progress: Awaited with (processed, total) after each batch
+
+        Returns:
+            The number of solutions updated
+        """
+        if source == target:
+            return 0
+        total = await self.db.solutions.count_documents({"tags": source})
+        processed = 0
+        while True:
+            async with transaction() as session:
+                cursor = self.db.solutions.find({"tags": source}, {"tags": 1}, session=session)
+                solutions = await cursor.limit(settings.JOB_BATCH_SIZE).to_list(None)
+                if not solutions:
+                    break
+                updated_at = datetime.utcnow()
+                operations = [
+                    UpdateOne(
+                        {"_id": solution["_id"], "tags": solution["tags"]},
+                        {
+                            "$set": {
+                                "tags": replace_tag(solution["tags"], source, target),
+                                "updated_at": updated_at,
+                                "updated_by": username if username else "system",
+                            }
+                        },
+                    )
+                    for solution in solutions
+                ]
+                result = await self.db.solutions.bulk_write(operations, ordered=False, session=session)
+            processed += result.modified_count
+            change = f"Replaced tag {source!r} with {target!r}" if target else f"Removed tag {source!r}"
+            logger.info(f"{change} in {processed}/{total} solutions")
+            if progress:
+                await progress(processed, max(total, processed))
+        return processed
+
+    async def _replace_and_delete_tag(
+        self,
+        tag: TagInDB,
+        target: Optional[str],
+        username: Optional[str] = None,
+        progress: Optional[ProgressCallback] = None,
+    ) -> bool:
+        """Replace (or remove) a tag in every solution, then delete it once no solution references it
+
+        Solutions tagged concurrently while the batches ran are rewritten by
+        another pass before the tag document is deleted.
+
+        Returns:
+            True if the tag document was deleted by this call
+        """
+        while True:
+            await self.replace_solution_tag(tag.name, target, username, progress)
+            if not await self.db.solutions.find_one({"tags": tag.name}, {"_id": 1}):
+                result = await self.collection.delete_one({"_id": tag.id})
+                return result.deleted_count > 0
 
     async def merge_tags(
-        self, source_tag_id: str, target_tag_name: str, username: Optional[str] = None
+        self,
+        source_tag_id: str,
+        target_tag_name: str,
+        username: Optional[str] = None,
+        progress: Optional[ProgressCallback] = None,
     ) -> Optional[TagInDB]:
         """Merge source tag into target tag.
 
         This will:
-        1. Find all solutions using the source tag
-        2. Add the target tag to these solutions
-        3. Remove the source tag from these solutions
-        4. Delete the source tag
+        1. Replace the source tag with the target tag in all solutions using it
+        2. Delete the source tag, once no solution references it
+
+        Solutions are rewritten batch by batch, so an interrupted merge is
+        resumed by running it again.
 
         Args:
             source_tag_id: ID of the tag to be merged and deleted
             target_tag_name: Name of the tag to merge into
             username: Username performing the merge operation
+            progress: Awaited with (processed, total) after each batch of solutions
 
         Returns:
             The target tag if successful, None if either tag not found
@@ -164,42 +368,49 @@ class TagService:
             target_tag = await self.get_tag_by_name(target_tag_name)
             if not target_tag:
                 return None
+            if source_tag.id == target_tag.id:
+                return target_tag
 
-            # Update all solutions that use the source tag
-            # First add the target tag to all solutions using source tag
-            await self.db.solutions.update_many(
-                {"tags": source_tag.name},
-                {
-                    "$addToSet": {"tags": target_tag.name},
-                    "$set": {
-                        "updated_at": datetime.utcnow(),
-                        "updated_by": username if username else "system",
-                    },
-                },
-            )
-
-            # Then remove the source tag
-            await self.db.solutions.update_many({"tags": source_tag.name}, {"$pull": {"tags": source_tag.name}})
+            await self._replace_and_delete_tag(source_tag, target_tag.name, username, progress)
+            await self.refresh_usage_counts([target_tag.name])
 
-            # Delete the source tag
-            await self.collection.delete_one({"_id": ObjectId(source_tag_id)})
-
-            # Clear cache since data has been updated
-            self.tags_cache.clear()
+            # Publish the change to the catalog and cached responses
+            await collection_versions.bump("tags", "solutions", SOLUTIONS_BULK)
 
             # Return the target tag
             return target_tag
         except Exception as e:
             raise ValueError(f"Error merging tags: {str(e)}")
 
+    async def enqueue_merge_tags(
+        self, source_tag_id: str, target_tag_name: str, username: Optional[str] = None
+    ) -> Optional[Job]:
+        """Merge source tag into target tag in a background job (see merge_tags)
+
+        Returns:
+            The enqueued job, None if either tag not found
+        """
+        source_tag = await self.get_tag_by_id(source_tag_id)
+        target_tag = await self.get_tag_by_name(target_tag_name)
+        if not source_tag or not target_tag:
+            return None
+        params = {"source_tag_id": source_tag_id, "target_tag_name": target_tag.name, "username": username}
+        return await JobService().enqueue("merge_tags", params, username)
+
     async def update_tag(
         self,
         tag_id: str,
         tag_update: TagUpdate,
         username: Optional[str] = None,
         update_solutions: bool = False,
+        progress: Optional[ProgressCallback] = None,
     ) -> Optional[TagInDB]:
-        """Update a tag by ID. Optionally update all solutions using this tag."""
+        """Update a tag by ID. Optionally update all solutions using this tag.
+
+        On a rename, the solutions are rewritten first (batch by batch) and the
+        tag document is renamed last. If the new name was created meanwhile
+        (e.g. by a solution edit using it), the tag is merged into it instead.
+        """
         try:
             # Get the tag first
             tag = await self.get_tag_by_id(tag_id)
@@ -207,47 +418,87 @@ class TagService:
                 return None
 
             update_dict = tag_update.model_dump(exclude_unset=True)
+            renamed = "name" in update_dict and update_dict["name"] != tag.name
 
             # If name is changing
-            if "name" in update_dict and update_dict["name"] != tag.name:
+            if renamed:
                 # Check if target name already exists
                 existing_tag = await self.get_tag_by_name(update_dict["name"])
                 if existing_tag:
                     # If target tag exists, merge this tag into it
-                    return await self.merge_tags(tag_id, existing_tag.name, username)
-                elif update_solutions:
-                    # If target tag doesn't exist and we need to update solutions
-                    await self.db.solutions.update_many(
-                        {"tags": tag.name},
-                        {
-                            "$set": {
-                                "tags.$": update_dict["name"],
-                                "updated_at": datetime.utcnow(),
-                                "updated_by": username if username else "system",
-                            }
-                        },
-                    )
+                    return await self.merge_tags(tag_id, existing_tag.name, username, progress)
 
             # Update the tag itself
             update_dict["updated_at"] = datetime.utcnow()
             if username:
                 update_dict["updated_by"] = username
 
-            result = await self.collection.update_one({"_id": ObjectId(tag_id)}, {"$set": update_dict})
-            # Clear cache since data has been updated
-            self.tags_cache.clear()
-            if result.modified_count:
-                return await self.get_tag_by_id(tag_id)
+            if renamed and update_solutions:
+                await self.replace_solution_tag(tag.name, update_dict["name"], username, progress)
+            try:
+                result = await self.collection.find_one_and_update(
+                    {"_id": ObjectId(tag_id)}, {"$set": update_dict}, return_document=ReturnDocument.AFTER
+                )
+            except DuplicateKeyError:
+                # The new name was created since the check above (names are unique)
+                return await self.merge_tags(tag_id, update_dict["name"], username, progress)
+            if renamed:
+                # The renamed tag now counts the solutions that reference the new name
+                await self.refresh_usage_counts([update_dict["name"]])
+            # Publish the change to the catalog and cached responses
+            if renamed and update_solutions:
+                await collection_versions.bump("tags", "solutions", SOLUTIONS_BULK)
+            else:
+                await collection_versions.bump("tags")
+            if result:
+                return TagInDB(**result)
             return None
         except Exception as e:
             raise ValueError(f"Error updating tag: {str(e)}")
 
-    async def delete_tag(self, tag_id: str) -> bool:
-        """Delete a tag by ID and remove it from all solutions using it."""
+    async def enqueue_rename_tag(
+        self, tag_id: str, tag_update: TagUpdate, username: Optional[str] = None
+    ) -> Optional[Job]:
+        """Rename a tag used by solutions in a background job (see update_tag)
+
+        Returns:
+            The enqueued job, None if the tag is not found, keeps its name or no solution uses it
+        """
+        if not ObjectId.is_valid(tag_id):
+            raise ValueError(f"Invalid tag ID format: {tag_id}")
+        tag = await self.get_tag_by_id(tag_id)
+        if not tag or tag.name == tag_update.name:
+            return None
+        if not await self.db.solutions.find_one({"tags": tag.name}, {"_id": 1}):
+            return None
+        params = {"tag_id": tag_id, "update": tag_update.model_dump(exclude_unset=True), "username": username}
+        return await JobService().enqueue("rename_tag", params, username)
+
+    async def enqueue_delete_tag(self, tag_id: str, username: Optional[str] = None) -> Optional[Job]:
+        """Delete a tag in a background job (see delete_tag)
+
+        Returns:
+            The enqueued job, None if the tag is not found
+        """
+        if not ObjectId.is_valid(tag_id):
+            raise ValueError(f"Invalid tag ID format: {tag_id}")
+        tag = await self.get_tag_by_id(tag_id)
+        if not tag:
+            return None
+        return await JobService().enqueue("delete_tag", {"tag_id": tag_id, "username": username}, username)
+
+    async def delete_tag(
+        self, tag_id: str, username: Optional[str] = None, progress: Optional[ProgressCallback] = None
+    ) -> bool:
+        """Delete a tag by ID and remove it from all solutions using it.
+
+        The tag is removed from the solutions first, so an interrupted deletion
+        can simply be run again.
+        """
         try:
             # Validate tag_id format
             try:
-                object_id = ObjectId(tag_id)
+                ObjectId(tag_id)
             except Exception:
                 raise ValueError(f"Invalid tag ID format: {tag_id}")
 
@@ -256,20 +507,11 @@ class TagService:
             if not tag:
                 return False
 
-            # Remove tag from all solutions that use it
-            await self.db.solutions.update_many(
-                {"tags": tag.name},
-                {
-                    "$pull": {"tags": tag.name},
-                    "$set": {"updated_at": datetime.utcnow(), "updated_by": "system"},
-                },
-            )
-
-            # Delete the tag
-            result = await self.collection.delete_one({"_id": object_id})
-            # Clear cache since data has been updated
-            self.tags_cache.clear()
-            return result.deleted_count > 0
+            # Remove tag from all solutions that use it, then delete it
+            deleted = await self._replace_and_delete_tag(tag, None, username, progress)
+            # Publish the change to the catalog and cached responses
+            await collection_versions.bump("tags", "solutions", SOLUTIONS_BULK)
+            return deleted
         except ValueError as e:
             raise e
         except Exception as e:
@@ -285,24 +527,7 @@ class TagService:
         if not solution or not solution.get("tags"):
             return []
 
-        # Get all tags in a single query
-        tags = await self.collection.find({"name": {"$in": solution["tags"]}}).to_list(length=None)
-        if not tags:
-            return []
-
-        # Get usage counts for these tags in a single query
-        tag_names = [tag["name"] for tag in tags]
-        usage_counts = await self.get_tag_usage_counts(tag_names)
-
-        # Convert to Tag models with usage counts
-        result = []
-        for tag in tags:
-            tag_model = TagInDB(**tag)
-            tag_dict = tag_model.model_dump()
-            tag_dict["usage_count"] = usage_counts.get(tag_model.name, 0)
-            result.append(Tag(**tag_dict))
-
-        return result
+        return [Tag.from_db(tag) for tag in await catalog.get_tags_by_names(solution["tags"])]
 
     async def add_solution_tag_by_name(self, solution_slug: str, name: str) -> bool:
         """Add a tag to a solution by solution slug and tag name"""
@@ -320,6 +545,11 @@ class TagService:
             return False
 
         result = await self.db.solutions.update_one({"slug": solution_slug}, {"$addToSet": {"tags": formatted_name}})
+        if result.modified_count:
+            await collection_versions.bump("solutions", solution_version(solution_slug))
+            tags, review_status = solution.get("tags", []), solution.get("review_status")
+            new_tags = counted_tags([*tags, formatted_name], review_status)
+            await self.adjust_usage_counts(usage_deltas(counted_tags(tags, review_status), new_tags))
         return result.modified_count > 0
 
     async def remove_solution_tag_by_name(self, solution_slug: str, name: str) -> bool:
@@ -338,6 +568,11 @@ class TagService:
             return False
 
         result = await self.db.solutions.update_one({"slug": solution_slug}, {"$pull": {"tags": formatted_name}})
+        if result.modified_count:
+            await collection_versions.bump("solutions", solution_version(solution_slug))
+            tags, review_status = solution.get("tags", []), solution.get("review_status")
+            new_tags = counted_tags([tag for tag in tags if tag != formatted_name], review_status)
+            await self.adjust_usage_counts(usage_deltas(counted_tags(tags, review_status), new_tags))
         return result.modified_count > 0
 
     async def count_tags(self, show_all: bool = False) -> int:
@@ -345,18 +580,27 @@ class TagService:
         Args:
             show_all: If True, count all tags; if False, only count tags with usage_count > 0
         """
-        if show_all:
-            return await self.collection.count_documents({})
+        return len(await catalog.list_tags(show_all=show_all))
 
-        # Get all tag names
-        cursor = self.collection.find({}, {"name": 1})
-        tag_names = [doc["name"] async for doc in cursor]
 
-        if not tag_names:
-            return 0
+@job_runner.handler("delete_tag")
+async def run_delete_tag_job(params: Dict[str, Any], progress: ProgressCallback) -> Dict[str, Any]:
+    deleted = await TagService().delete_tag(params["tag_id"], params.get("username"), progress)
+    return {"deleted": deleted}
+
+
+@job_runner.handler("rename_tag")
+async def run_rename_tag_job(params: Dict[str, Any], progress: ProgressCallback) -> Dict[str, Any]:
+    tag = await TagService().update_tag(
+        params["tag_id"], TagUpdate(**params["update"]), params.get("username"), True, progress
+    )
+    return {"renamed": tag is not None}
 
-        # Get usage counts in a single query
-        usage_counts = await self.get_tag_usage_counts(tag_names)
 
-        # Count tags with usage > 0
-        return len([count for count in usage_counts.values() if count > 0])
+@job_runner.handler("merge_tags")
+async def run_merge_tags_job(params: Dict[str, Any], progress: ProgressCallback) -> Dict[str, Any]:
+    # A resumed job whose source tag is already gone has nothing left to do
+    target_tag = await TagService().merge_tags(
+        params["source_tag_id"], params["target_tag_name"], params.get("username"), progress
+    )
+    return {"merged": target_tag is not None}
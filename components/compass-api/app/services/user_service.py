@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 import httpx
 from cachetools import TTLCache, keys
@@ -8,6 +8,7 @@ from fastapi import HTTPException, status
 from app.core.config import settings
 from app.core.mongodb import get_database
 from app.core.password import get_password_hash, verify_password
+from app.core.text_filters import MatchMode, text_filter
 from app.models.user import User, UserCreate, UserInDB, UserPasswordUpdate, UserUpdate
 
 
@@ -108,15 +109,17 @@ class UserService:
         username: Optional[str] = None,
         is_active: Optional[bool] = None,
         is_superuser: Optional[bool] = None,
+        username_match: MatchMode = "prefix",
     ) -> list[User]:
         """Get all users with pagination and filtering.
 
         Args:
             skip: Number of records to skip
             limit: Maximum number of records to return
-            username: Optional filter by username (case-insensitive partial match)
+            username: Optional filter by username (case-insensitive)
             is_active: Optional filter by active status
             is_superuser: Optional filter by superuser status
+            username_match: How username matches: exact, prefix or contains (substring, not index-backed)
 
         Returns:
             List of matching users
@@ -124,7 +127,7 @@ class UserService:
         # Build query
         query = {}
         if username:
-            query["username"] = {"$regex": username, "$options": "i"}
+            query["username"] = text_filter(username, username_match)
         if is_active is not None:
             query["is_active"] = is_active
         if is_superuser is not None:
@@ -291,20 +294,22 @@ class UserService:
         username: Optional[str] = None,
         is_active: Optional[bool] = None,
         is_superuser: Optional[bool] = None,
+        username_match: MatchMode = "prefix",
     ) -> int:
         """Get total number of users matching the filter criteria.
 
         Args:
-            username: Optional filter by username (case-insensitive partial match)
+            username: Optional filter by username (case-insensitive)
             is_active: Optional filter by active status
             is_superuser: Optional filter by superuser status
+            username_match: How username matches: exact, prefix or contains (substring, not index-backed)
 
         Returns:
             Total number of matching users
         """
         query = {}
         if username:
-            query["username"] = {"$regex": username, "$options": "i"}
+            query["username"] = text_filter(username, username_match)
         if is_active is not None:
             query["is_active"] = is_active
         if is_superuser is not None:
@@ -319,6 +324,20 @@ class UserService:
             return {"username": username, "full_name": user["full_name"]}
         return None
 
+    async def get_user_infos(self, usernames: Iterable[str]) -> Dict[str, dict]:
+        """Get basic user info (see get_user_info) for several users in a single query
+
+        Returns:
+            A mapping from username to user info, unknown usernames are left out
+        """
+        usernames = list(set(usernames))
+        if not usernames:
+            return {}
+        cursor = self.collection.find({"username": {"$in": usernames}}, {"username": 1, "full_name": 1})
+        return {
+            user["username"]: {"username": user["username"], "full_name": user["full_name"]} async for user in cursor
+        }
+
     async def get_users_by_usernames(self, usernames: List[str]) -> List[User]:
         """Get multiple users by their usernames.
 
@@ -6,8 +6,17 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import RedirectResponse
 
+from app.core.compression import CompressionMiddleware
+from app.core.config import settings
+from app.core.identity_map import IdentityMapMiddleware
+from app.core.indexes import ensure_indexes
 from app.core.mongodb import connect_to_mongo, close_mongo_connection
+from app.core.responses import FastJSONResponse
 from app.routers import api_router
+from app.services.catalog_service import catalog
+from app.services.history_service import HistoryService
+from app.services.job_service import job_runner
+from app.services.solution_service import SolutionService
 from app.services.user_service import UserService
 
 # Configure logging
@@ -21,6 +30,27 @@ logger = logging.getLogger(__name__)
 async def lifespan(app: FastAPI):
     # Startup
     await connect_to_mongo()
+    await ensure_indexes()
+
+    # Normalize object names of history records written before filters used them
+    try:
+        updated = await HistoryService().backfill_normalized_names()
+        logger.info(f"History object names checked, {updated} normalized")
+    except Exception as e:
+        logger.error(f"Error normalizing history object names: {e}")
+
+    # Store search fields of solution names written before duplicate name checks used them
+    try:
+        updated = await SolutionService().backfill_name_search_fields()
+        logger.info(f"Solution names checked, {updated} indexed")
+    except Exception as e:
+        logger.error(f"Error indexing solution names: {e}")
+
+    # Load tags and categories into the in-memory catalog
+    await catalog.load()
+
+    # Run background jobs, resuming the ones interrupted by a previous shutdown
+    await job_runner.start()
     
     # Ensure default admin exists
     user_service = UserService()
@@ -32,13 +62,15 @@ async def lifespan(app: FastAPI):
     
     yield
     # Shutdown
+    await job_runner.stop()
     await close_mongo_connection()
 
 app = FastAPI(
     title="Tech Compass API",
     description="API for Tech Compass",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse,
 )
 
 # CORS middleware
@@ -50,6 +82,12 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compression middleware (gzip/brotli negotiated via Accept-Encoding)
+app.add_middleware(CompressionMiddleware, minimum_size=settings.COMPRESSION_MINIMUM_SIZE)
+
+# Request-scoped identity map (each document is loaded at most once per request)
+app.add_middleware(IdentityMapMiddleware)
+
 @app.get("/", include_in_schema=False)
 async def root():
     """Redirect root path to API documentation"""
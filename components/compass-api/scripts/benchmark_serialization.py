@@ -0,0 +1,120 @@
+"""
+Microbenchmark for solution list serialization.
+Compares, for a page of solutions:
+1. The validated path: SolutionInDB(**doc) -> model_dump -> Solution(**dict),
+   then FastAPI response_model validation and JSONResponse rendering
+2. The fast path: Solution.from_db(doc), rendered directly by FastJSONResponse
+
+Run from the compass-api directory:
+    python scripts/benchmark_serialization.py [page_size] [iterations]
+"""
+
+import asyncio
+import os
+import sys
+import time
+from datetime import datetime
+from typing import List
+
+from bson import ObjectId
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.responses import FastJSONResponse  # noqa: E402
+from app.models.response import StandardResponse  # noqa: E402
+from app.models.solution import Solution, SolutionInDB  # noqa: E402
+
+
+def make_documents(count: int) -> List[dict]:
+    """Build solution documents shaped like the ones stored in MongoDB."""
+    now = datetime.utcnow()
+    return [
+        {
+            "_id": ObjectId(),
+            "name": f"Solution {i}",
+            "slug": f"solution-{i}",
+            "description": "A fairly long description of the solution. " * 10,
+            "brief": "Short brief of the solution",
+            "logo": "",
+            "category": "Infrastructure",
+            "department": "Platform",
+            "team": "Core",
+            "team_email": "core@example.com",
+            "maintainer_id": "jdoe",
+            "maintainer_name": "John Doe",
+            "maintainer_email": "jdoe@example.com",
+            "official_website": "https://example.com",
+            "documentation_url": "https://example.com/docs",
+            "demo_url": None,
+            "version": "1.0.0",
+            "adoption_level": "TEAM",
+            "adoption_user_count": 42,
+            "tags": ["container", "orchestration", "cloud-native"],
+            "pros": ["Fast", "Reliable"],
+            "cons": ["Complex"],
+            "stage": "PRODUCTION",
+            "recommend_status": "ADOPT",
+            "review_status": "APPROVED",
+            "created_at": now,
+            "created_by": "jdoe",
+            "updated_at": now,
+            "updated_by": "jdoe",
+        }
+        for i in range(count)
+    ]
+
+
+async def validated_path(documents: List[dict], field) -> bytes:
+    """Previous list path: validate twice, then let FastAPI validate and encode the response."""
+    solutions = []
+    for document in documents:
+        solution_dict = SolutionInDB(**document).model_dump()
+        solution_dict["rating"] = 4.2
+        solution_dict["rating_count"] = 10
+        solutions.append(Solution(**solution_dict))
+    content = StandardResponse.paginated(data=solutions, total=len(solutions), skip=0, limit=len(solutions))
+    serialized = await serialize_response(field=field, response_content=content, is_coroutine=True)
+    return JSONResponse(serialized).body
+
+
+async def fast_path(documents: List[dict]) -> bytes:
+    """Current list path: construct from trusted documents and render with orjson."""
+    solutions = [Solution.from_db({**document, "rating": 4.2, "rating_count": 10}) for document in documents]
+    content = StandardResponse.paginated(data=solutions, total=len(solutions), skip=0, limit=len(solutions))
+    return FastJSONResponse(content).body
+
+
+async def measure(label: str, func, iterations: int) -> float:
+    """Run func the given number of times and print the mean time per call."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await func()
+    elapsed = (time.perf_counter() - start) / iterations
+    print(f"{label:<12} {elapsed * 1000:8.3f} ms per page")
+    return elapsed
+
+
+async def main():
+    page_size = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+
+    field = create_response_field(name="Response_get_solutions", type_=StandardResponse[List[Solution]])
+
+    validated_documents = make_documents(page_size)
+    fast_documents = make_documents(page_size)
+
+    # Warm up both paths so schema building is not measured
+    await validated_path(validated_documents, field)
+    await fast_path(fast_documents)
+
+    print(f"Serializing {page_size} solutions, {iterations} iterations")
+    validated = await measure("validated", lambda: validated_path(validated_documents, field), iterations)
+    fast = await measure("fast path", lambda: fast_path(fast_documents), iterations)
+    print(f"Speedup: {validated / fast:.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -10,7 +10,7 @@ This script will:
 import os
 import random
 import traceback
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 from urllib.parse import urlencode
 
 import faker
@@ -102,8 +102,8 @@ class TestDataGenerator:
         self.token = token
         return token
 
-    def create_solution(self) -> Dict:
-        """Create a new solution through the API."""
+    def build_solution_data(self) -> Dict:
+        """Build the payload of a new solution, making sure its category exists."""
         stages = ["DEVELOPING", "UAT", "PRODUCTION", "DEPRECATED", "RETIRED"]
         recommend_statuses = ["ADOPT", "TRIAL", "ASSESS", "HOLD"]
         adoption_levels = ["PILOT", "TEAM", "DEPARTMENT", "ENTERPRISE", "INDUSTRY"]
@@ -213,13 +213,25 @@ class TestDataGenerator:
             "stage": random.choice(stages),
             "recommend_status": random.choice(recommend_statuses),
         }
+        return solution_data
+
+    def create_solutions(self, count: int) -> List[Dict]:
+        """Create solutions through the bulk import API."""
+        solutions_data = [self.build_solution_data() for _ in range(count)]
 
         headers = {"Authorization": f"Bearer {self.token}"}
-        url = f"{BASE_URL}/api/solutions/"
-        debug_request("POST", url, headers=headers, json=solution_data)
-        response = self.session.post(url, json=solution_data, headers=headers)
+        url = f"{BASE_URL}/api/solutions/import"
+        debug_request("POST", url, headers=headers, json=solutions_data)
+        response = self.session.post(url, json=solutions_data, headers=headers)
         response.raise_for_status()
-        return response.json()["data"]
+
+        solutions = []
+        for result in response.json()["data"]["results"]:
+            if result["success"]:
+                solutions.append({"name": solutions_data[result["index"]]["name"], "slug": result["slug"]})
+            else:
+                print(f"Skipped solution #{result['index']}: {result['error']}")
+        return solutions
 
     def create_comment(self, solution_slug: str) -> Dict:
         """Create a new comment on a solution."""
@@ -277,9 +289,7 @@ class TestDataGenerator:
 
         # Create solutions
         print(f"Creating {num_solutions} solutions...")
-        for _ in range(num_solutions):
-            solution = self.create_solution()
-            self.solutions.append(solution)
+        self.solutions.extend(self.create_solutions(num_solutions))
 
         # Create comments and ratings for each solution
         for solution in self.solutions:
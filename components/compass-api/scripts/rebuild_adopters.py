@@ -0,0 +1,26 @@
+"""
+Recompute the precomputed adopters of every solution (solution_adopters and
+adopter_count) from the comments and ratings marked with is_adopted_user.
+Adopters are maintained by the API; run this after editing comments or ratings
+directly in MongoDB.
+
+Run from the compass-api directory:
+    python scripts/rebuild_adopters.py
+"""
+
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.adopter_service import AdopterService  # noqa: E402
+
+
+async def main():
+    corrected = await AdopterService().rebuild_adopters()
+    print(f"Solution adopters rebuilt, {corrected} corrected")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,25 @@
+"""
+Recompute stored rating summaries (average, count and distribution per solution)
+from the ratings. Summaries are kept up to date by every rating write; run this
+after editing ratings directly in MongoDB, for the affected solutions or for all.
+
+Run from the compass-api directory:
+    python scripts/rebuild_rating_summaries.py [solution-slug ...]
+"""
+
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.rating_service import RatingService  # noqa: E402
+
+
+async def main(solution_slugs):
+    await RatingService().refresh_rating_summaries(solution_slugs or None)
+    print(f"Rating summaries rebuilt for {', '.join(solution_slugs) if solution_slugs else 'all solutions'}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(sys.argv[1:]))
@@ -0,0 +1,25 @@
+"""
+Recompute the usage_count stored on every tag from the approved solutions.
+Usage counts are maintained incrementally by the API; run this after editing
+solutions directly in MongoDB.
+
+Run from the compass-api directory:
+    python scripts/rebuild_tag_usage_counts.py
+"""
+
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.tag_service import TagService  # noqa: E402
+
+
+async def main():
+    corrected = await TagService().rebuild_usage_counts()
+    print(f"Tag usage counts rebuilt, {corrected} tags corrected")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
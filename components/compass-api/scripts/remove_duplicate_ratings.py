@@ -0,0 +1,26 @@
+"""
+Remove duplicate ratings, keeping the latest rating of each user for each solution.
+Older versions of the API could store a second rating when a user resubmitted
+the same score; the unique (solution_slug, username) index created at startup
+cannot be built until those duplicates are gone. Restart the API afterwards.
+
+Run from the compass-api directory:
+    python scripts/remove_duplicate_ratings.py
+"""
+
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.rating_service import RatingService  # noqa: E402
+
+
+async def main():
+    removed = await RatingService().remove_duplicate_ratings()
+    print(f"Duplicate ratings removed: {removed}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
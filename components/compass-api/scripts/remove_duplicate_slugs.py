@@ -0,0 +1,26 @@
+"""
+Give solutions sharing a slug distinct slugs, keeping the slug on the oldest one.
+Older versions of the API could allocate the same slug to solutions created
+concurrently; the unique slug index created at startup cannot be built until
+those duplicates are gone. Restart the API afterwards.
+
+Run from the compass-api directory:
+    python scripts/remove_duplicate_slugs.py
+"""
+
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.solution_service import SolutionService  # noqa: E402
+
+
+async def main():
+    renamed = await SolutionService().remove_duplicate_slugs()
+    print(f"Solutions given a new slug: {renamed}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,10 +1,27 @@
 import asyncio
+import os
+
+# Required settings, set before the application is imported
+os.environ.setdefault("JWT_SECRET_KEY", "test_secret_key")
+os.environ.setdefault("DEFAULT_ADMIN_PASSWORD", "test_admin_password")
+
+import httpx
 import pytest
 from motor.motor_asyncio import AsyncIOMotorClient
+from mongomock_motor import AsyncMongoMockClient
 from fastapi.testclient import TestClient
 from main import app
+from app.core import database as app_database
+from app.core import mongodb
+from app.core.cache import payload_cache
 from app.core.config import settings
-from app.core.security import get_password_hash, create_access_token
+from app.core.indexes import ensure_indexes
+from app.core.security import create_access_token
+from app.core.versioning import collection_versions
+from app.services.catalog_service import catalog
+from app.services.job_service import job_runner
+from app.services.site_config_service import site_config_store
+from app.services.solution_cache import solution_cache
 from datetime import datetime, timedelta
 from bson import ObjectId
 from app.models.user import User
@@ -14,6 +31,22 @@ settings.JWT_SECRET_KEY = "test_secret_key"
 settings.JWT_ALGORITHM = "HS256"
 settings.ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
+# Tests run against an in-memory database unless a MongoDB server is given,
+# e.g. TEST_MONGODB_URL=mongodb://localhost:27017
+TEST_MONGODB_URL = os.environ.get("TEST_MONGODB_URL")
+TEST_DATABASE_NAME = "tc_test"
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip tests needing MongoDB server features ($merge, ...) on the in-memory database"""
+    if TEST_MONGODB_URL:
+        return
+    skip = pytest.mark.skip(reason="needs a MongoDB server (set TEST_MONGODB_URL)")
+    for item in items:
+        if "mongodb_server" in item.keywords:
+            item.add_marker(skip)
+
+
 @pytest.fixture(scope="session")
 def event_loop():
     """Create an instance of the default event loop for the test session."""
@@ -21,61 +54,117 @@ def event_loop():
     yield loop
     loop.close()
 
-@pytest.fixture(scope="session")
-def test_client():
-    """Create a test client for the FastAPI app."""
-    with TestClient(app) as client:
-        yield client
 
-@pytest.fixture(scope="session")
-async def test_db():
-    """Create a test database and handle cleanup."""
-    test_settings = settings.model_copy()
-    test_settings.DATABASE_NAME = "tc_test"
-    
-    client = AsyncIOMotorClient(test_settings.MONGODB_URL)
-    db = client[test_settings.DATABASE_NAME]
-    
-    # Clear test database before tests
-    await db.users.delete_many({})
-    await db.categories.delete_many({})
-    await db.tags.delete_many({})
-    await db.solutions.delete_many({})
-    
+@pytest.fixture
+async def test_db(monkeypatch):
+    """Create an empty test database used by the application for one test."""
+    if TEST_MONGODB_URL:
+        client = AsyncIOMotorClient(TEST_MONGODB_URL)
+        await client.drop_database(TEST_DATABASE_NAME)
+    else:
+        client = AsyncMongoMockClient()
+    db = client[TEST_DATABASE_NAME]
+
+    monkeypatch.setattr(app_database, "client", client)
+    monkeypatch.setattr(app_database, "database", db)
+    monkeypatch.setattr(mongodb.db, "client", client)
+    monkeypatch.setattr(mongodb.db, "db", db)
+
+    # Process-wide caches must not carry state over from another test
+    catalog.__init__()
+    collection_versions.__init__(check_interval=settings.VERSION_CHECK_INTERVAL_SECONDS)
+    payload_cache.__init__(ttl=settings.PAYLOAD_CACHE_TTL_SECONDS)
+    site_config_store.__init__()
+    solution_cache.__init__()
+
+    await ensure_indexes()
     yield db
-    
-    # Clear test database after tests
-    await db.users.delete_many({})
-    await db.categories.delete_many({})
-    await db.tags.delete_many({})
-    await db.solutions.delete_many({})
-    
-    client.close()
 
-@pytest.fixture(scope="session")
-async def test_user(test_db):
-    """Create a test user."""
+    if TEST_MONGODB_URL:
+        await client.drop_database(TEST_DATABASE_NAME)
+        client.close()
+
+
+@pytest.fixture
+def test_client(test_db):
+    """Create a test client for the FastAPI app (without running the startup tasks)."""
+    return TestClient(app)
+
+
+@pytest.fixture
+async def api_client(test_db):
+    """Create an async test client for the FastAPI app (without running the startup tasks)."""
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+async def _create_user(db, username: str, is_superuser: bool) -> User:
     user_data = {
         "_id": ObjectId(),
-        "username": "testuser",
-        "email": "test@example.com",
-        "full_name": "Test User",
-        "hashed_password": get_password_hash("testpass123"),
+        "username": username,
+        "email": f"{username}@example.com",
+        "full_name": username.title(),
+        # Tests authenticate with tokens, the password is never checked
+        "hashed_password": "unused",
         "is_active": True,
-        "is_superuser": False,
+        "is_superuser": is_superuser,
         "created_at": datetime.utcnow(),
-        "updated_at": datetime.utcnow()
+        "updated_at": datetime.utcnow(),
     }
-    
-    await test_db.users.insert_one(user_data)
-    user = User(**user_data)
-    return user
+    await db.users.insert_one(user_data)
+    return User(**user_data)
 
-@pytest.fixture(scope="session")
-def auth_headers(test_user):
-    """Create authentication headers with JWT token."""
+
+def _auth_headers(user: User) -> dict:
     access_token = create_access_token(
-        data={"sub": test_user.username},
-        expires_delta=timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+        data={"sub": user.username}, expires_delta=timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     )
     return {"Authorization": f"Bearer {access_token}"}
+
+
+@pytest.fixture
+async def test_user(test_db):
+    """Create a test user."""
+    return await _create_user(test_db, "testuser", is_superuser=False)
+
+
+@pytest.fixture
+async def test_admin(test_db):
+    """Create a test superuser."""
+    return await _create_user(test_db, "testadmin", is_superuser=True)
+
+
+@pytest.fixture
+def auth_headers(test_user):
+    """Create authentication headers with JWT token."""
+    return _auth_headers(test_user)
+
+
+@pytest.fixture
+def admin_headers(test_admin):
+    """Create authentication headers of the superuser."""
+    return _auth_headers(test_admin)
+
+
+@pytest.fixture
+def run_jobs(test_db):
+    """Run the queued background jobs to completion (no workers run in tests)."""
+    return job_runner.run_pending
+
+
+@pytest.fixture
+def solution_data():
+    """Fields of a valid new solution."""
+
+    def make(name: str = "Test Solution", **fields) -> dict:
+        return {
+            "name": name,
+            "description": "Test Description",
+            "brief": "Test brief",
+            "department": "Engineering",
+            "team": "Platform",
+            "category": "Infrastructure",
+            **fields,
+        }
+
+    return make
@@ -0,0 +1,80 @@
+import pytest
+
+from app.services.adopter_service import AdopterService
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+async def solution(api_client, admin_headers, solution_data):
+    await api_client.post("/api/solutions/", json=solution_data("Docker"), headers=admin_headers)
+    return "docker"
+
+
+async def _adopter_count(db, slug: str) -> int:
+    return (await db.solutions.find_one({"slug": slug})).get("adopter_count", 0)
+
+
+async def test_adopting_comments_maintain_the_adopters(api_client, test_db, solution, auth_headers):
+    created = await api_client.post(
+        f"/api/comments/solution/{solution}",
+        json={"content": "We use it", "is_adopted_user": True},
+        headers=auth_headers,
+    )
+    await api_client.post(
+        f"/api/comments/solution/{solution}", json={"content": "Again", "is_adopted_user": True}, headers=auth_headers
+    )
+
+    assert created.status_code == 201
+    assert await test_db.solution_adopters.count_documents({"solution_slug": solution}) == 1
+    assert await _adopter_count(test_db, solution) == 1
+    response = await api_client.get(f"/api/solutions/{solution}/adopted-users")
+    assert [user["username"] for user in response.json()["data"]] == ["testuser"]
+    assert response.json()["total"] == 1
+
+
+async def test_adopter_is_removed_with_its_last_adopting_comment(api_client, test_db, solution, auth_headers):
+    created = await api_client.post(
+        f"/api/comments/solution/{solution}",
+        json={"content": "We use it", "is_adopted_user": True},
+        headers=auth_headers,
+    )
+
+    await api_client.put(
+        f"/api/comments/{created.json()['data']['_id']}",
+        json={"content": "We stopped", "is_adopted_user": False},
+        headers=auth_headers,
+    )
+
+    assert await test_db.solution_adopters.count_documents({}) == 0
+    assert await _adopter_count(test_db, solution) == 0
+
+
+async def test_adopting_ratings_count_too(test_db, solution):
+    await test_db.ratings.insert_one(
+        {"solution_slug": solution, "username": "testuser", "score": 5, "is_adopted_user": True}
+    )
+
+    await AdopterService().refresh_adopter(solution, "testuser")
+    await AdopterService().refresh_adopter(solution, "testuser")
+
+    assert await _adopter_count(test_db, solution) == 1
+
+
+async def test_rebuild_corrects_adopters_and_counts(test_db, solution):
+    await test_db.comments.insert_one({"solution_slug": solution, "username": "testuser", "is_adopted_user": True})
+    await test_db.solution_adopters.insert_one({"solution_slug": solution, "username": "gone"})
+    await test_db.solutions.update_one({"slug": solution}, {"$set": {"adopter_count": 5}})
+
+    corrected = await AdopterService().rebuild_adopters()
+
+    assert corrected == 3
+    assert [adopter["username"] async for adopter in test_db.solution_adopters.find()] == ["testuser"]
+    assert await _adopter_count(test_db, solution) == 1
+    assert await AdopterService().rebuild_adopters() == 0
+
+
+async def test_adopted_users_of_missing_solution_are_not_found(api_client):
+    response = await api_client.get("/api/solutions/missing/adopted-users")
+
+    assert response.status_code == 404
@@ -0,0 +1,87 @@
+import pytest
+
+from app.core.config import settings
+from app.routers.batch import _validate_url
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.mark.parametrize(
+    "url",
+    ["/api/batch", "/api/exports/solutions", "/api/%65xports/solutions", "/health", "http://example.com/api/tags/"],
+)
+def test_urls_outside_the_batchable_api_are_rejected(url):
+    with pytest.raises(ValueError):
+        _validate_url(url)
+
+
+async def test_requests_are_answered_in_order(api_client, admin_headers):
+    await api_client.post("/api/tags/", json={"name": "Docker"}, headers=admin_headers)
+
+    response = await api_client.post(
+        "/api/batch",
+        json={
+            "requests": [
+                {"id": "tags", "url": "/api/tags/?show_all=true"},
+                {"id": "missing", "url": "/api/solutions/missing"},
+                {"id": "me", "url": "/api/users/me"},
+            ]
+        },
+        headers=admin_headers,
+    )
+
+    assert response.status_code == 200
+    tags, missing, me = response.json()["data"]
+    assert (tags["id"], tags["status"]) == ("tags", 200)
+    assert [tag["name"] for tag in tags["body"]["data"]] == ["docker"]
+    assert missing["status"] == 404
+    # The Authorization header of the batch is inherited
+    assert me["body"]["data"]["username"] == "testadmin"
+
+
+async def test_sub_requests_keep_conditional_headers(api_client):
+    # Sub-responses are embedded uncompressed, so they carry the identity ETag
+    first = await api_client.get("/api/tags/?show_all=true", headers={"Accept-Encoding": "identity"})
+
+    response = await api_client.post(
+        "/api/batch",
+        json={"requests": [{"url": "/api/tags/?show_all=true", "headers": {"If-None-Match": first.headers["etag"]}}]},
+    )
+
+    assert response.json()["data"][0]["status"] == 304
+    assert response.json()["data"][0]["body"] is None
+
+
+async def test_sub_responses_are_not_compressed(api_client, test_db):
+    await test_db.tags.insert_many([{"name": f"tag-{index}", "description": "x" * 50} for index in range(50)])
+
+    response = await api_client.post(
+        "/api/batch",
+        json={"requests": [{"url": "/api/tags/?show_all=true", "headers": {"Accept-Encoding": "gzip"}}]},
+    )
+
+    item = response.json()["data"][0]
+    assert "content-encoding" not in item["headers"]
+    assert len(item["body"]["data"]) == 50
+
+
+async def test_excluded_endpoints_fail_the_batch(api_client, admin_headers):
+    response = await api_client.post(
+        "/api/batch", json={"requests": [{"url": "/api/%65xports/solutions"}]}, headers=admin_headers
+    )
+
+    assert response.status_code == 400
+
+
+async def test_batch_size_is_limited(api_client, monkeypatch):
+    monkeypatch.setattr(settings, "BATCH_MAX_REQUESTS", 1)
+
+    response = await api_client.post("/api/batch", json={"requests": [{"url": "/api/tags/"}, {"url": "/api/tags/"}]})
+
+    assert response.status_code == 400
+
+
+async def test_only_get_requests_can_be_batched(api_client):
+    response = await api_client.post("/api/batch", json={"requests": [{"method": "POST", "url": "/api/tags/"}]})
+
+    assert response.status_code == 422
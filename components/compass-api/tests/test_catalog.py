@@ -0,0 +1,77 @@
+import pytest
+from bson import ObjectId
+
+from app.core.versioning import collection_versions
+from app.services.catalog_service import CATEGORY_USAGE, TAG_USAGE, catalog
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_tags_are_served_from_memory_until_changed(test_db):
+    await test_db.tags.insert_many([{"name": "kubernetes", "usage_count": 1}, {"name": "docker", "usage_count": 0}])
+    assert [tag["name"] for tag in await catalog.list_tags(show_all=True)] == ["docker", "kubernetes"]
+
+    await test_db.tags.insert_one({"name": "cloud", "usage_count": 0})
+    assert await catalog.get_tag("cloud") is None
+
+    await collection_versions.bump("tags")
+    assert (await catalog.get_tag("cloud"))["name"] == "cloud"
+    assert [tag["name"] for tag in await catalog.list_tags()] == ["kubernetes"]
+
+
+async def test_usage_changes_reload_only_the_counts(test_db):
+    await test_db.tags.insert_one({"name": "docker", "description": "Containers", "usage_count": 0})
+    cached = await catalog.get_tag("docker")
+
+    await test_db.tags.update_one({"name": "docker"}, {"$set": {"description": "Changed", "usage_count": 2}})
+    await collection_versions.bump(TAG_USAGE)
+    tag = await catalog.get_tag("docker")
+
+    assert (tag["usage_count"], tag["description"]) == (2, "Containers")
+    # Documents handed out earlier are not modified
+    assert cached["usage_count"] == 0
+
+
+async def test_changes_of_other_workers_are_seen_after_the_check_interval(test_db, monkeypatch):
+    await test_db.tags.insert_one({"name": "docker", "usage_count": 0})
+    await catalog.get_tag("docker")
+
+    await test_db.tags.insert_one({"name": "cloud", "usage_count": 0})
+    await test_db.collection_versions.update_one({"_id": "tags"}, {"$set": {"stamp": ObjectId()}}, upsert=True)
+    assert await catalog.get_tag("cloud") is None
+
+    monkeypatch.setattr(collection_versions, "check_interval", 0)
+    assert await catalog.get_tag("cloud") is not None
+
+
+async def test_categories_are_sorted_like_the_listing(test_db):
+    await test_db.categories.insert_many(
+        [{"name": "B", "radar_quadrant": 1}, {"name": "A", "radar_quadrant": 1}, {"name": "C"}]
+    )
+
+    assert [category["name"] for category in await catalog.list_categories()] == ["C", "A", "B"]
+    assert [category["name"] for category in await catalog.list_categories("-name")] == ["C", "B", "A"]
+
+
+async def test_category_usage_changes_reload_only_the_counts(test_db):
+    await test_db.categories.insert_one({"name": "Infrastructure", "description": "Servers"})
+    assert (await catalog.get_category_usage())["Infrastructure"]["usage_count"] == 0
+
+    await test_db.categories.update_one({"name": "Infrastructure"}, {"$set": {"description": "Changed"}})
+    await test_db.solutions.insert_one({"name": "Docker", "slug": "docker", "category": "Infrastructure"})
+    await collection_versions.bump("solutions")
+    assert (await catalog.get_category_usage())["Infrastructure"]["usage_count"] == 0
+
+    await collection_versions.bump(CATEGORY_USAGE)
+    assert (await catalog.get_category_usage())["Infrastructure"]["usage_count"] == 1
+    assert (await catalog.get_category("Infrastructure"))["description"] == "Servers"
+
+
+async def test_solution_existence_is_forgotten_when_solutions_change(test_db):
+    assert not await catalog.solution_exists("docker")
+
+    await test_db.solutions.insert_one({"name": "Docker", "slug": "docker"})
+    assert not await catalog.solution_exists("docker")
+
+    await collection_versions.bump("solutions")
+    assert await catalog.solution_exists("docker")
@@ -0,0 +1,73 @@
+import pytest
+
+from app.core.versioning import collection_versions
+from app.services.catalog_service import CATEGORY_USAGE, aggregate_category_usage
+from app.services.category_service import CategoryService
+
+pytestmark = pytest.mark.asyncio
+
+
+async def _insert_solutions(db) -> None:
+    await db.solutions.insert_many(
+        [
+            {
+                "name": "A",
+                "slug": "a",
+                "category": "Infrastructure",
+                "review_status": "APPROVED",
+                "recommend_status": "ADOPT",
+            },
+            {
+                "name": "B",
+                "slug": "b",
+                "category": "Infrastructure",
+                "review_status": "APPROVED",
+                "recommend_status": "HOLD",
+            },
+            {"name": "C", "slug": "c", "category": "Infrastructure", "review_status": "PENDING"},
+            {"name": "D", "slug": "d", "category": "Security", "review_status": "PENDING"},
+        ]
+    )
+
+
+async def test_usage_is_counted_per_category_and_status(test_db):
+    await _insert_solutions(test_db)
+
+    usage = await aggregate_category_usage()
+
+    assert usage["Infrastructure"] == {
+        "usage_count": 3,
+        "usage_by_review_status": {"APPROVED": 2, "PENDING": 1},
+        "usage_by_recommend_status": {"ADOPT": 1, "HOLD": 1},
+    }
+    assert usage["Security"]["usage_count"] == 1
+    assert list(await aggregate_category_usage(["Security"])) == ["Security"]
+
+
+async def test_uncataloged_and_unused_categories_are_counted(test_db):
+    await _insert_solutions(test_db)
+    await test_db.categories.insert_one({"name": "Empty"})
+
+    usage = await CategoryService().get_category_usage_counts(["Empty", "Security", "Unknown"])
+
+    assert {name: entry["usage_count"] for name, entry in usage.items()} == {"Empty": 0, "Security": 1, "Unknown": 0}
+
+
+async def test_listing_includes_the_breakdown_on_request(api_client, test_db, admin_headers):
+    await api_client.post("/api/categories/", json={"name": "Infrastructure"}, headers=admin_headers)
+    await _insert_solutions(test_db)
+    await collection_versions.bump(CATEGORY_USAGE)
+
+    plain = await api_client.get("/api/categories/")
+    detailed = await api_client.get("/api/categories/", params={"usage_breakdown": "true"})
+
+    category = plain.json()["data"][0]
+    assert category["usage_count"] == 3
+    assert category.get("usage_by_review_status") is None
+    assert detailed.json()["data"][0]["usage_by_review_status"] == {"APPROVED": 2, "PENDING": 1}
+
+
+async def test_usage_of_missing_category_is_not_found(api_client):
+    response = await api_client.get("/api/categories/000000000000000000000000")
+
+    assert response.status_code == 404
@@ -0,0 +1,65 @@
+import gzip
+
+import pytest
+
+from app.core.compression import SUPPORTED_ENCODINGS, PrecompressedPayload, negotiate_encoding
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, expected",
+    [
+        ("gzip", "gzip"),
+        ("GZIP;q=0.8, identity", "gzip"),
+        ("gzip;q=0", None),
+        ("gzip;q=oops", None),
+        ("identity", None),
+        ("", None),
+        (None, None),
+        ("*", SUPPORTED_ENCODINGS[0]),
+    ],
+)
+def test_negotiate_encoding(accept_encoding, expected):
+    assert negotiate_encoding(accept_encoding) == expected
+
+
+def test_negotiate_encoding_prefers_higher_quality():
+    if "br" not in SUPPORTED_ENCODINGS:
+        pytest.skip("brotli is not installed")
+    assert negotiate_encoding("br;q=0.5, gzip") == "gzip"
+    assert negotiate_encoding("gzip, br") == "br"
+
+
+def test_precompressed_payload_compresses_once():
+    payload = PrecompressedPayload(b'{"data": "' + b"x" * 4096 + b'"}')
+
+    compressed = payload.encoded("gzip")
+
+    assert payload.encoded("gzip") is compressed
+    assert gzip.decompress(compressed) == payload.body
+
+
+async def test_large_responses_are_compressed(api_client):
+    response = await api_client.get("/openapi.json", headers={"Accept-Encoding": "gzip"})
+
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["vary"]
+    # Decoded by the client
+    assert response.json()["paths"]
+
+
+async def test_responses_are_not_compressed_without_accepted_encoding(api_client):
+    response = await api_client.get("/openapi.json", headers={"Accept-Encoding": "identity"})
+
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+    assert response.json()["paths"]
+
+
+async def test_small_responses_are_not_compressed(api_client):
+    response = await api_client.get("/api/solutions/missing", headers={"Accept-Encoding": "gzip"})
+
+    assert response.status_code == 404
+    assert "content-encoding" not in response.headers
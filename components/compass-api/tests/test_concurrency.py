@@ -0,0 +1,74 @@
+import asyncio
+import logging
+
+import pytest
+
+from app.core.concurrency import fan_out
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_queries_run_concurrently_and_keep_their_order():
+    first_started = asyncio.Event()
+
+    async def first():
+        first_started.set()
+        await asyncio.sleep(0.01)
+        return "first"
+
+    async def second():
+        # Only completes if the first query is running at the same time
+        await asyncio.wait_for(first_started.wait(), timeout=1)
+        return "second"
+
+    assert await fan_out("test", items=first(), total=second()) == ("first", "second")
+
+
+async def test_concurrency_is_bounded():
+    running = []
+    peak = []
+
+    async def query(name):
+        running.append(name)
+        peak.append(len(running))
+        await asyncio.sleep(0.001)
+        running.remove(name)
+        return name
+
+    results = await fan_out("test", limit=2, a=query("a"), b=query("b"), c=query("c"))
+
+    assert results == ("a", "b", "c")
+    assert max(peak) == 2
+
+
+async def test_failures_are_raised():
+    async def failing():
+        raise ValueError("query failed")
+
+    async def succeeding():
+        return 1
+
+    with pytest.raises(ValueError, match="query failed"):
+        await fan_out("test", items=failing(), total=succeeding())
+
+
+async def test_overlap_is_traced(caplog):
+    async def query():
+        return None
+
+    with caplog.at_level(logging.DEBUG, logger="app.core.concurrency"):
+        await fan_out("get_comments", items=query(), total=query())
+
+    assert "get_comments: items +" in caplog.text
+    assert "wall" in caplog.text and "sequential" in caplog.text
+
+
+async def test_lists_are_paginated_with_their_total(api_client, admin_headers, solution_data):
+    for name in ("Docker", "Podman", "Buildah"):
+        await api_client.post("/api/solutions/", json=solution_data(name), headers=admin_headers)
+
+    response = await api_client.get("/api/solutions/", params={"limit": 2})
+
+    assert response.status_code == 200
+    assert len(response.json()["data"]) == 2
+    assert response.json()["total"] == 3
@@ -0,0 +1,71 @@
+import pytest
+
+from app.core.cache import etag_matches, make_etag
+
+pytestmark = pytest.mark.asyncio
+
+
+def test_etag_matches():
+    etag = make_etag("tags", (0, 100, False), (None,))
+
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", W/{etag}', etag)
+    assert not etag_matches("*", etag)
+    assert not etag_matches('"other"', etag)
+    assert not etag_matches(None, etag)
+
+
+async def test_catalog_listing_answers_matching_etag_with_304(api_client, admin_headers):
+    await api_client.post("/api/categories/", json={"name": "Infrastructure"}, headers=admin_headers)
+    first = await api_client.get("/api/categories/")
+    etag = first.headers["etag"]
+
+    response = await api_client.get("/api/categories/", headers={"If-None-Match": etag})
+
+    assert first.status_code == 200
+    assert "last-modified" in first.headers
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert not response.content
+
+
+async def test_write_changes_the_etag(api_client, admin_headers):
+    first = await api_client.get("/api/tags/?show_all=true")
+
+    created = await api_client.post("/api/tags/", json={"name": "Docker"}, headers=admin_headers)
+    response = await api_client.get("/api/tags/?show_all=true", headers={"If-None-Match": first.headers["etag"]})
+
+    assert created.status_code == 201
+    assert response.status_code == 200
+    assert response.headers["etag"] != first.headers["etag"]
+    assert [tag["name"] for tag in response.json()["data"]] == ["docker"]
+
+
+async def test_query_parameters_are_part_of_the_etag(api_client):
+    all_tags = await api_client.get("/api/tags/?show_all=true")
+    used_tags = await api_client.get("/api/tags/", headers={"If-None-Match": all_tags.headers["etag"]})
+
+    assert used_tags.status_code == 200
+    assert used_tags.headers["etag"] != all_tags.headers["etag"]
+
+
+async def test_each_content_encoding_has_its_own_etag(api_client):
+    identity = await api_client.get("/api/tags/?show_all=true", headers={"Accept-Encoding": "identity"})
+    gzipped = await api_client.get("/api/tags/?show_all=true", headers={"Accept-Encoding": "gzip"})
+
+    response = await api_client.get(
+        "/api/tags/?show_all=true", headers={"Accept-Encoding": "gzip", "If-None-Match": identity.headers["etag"]}
+    )
+
+    assert identity.headers["etag"] != gzipped.headers["etag"]
+    assert response.status_code == 200
+
+
+async def test_if_none_match_any_needs_an_existing_resource(api_client, test_db):
+    await test_db.solutions.insert_one({"name": "Docker", "slug": "docker", "review_status": "APPROVED"})
+
+    existing = await api_client.get("/api/solutions/docker", headers={"If-None-Match": "*"})
+    missing = await api_client.get("/api/solutions/missing", headers={"If-None-Match": "*"})
+
+    assert existing.status_code == 304
+    assert missing.status_code == 404
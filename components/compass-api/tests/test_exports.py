@@ -0,0 +1,82 @@
+import csv
+import io
+import json
+from datetime import datetime
+
+import pytest
+
+from app.core.config import settings
+from app.models.export import ExportResource
+from app.services.export_service import ExportService
+
+pytestmark = pytest.mark.asyncio
+
+
+async def _insert_solutions(db, count: int, updated_at: datetime = datetime(2024, 1, 19)) -> None:
+    await db.solutions.insert_many(
+        [
+            {"name": f"Solution {index}", "slug": f"solution-{index}", "tags": ["a", "b"], "updated_at": updated_at}
+            for index in range(count)
+        ]
+    )
+
+
+async def test_documents_are_read_in_bounded_batches(test_db, monkeypatch):
+    monkeypatch.setattr(settings, "EXPORT_BATCH_SIZE", 2)
+    await _insert_solutions(test_db, 5)
+
+    batches = [batch async for batch in ExportService().iter_documents(ExportResource.SOLUTIONS)]
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert [document["slug"] for batch in batches for document in batch] == [f"solution-{i}" for i in range(5)]
+
+
+async def test_ndjson_export_streams_one_document_per_line(api_client, test_db, admin_headers):
+    await _insert_solutions(test_db, 3)
+
+    response = await api_client.get("/api/exports/solutions", headers=admin_headers)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert "attachment" in response.headers["content-disposition"]
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["slug"] for line in lines] == ["solution-0", "solution-1", "solution-2"]
+
+
+async def test_export_leaves_out_internal_fields(test_db):
+    await test_db.solutions.insert_one(
+        {"name": "Docker", "slug": "docker", "name_normalized": "docker", "name_trigrams": ["doc"], "adopter_count": 2}
+    )
+
+    batches = [batch async for batch in ExportService().iter_documents(ExportResource.SOLUTIONS)]
+
+    assert set(batches[0][0]) == {"_id", "name", "slug"}
+
+
+async def test_csv_export_flattens_values_and_filters_by_date(api_client, test_db, admin_headers):
+    await _insert_solutions(test_db, 2, updated_at=datetime(2023, 1, 1))
+    await test_db.solutions.insert_one(
+        {"name": "Recent", "slug": "recent", "tags": ["a", "b"], "updated_at": datetime(2024, 6, 1)}
+    )
+
+    response = await api_client.get(
+        "/api/exports/solutions", params={"format": "csv", "since": "2024-01-01T00:00:00"}, headers=admin_headers
+    )
+
+    assert response.status_code == 200
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [row["slug"] for row in rows] == ["recent"]
+    assert rows[0]["tags"] == "a;b"
+    assert rows[0]["updated_at"] == "2024-06-01T00:00:00"
+
+
+async def test_exports_require_a_superuser(api_client, auth_headers):
+    response = await api_client.get("/api/exports/solutions", headers=auth_headers)
+
+    assert response.status_code == 403
+
+
+async def test_unknown_resource_is_rejected(api_client, admin_headers):
+    response = await api_client.get("/api/exports/users", headers=admin_headers)
+
+    assert response.status_code == 422
@@ -0,0 +1,84 @@
+import httpx
+import pytest
+
+from app.core.identity_map import IdentityMap, IdentityMapMiddleware, _identity_map, current_identity_map, find_one_by
+from app.core.versioning import collection_versions
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+def identity_map():
+    token = _identity_map.set(IdentityMap())
+    yield current_identity_map()
+    _identity_map.reset(token)
+
+
+@pytest.fixture
+def solutions(test_db, monkeypatch):
+    """The solutions collection, recording the filters of its find_one queries in solutions.queries"""
+    collection = test_db.solutions
+    find_one = collection.find_one
+    queries = []
+
+    async def recording_find_one(filter, *args, **kwargs):
+        queries.append(filter)
+        return await find_one(filter, *args, **kwargs)
+
+    monkeypatch.setattr(collection, "find_one", recording_find_one)
+    monkeypatch.setattr(collection, "queries", queries, raising=False)
+    return collection
+
+
+async def test_documents_are_loaded_once_per_request(identity_map, solutions):
+    await solutions.insert_one({"name": "Docker", "slug": "docker"})
+
+    by_slug = await find_one_by(solutions, "slug", "docker")
+    again = await find_one_by(solutions, "slug", "docker")
+    by_id = await find_one_by(solutions, "_id", by_slug["_id"])
+
+    assert again is by_slug and by_id is by_slug
+    assert solutions.queries == [{"slug": "docker"}]
+
+
+async def test_missing_documents_are_remembered(identity_map, solutions):
+    assert await find_one_by(solutions, "slug", "missing") is None
+    assert await find_one_by(solutions, "slug", "missing") is None
+
+    assert len(solutions.queries) == 1
+
+
+async def test_writes_clear_the_map(identity_map, solutions):
+    await solutions.insert_one({"name": "Docker", "slug": "docker"})
+    await find_one_by(solutions, "slug", "docker")
+
+    await solutions.update_one({"slug": "docker"}, {"$set": {"name": "Podman"}})
+    await collection_versions.bump("solutions")
+
+    assert (await find_one_by(solutions, "slug", "docker"))["name"] == "Podman"
+    assert len(solutions.queries) == 2
+
+
+async def test_documents_are_not_kept_outside_requests(solutions):
+    await find_one_by(solutions, "slug", "docker")
+    await find_one_by(solutions, "slug", "docker")
+
+    assert len(solutions.queries) == 2
+
+
+async def test_every_request_gets_its_own_map():
+    maps = []
+
+    async def app(scope, receive, send):
+        maps.append(current_identity_map())
+        await send({"type": "http.response.start", "status": 204, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    transport = httpx.ASGITransport(app=IdentityMapMiddleware(app))
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        await client.get("/")
+        await client.get("/")
+
+    assert all(isinstance(identity_map, IdentityMap) for identity_map in maps)
+    assert maps[0] is not maps[1]
+    assert current_identity_map() is None
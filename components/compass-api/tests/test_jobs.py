@@ -0,0 +1,140 @@
+from datetime import datetime, timedelta
+
+import pytest
+from bson import ObjectId
+
+from app.core.config import settings
+from app.services.category_service import CategoryService
+from app.services.job_service import JobService, job_runner
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture(autouse=True)
+def no_batch_delay(monkeypatch):
+    monkeypatch.setattr(settings, "JOB_BATCH_DELAY_SECONDS", 0)
+
+
+async def test_category_rename_is_enqueued_and_run(api_client, test_db, admin_headers, run_jobs):
+    created = await api_client.post("/api/categories/", json={"name": "Infra"}, headers=admin_headers)
+    category_id = created.json()["data"]["_id"]
+    await test_db.solutions.insert_one({"name": "Docker", "slug": "docker", "category": "Infra"})
+
+    response = await api_client.put(
+        f"/api/categories/{category_id}", json={"name": "Infrastructure"}, headers=admin_headers
+    )
+
+    assert response.status_code == 202
+    job = response.json()["data"]
+    assert (job["type"], job["status"]) == ("rename_category", "PENDING")
+    assert await run_jobs() == 1
+    job = await api_client.get(response.headers["location"], headers=admin_headers)
+    assert job.json()["data"]["status"] == "COMPLETED"
+    assert job.json()["data"]["result"] == {"solutions_updated": 1}
+    assert (await test_db.solutions.find_one({"slug": "docker"}))["category"] == "Infrastructure"
+    assert (await test_db.categories.find_one({"_id": ObjectId(category_id)}))["name"] == "Infrastructure"
+
+
+async def test_unused_category_is_renamed_right_away(api_client, test_db, admin_headers):
+    created = await api_client.post("/api/categories/", json={"name": "Infra"}, headers=admin_headers)
+
+    response = await api_client.put(
+        f"/api/categories/{created.json()['data']['_id']}", json={"name": "Infrastructure"}, headers=admin_headers
+    )
+
+    assert response.status_code == 200
+    assert response.json()["data"]["name"] == "Infrastructure"
+    assert await test_db.jobs.count_documents({}) == 0
+
+
+async def test_solutions_moved_without_a_username_keep_their_updated_by(test_db):
+    await test_db.solutions.insert_one({"name": "Docker", "slug": "docker", "category": "Infra", "updated_by": "alice"})
+
+    updated = await CategoryService().rename_solutions_category("Infra", "Infrastructure")
+
+    assert updated == 1
+    solution = await test_db.solutions.find_one({"slug": "docker"})
+    assert (solution["category"], solution["updated_by"]) == ("Infrastructure", "alice")
+
+
+async def test_tag_deletion_runs_as_a_job(api_client, test_db, admin_headers, run_jobs):
+    await test_db.tags.insert_one({"name": "docker", "usage_count": 1})
+    await test_db.solutions.insert_one({"name": "Docker", "slug": "docker", "tags": ["docker", "containers"]})
+    tag = await test_db.tags.find_one({"name": "docker"})
+
+    response = await api_client.delete(f"/api/tags/{tag['_id']}", headers=admin_headers)
+
+    assert response.status_code == 202
+    assert await run_jobs() == 1
+    assert (await test_db.solutions.find_one({"slug": "docker"}))["tags"] == ["containers"]
+    assert await test_db.tags.count_documents({}) == 0
+
+
+async def test_expired_leases_are_claimed_again(test_db):
+    now = datetime.utcnow()
+    abandoned = ObjectId()
+    await test_db.jobs.insert_many(
+        [
+            {
+                "_id": ObjectId(),
+                "type": "delete_tag",
+                "status": "RUNNING",
+                "attempts": 1,
+                "created_at": now,
+                "lease_expires_at": now + timedelta(minutes=5),
+            },
+            {
+                "_id": abandoned,
+                "type": "delete_tag",
+                "status": "RUNNING",
+                "attempts": 1,
+                "created_at": now,
+                "lease_expires_at": now - timedelta(minutes=5),
+            },
+        ]
+    )
+
+    job = await job_runner._claim()
+
+    assert job["_id"] == abandoned
+    assert job["attempts"] == 2
+    assert job["lease_expires_at"] > now
+    assert await job_runner._claim() is None
+
+
+async def test_progress_is_recorded_only_by_the_owning_run(test_db, monkeypatch):
+    job = await JobService().enqueue("delete_tag", {"tag_id": "unused"})
+    claimed = await job_runner._claim()
+    # Claimed again by another worker since
+    await test_db.jobs.update_one({"_id": claimed["_id"]}, {"$inc": {"attempts": 1}})
+    monkeypatch.setitem(job_runner._handlers, "test", lambda params, progress: progress(1, 1))
+
+    await job_runner._run({**claimed, "type": "test"})
+
+    stored = await test_db.jobs.find_one({"_id": job.id})
+    assert (stored["status"], stored["processed"]) == ("RUNNING", 0)
+
+
+async def test_job_of_unknown_type_fails(test_db, run_jobs):
+    await test_db.jobs.insert_one(
+        {"type": "unknown", "status": "PENDING", "attempts": 0, "created_at": datetime.utcnow()}
+    )
+
+    assert await run_jobs() == 1
+
+    job = await test_db.jobs.find_one()
+    assert job["status"] == "FAILED"
+    assert job["error"] == "Unknown job type: unknown"
+    assert job["lease_expires_at"] is None
+
+
+async def test_jobs_are_listed_for_superusers_only(api_client, test_db, admin_headers, auth_headers):
+    await JobService().enqueue("delete_tag", {"tag_id": "unused"}, "testadmin")
+
+    listed = await api_client.get("/api/jobs/", params={"status": "PENDING"}, headers=admin_headers)
+    forbidden = await api_client.get("/api/jobs/", headers=auth_headers)
+    missing = await api_client.get(f"/api/jobs/{ObjectId()}", headers=admin_headers)
+
+    assert listed.json()["total"] == 1
+    assert forbidden.status_code == 403
+    assert missing.status_code == 404
@@ -0,0 +1,86 @@
+import pytest
+
+from app.models.rating import RatingCreate
+from app.services.rating_service import RatingService, rating_summary_pipeline
+
+pytestmark = pytest.mark.asyncio
+
+
+async def _insert_ratings(db, solution_slug: str, *scores: int) -> None:
+    await db.ratings.insert_many(
+        [
+            {"solution_slug": solution_slug, "username": f"user{index}", "score": score}
+            for index, score in enumerate(scores)
+        ]
+    )
+
+
+async def test_summary_is_computed_per_solution(test_db):
+    await _insert_ratings(test_db, "docker", 5, 4, 4)
+    await _insert_ratings(test_db, "podman", 1)
+
+    summaries = {summary["_id"]: summary async for summary in test_db.ratings.aggregate(rating_summary_pipeline({}))}
+
+    assert summaries["docker"]["count"] == 3
+    assert summaries["docker"]["sum"] == 13
+    assert summaries["docker"]["distribution"] == {"1": 0, "2": 0, "3": 0, "4": 2, "5": 1}
+    assert summaries["podman"]["distribution"]["1"] == 1
+
+
+async def test_unrated_solution_has_an_empty_summary(api_client):
+    response = await api_client.get("/api/ratings/solution/docker/summary")
+
+    assert response.status_code == 200
+    assert response.json()["data"] == {
+        "average": 0,
+        "count": 0,
+        "distribution": {"1": 0, "2": 0, "3": 0, "4": 0, "5": 0},
+    }
+
+
+async def test_rating_writes_update_the_stored_summary(test_db):
+    await test_db.solutions.insert_one({"name": "Docker", "slug": "docker"})
+    service = RatingService()
+
+    first = await service.create_or_update_rating("docker", RatingCreate(score=5), "testuser")
+    await service.create_or_update_rating("docker", RatingCreate(score=3), "testadmin")
+    await service.update_rating(str(first.id), RatingCreate(score=4), "testuser", is_superuser=False)
+
+    summary = await service.get_rating_summary("docker")
+    assert (summary["average"], summary["count"]) == (3.5, 2)
+    assert summary["distribution"] == {"1": 0, "2": 0, "3": 1, "4": 1, "5": 0}
+
+    await service.delete_rating(str(first.id), "testuser", is_superuser=False)
+
+    summary = await service.get_rating_summary("docker")
+    assert (summary["average"], summary["count"]) == (3, 1)
+    assert summary["distribution"]["4"] == 0
+
+
+async def test_unchanged_score_leaves_the_summary_untouched(test_db):
+    await test_db.solutions.insert_one({"name": "Docker", "slug": "docker"})
+    service = RatingService()
+    await service.create_or_update_rating("docker", RatingCreate(score=5), "testuser")
+    before = await test_db.rating_summaries.find_one({"_id": "docker"})
+
+    await service.create_or_update_rating("docker", RatingCreate(score=5, comment="Still great"), "testuser")
+
+    assert await test_db.rating_summaries.find_one({"_id": "docker"}) == before
+    assert before["count"] == 1
+
+
+@pytest.mark.mongodb_server
+async def test_stored_summaries_follow_the_ratings(test_db):
+    service = RatingService()
+    await _insert_ratings(test_db, "docker", 5, 4)
+    await _insert_ratings(test_db, "podman", 2)
+
+    await service.refresh_rating_summaries()
+    await test_db.ratings.delete_many({"solution_slug": "podman"})
+    await test_db.ratings.insert_one({"solution_slug": "docker", "username": "late", "score": 3})
+    await service.refresh_rating_summaries(["docker", "podman"])
+
+    summary = await service.get_rating_summary("docker")
+    assert (summary["average"], summary["count"]) == (4, 3)
+    assert summary["distribution"]["3"] == 1
+    assert await test_db.rating_summaries.count_documents({"_id": "podman"}) == 0
@@ -0,0 +1,89 @@
+from datetime import datetime
+
+import pytest
+from fastapi import HTTPException
+from pymongo.errors import DuplicateKeyError
+
+from app.models.rating import RatingCreate
+from app.services.rating_service import RatingService
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+async def solution(test_db):
+    await test_db.solutions.insert_one({"name": "Docker", "slug": "docker"})
+    return "docker"
+
+
+async def test_index_allows_one_rating_per_user_and_solution(test_db):
+    rating = {"solution_slug": "docker", "username": "testuser", "score": 4}
+    await test_db.ratings.insert_one(dict(rating))
+
+    with pytest.raises(DuplicateKeyError):
+        await test_db.ratings.insert_one(dict(rating))
+    await test_db.ratings.insert_one({**rating, "username": "testadmin"})
+
+
+async def test_rating_of_unknown_solution_is_not_found(test_db):
+    with pytest.raises(HTTPException) as error:
+        await RatingService().create_or_update_rating("missing", RatingCreate(score=4), "testuser")
+
+    assert error.value.status_code == 404
+    assert await test_db.ratings.count_documents({}) == 0
+
+
+async def test_resubmitted_rating_replaces_the_previous_one(test_db, solution):
+    service = RatingService()
+    first = await service.create_or_update_rating(solution, RatingCreate(score=4), "testuser")
+
+    again = await service.create_or_update_rating(solution, RatingCreate(score=4), "testuser")
+    changed = await service.create_or_update_rating(solution, RatingCreate(score=2, comment="Slow"), "testuser")
+
+    assert again.id == changed.id == first.id
+    assert (changed.score, changed.comment) == (2, "Slow")
+    assert changed.created_at == first.created_at
+    assert await test_db.ratings.count_documents({}) == 1
+
+
+async def test_adoption_is_refreshed_only_when_the_flag_changes(test_db, solution, monkeypatch):
+    service = RatingService()
+    refreshed = []
+
+    async def refresh_adopter(solution_slug, username):
+        refreshed.append((solution_slug, username))
+
+    monkeypatch.setattr(service.adopter_service, "refresh_adopter", refresh_adopter)
+    await service.create_or_update_rating(solution, RatingCreate(score=4), "testuser")
+    await service.create_or_update_rating(solution, RatingCreate(score=5, is_adopted_user=True), "testuser")
+    await service.create_or_update_rating(solution, RatingCreate(score=3, is_adopted_user=True), "testuser")
+
+    assert refreshed == [(solution, "testuser")]
+
+
+async def test_rating_is_posted_through_the_api(api_client, test_db, solution, auth_headers):
+    response = await api_client.post(f"/api/ratings/solution/{solution}", json={"score": 5}, headers=auth_headers)
+
+    assert response.status_code == 201
+    assert response.json()["data"]["score"] == 5
+    assert (await test_db.rating_summaries.find_one({"_id": solution}))["count"] == 1
+
+
+@pytest.mark.mongodb_server
+async def test_duplicate_ratings_are_removed_keeping_the_latest(test_db, solution):
+    await test_db.ratings.drop_indexes()
+    await test_db.ratings.insert_many(
+        [
+            {"solution_slug": solution, "username": "testuser", "score": 1, "updated_at": datetime(2024, 1, 1)},
+            {"solution_slug": solution, "username": "testuser", "score": 5, "updated_at": datetime(2024, 6, 1)},
+            {"solution_slug": solution, "username": "testadmin", "score": 3, "updated_at": datetime(2024, 1, 1)},
+        ]
+    )
+
+    removed = await RatingService().remove_duplicate_ratings()
+
+    assert removed == 1
+    assert {rating["username"]: rating["score"] async for rating in test_db.ratings.find()} == {
+        "testuser": 5,
+        "testadmin": 3,
+    }
@@ -0,0 +1,62 @@
+from datetime import datetime
+
+import orjson
+import pytest
+from bson import ObjectId
+
+from app.core.responses import FastJSONResponse, dumps
+from app.models.response import StandardResponse
+from app.models.solution import SolutionInDB
+
+pytestmark = pytest.mark.asyncio
+
+
+def test_dumps_handles_mongo_and_model_types():
+    object_id = ObjectId()
+    content = {
+        "id": object_id,
+        "at": datetime(2024, 1, 19, 12, 30),
+        "tags": {"docker"},
+        "response": StandardResponse.of({"name": "Docker"}),
+    }
+
+    data = orjson.loads(dumps(content))
+
+    assert data["id"] == str(object_id)
+    assert data["at"] == "2024-01-19T12:30:00"
+    assert data["tags"] == ["docker"]
+    assert data["response"]["data"] == {"name": "Docker"}
+
+
+def test_dumps_rejects_unknown_types():
+    with pytest.raises(TypeError):
+        dumps({"value": object()})
+
+
+def test_solution_from_db_keeps_stored_values():
+    object_id = ObjectId()
+    solution = SolutionInDB.from_db({"_id": object_id, "name": "Docker", "slug": "docker", "tags": ["container"]})
+
+    assert solution.id == object_id
+    assert solution.slug == "docker"
+    assert solution.tags == ["container"]
+    assert orjson.loads(FastJSONResponse(StandardResponse.of(solution)).body)["data"]["_id"] == str(object_id)
+
+
+async def test_solution_detail_is_rendered_with_string_ids(api_client, admin_headers, solution_data):
+    created = await api_client.post("/api/solutions/", json=solution_data("Docker"), headers=admin_headers)
+    assert created.status_code == 201
+
+    response = await api_client.get("/api/solutions/docker")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    data = response.json()["data"]
+    assert ObjectId.is_valid(data["_id"])
+    assert data["name"] == "Docker"
+
+
+async def test_missing_solution_is_not_found(api_client):
+    response = await api_client.get("/api/solutions/missing")
+
+    assert response.status_code == 404
@@ -0,0 +1,60 @@
+import pytest
+
+from app.core.text_filters import trigrams
+from app.services.solution_service import SolutionService
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+async def solutions(api_client, admin_headers, solution_data):
+    for name in ("Docker", "docker", "Docker Compose", "Kubernetes"):
+        await api_client.post("/api/solutions/", json=solution_data(name), headers=admin_headers)
+
+
+def test_trigrams():
+    assert trigrams("Go") == ["  g", " go", "go "]
+    assert trigrams("go GO") == trigrams("go")
+    assert trigrams("  ") == []
+
+
+async def test_check_name_counts_normalized_names(api_client, solutions):
+    exact = await api_client.get("/api/solutions/check-name/Docker")
+    other_case = await api_client.get("/api/solutions/check-name/DOCKER ")
+
+    assert exact.json()["data"] == [True, 2]
+    assert other_case.json()["data"] == [False, 2]
+
+
+async def test_similar_names_are_ranked_by_trigram_similarity(api_client, solutions):
+    response = await api_client.get("/api/solutions/check-name/Dockr/similar", params={"threshold": 0.2})
+
+    assert response.status_code == 200
+    similar = response.json()["data"]
+    assert [solution["slug"] for solution in similar] == ["docker", "docker-1", "docker-compose"]
+    assert similar[0]["similarity"] > similar[2]["similarity"] >= 0.2
+
+
+async def test_threshold_and_limit_are_applied(test_db, solutions):
+    service = SolutionService()
+
+    assert await service.find_similar_names("Dockr", threshold=0.9) == []
+    assert len(await service.find_similar_names("Dockr", limit=1)) == 1
+    assert await service.find_similar_names("   ") == []
+
+
+async def test_out_of_range_threshold_is_rejected(api_client):
+    response = await api_client.get("/api/solutions/check-name/Docker/similar", params={"threshold": 0})
+
+    assert response.status_code == 422
+
+
+async def test_search_fields_are_backfilled(test_db):
+    await test_db.solutions.insert_one({"name": "Docker", "slug": "docker"})
+
+    assert await SolutionService().backfill_name_search_fields() == 1
+
+    solution = await test_db.solutions.find_one({"slug": "docker"})
+    assert solution["name_normalized"] == "docker"
+    assert solution["name_trigrams"] == trigrams("Docker")
+    assert [similar.slug for similar in await SolutionService().find_similar_names("docker")] == ["docker"]
@@ -0,0 +1,64 @@
+import pytest
+from bson import ObjectId
+
+from app.core.versioning import collection_versions
+from app.services.site_config_service import site_config_store
+
+pytestmark = pytest.mark.asyncio
+
+SITE_CONFIG = {
+    "site_name": "Tech Compass",
+    "site_description": "Navigate your technology landscape",
+    "welcome_message": "Welcome",
+    "contact_email": "support@example.com",
+}
+
+
+async def test_config_is_served_from_memory_with_an_etag(api_client, test_db, auth_headers):
+    created = await api_client.post("/api/site-config", json=SITE_CONFIG, headers=auth_headers)
+    first = await api_client.get("/api/site-config")
+
+    # Unpublished writes are not seen
+    await test_db.site_config.update_one({}, {"$set": {"site_name": "Hidden"}})
+    cached = await api_client.get("/api/site-config", headers={"If-None-Match": first.headers["etag"]})
+
+    assert created.status_code == 201
+    assert first.json()["data"]["site_name"] == "Tech Compass"
+    assert cached.status_code == 304
+
+
+async def test_updates_replace_the_cached_config(api_client, auth_headers):
+    await api_client.post("/api/site-config", json=SITE_CONFIG, headers=auth_headers)
+    first = await api_client.get("/api/site-config")
+
+    updated = await api_client.put("/api/site-config", json={"site_name": "Radar"}, headers=auth_headers)
+    response = await api_client.get("/api/site-config", headers={"If-None-Match": first.headers["etag"]})
+
+    assert updated.status_code == 200
+    assert response.status_code == 200
+    assert response.json()["data"]["site_name"] == "Radar"
+
+
+async def test_changes_of_other_workers_are_reloaded(test_db, monkeypatch):
+    await test_db.site_config.insert_one({"id": "config", **SITE_CONFIG})
+    assert (await site_config_store.get()).site_name == "Tech Compass"
+
+    await test_db.site_config.update_one({}, {"$set": {"site_name": "Radar"}})
+    await test_db.collection_versions.update_one({"_id": "site_config"}, {"$set": {"stamp": ObjectId()}}, upsert=True)
+    monkeypatch.setattr(collection_versions, "check_interval", 0)
+
+    assert (await site_config_store.get()).site_name == "Radar"
+
+
+async def test_second_config_is_rejected(api_client, auth_headers):
+    await api_client.post("/api/site-config", json=SITE_CONFIG, headers=auth_headers)
+
+    response = await api_client.post("/api/site-config", json=SITE_CONFIG, headers=auth_headers)
+
+    assert response.status_code == 400
+
+
+async def test_missing_config_is_not_found(api_client):
+    response = await api_client.get("/api/site-config")
+
+    assert response.status_code == 404
@@ -0,0 +1,91 @@
+from datetime import datetime
+
+import pytest
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+
+from app.services.solution_service import SLUG_ALLOCATION_ATTEMPTS, SolutionService, next_free_slug
+
+pytestmark = pytest.mark.asyncio
+
+
+def test_next_free_slug():
+    assert next_free_slug("docker", set()) == "docker"
+    assert next_free_slug("docker", {"docker", "docker-1", "docker-3"}) == "docker-2"
+
+
+async def test_slug_taken_by_a_concurrent_write_is_allocated_again(test_db):
+    slugs = []
+
+    async def insert(slug):
+        slugs.append(slug)
+        if len(slugs) == 1:
+            # Another request creates a solution with the same name first
+            await test_db.solutions.insert_one({"name": "Docker", "slug": slug})
+        return await test_db.solutions.insert_one({"name": "Docker", "slug": slug})
+
+    await SolutionService()._write_with_unique_slug("docker", insert)
+
+    assert slugs == ["docker", "docker-1"]
+    assert await test_db.solutions.count_documents({}) == 2
+
+
+async def test_slug_allocation_gives_up_after_repeated_conflicts(test_db):
+    calls = []
+
+    async def conflicting_insert(slug):
+        calls.append(slug)
+        raise DuplicateKeyError("E11000 duplicate key error")
+
+    with pytest.raises(DuplicateKeyError):
+        await SolutionService()._write_with_unique_slug("docker", conflicting_insert)
+
+    assert len(calls) == SLUG_ALLOCATION_ATTEMPTS
+
+
+async def test_bulk_renames_replay_only_conflicting_slugs(test_db):
+    await test_db.solutions.insert_many(
+        [
+            {"name": "Docker", "slug": "docker"},
+            {"name": "Docker", "slug": "docker-1"},
+            {"name": "Podman", "slug": "podman"},
+        ]
+    )
+    ids = [solution["_id"] async for solution in test_db.solutions.find({"name": "Docker"}).sort("slug", 1)]
+    # Allocated before the existing "podman" was written
+    updates = {ids[0]: {"name": "Podman", "slug": "podman"}, ids[1]: {"name": "Podman", "slug": "podman-1"}}
+
+    matched = await SolutionService()._bulk_update_with_unique_slugs(updates, base_slug="podman")
+
+    assert matched == 2
+    assert updates[ids[0]]["slug"] == "podman-2"
+    assert sorted([solution["slug"] async for solution in test_db.solutions.find()]) == [
+        "podman",
+        "podman-1",
+        "podman-2",
+    ]
+
+
+async def test_bulk_slug_conflicts_without_rename_are_raised(test_db):
+    await test_db.solutions.insert_many([{"name": "Docker", "slug": "docker"}, {"name": "Podman", "slug": "podman"}])
+    podman = await test_db.solutions.find_one({"slug": "podman"})
+
+    with pytest.raises(BulkWriteError):
+        await SolutionService()._bulk_update_with_unique_slugs({podman["_id"]: {"slug": "docker"}})
+
+
+async def test_duplicate_slugs_are_given_distinct_values(test_db):
+    await test_db.solutions.drop_indexes()
+    await test_db.solutions.insert_many(
+        [
+            {"name": "Docker", "slug": "docker", "created_at": datetime(2024, 6, 1)},
+            {"name": "Docker", "slug": "docker", "created_at": datetime(2024, 1, 1)},
+            {"name": "Docker", "slug": "docker-1", "created_at": datetime(2024, 2, 1)},
+            {"name": "Docker", "slug": "docker", "created_at": datetime(2024, 3, 1)},
+        ]
+    )
+
+    assert await SolutionService().remove_duplicate_slugs() == 2
+    assert await SolutionService().remove_duplicate_slugs() == 0
+
+    slugs = {solution["created_at"].month: solution["slug"] async for solution in test_db.solutions.find()}
+    assert slugs == {1: "docker", 2: "docker-1", 3: "docker-2", 6: "docker-3"}
@@ -0,0 +1,77 @@
+import pytest
+
+from app.core.versioning import collection_versions
+from app.services.solution_cache import SOLUTIONS_BULK, SolutionCache, solution_version
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_solutions_are_rebuilt_only_after_their_stamps_change(test_db):
+    cache = SolutionCache()
+    builds = []
+
+    async def build():
+        builds.append("docker")
+        return f"solution {len(builds)}"
+
+    assert await cache.get_or_build("docker", build) == "solution 1"
+    assert await cache.get_or_build("docker", build) == "solution 1"
+
+    await collection_versions.bump(solution_version("podman"))
+    assert await cache.get_or_build("docker", build) == "solution 1"
+
+    await collection_versions.bump(solution_version("docker"))
+    assert await cache.get_or_build("docker", build) == "solution 2"
+
+    await collection_versions.bump(SOLUTIONS_BULK)
+    assert await cache.get_or_build("docker", build) == "solution 3"
+
+
+async def test_missing_solutions_are_not_cached(test_db):
+    cache = SolutionCache()
+
+    async def build():
+        return None
+
+    assert await cache.get_or_build("docker", build) is None
+    assert "docker" not in cache._cache
+
+
+async def test_updates_invalidate_the_cached_solution(api_client, test_db, admin_headers, solution_data):
+    await api_client.post("/api/solutions/", json=solution_data("Docker"), headers=admin_headers)
+    first = await api_client.get("/api/solutions/docker")
+
+    # Unpublished writes are not seen
+    await test_db.solutions.update_one({"slug": "docker"}, {"$set": {"brief": "Hidden"}})
+    cached = await api_client.get("/api/solutions/docker")
+    updated = await api_client.put("/api/solutions/docker", json={"brief": "Containers"}, headers=admin_headers)
+    response = await api_client.get("/api/solutions/docker")
+
+    assert first.json()["data"]["brief"] == cached.json()["data"]["brief"] == "Test brief"
+    assert updated.status_code == 200
+    assert response.json()["data"]["brief"] == "Containers"
+
+
+async def test_renamed_solution_retires_its_old_slug(api_client, test_db, admin_headers, solution_data):
+    await api_client.post("/api/solutions/", json=solution_data("Docker"), headers=admin_headers)
+    await api_client.get("/api/solutions/docker")
+
+    await api_client.put("/api/solutions/docker", json={"name": "Podman"}, headers=admin_headers)
+
+    assert (await api_client.get("/api/solutions/docker")).status_code == 404
+    assert (await api_client.get("/api/solutions/podman")).json()["data"]["name"] == "Podman"
+    old_stamp = await test_db.collection_versions.find_one({"_id": solution_version("docker")})
+    new_stamp = await test_db.collection_versions.find_one({"_id": solution_version("podman")})
+    assert "expires_at" in old_stamp
+    assert "expires_at" not in new_stamp
+
+
+async def test_deleted_solution_is_not_served(api_client, test_db, admin_headers, solution_data):
+    await api_client.post("/api/solutions/", json=solution_data("Docker"), headers=admin_headers)
+    await api_client.get("/api/solutions/docker")
+
+    deleted = await api_client.delete("/api/solutions/docker", headers=admin_headers)
+
+    assert deleted.status_code == 204
+    assert (await api_client.get("/api/solutions/docker")).status_code == 404
+    assert "expires_at" in await test_db.collection_versions.find_one({"_id": solution_version("docker")})
@@ -0,0 +1,73 @@
+from datetime import datetime
+
+import pytest
+
+from app.models.solution_detail import SOLUTION_DETAIL_PARTS
+from app.services.solution_detail_service import SolutionDetailService
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+async def solution(api_client, test_db, test_user, admin_headers, solution_data):
+    await api_client.post("/api/solutions/", json=solution_data("Docker", tags=["containers"]), headers=admin_headers)
+    await test_db.comments.insert_many(
+        [
+            {
+                "solution_slug": "docker",
+                "username": "testuser",
+                "content": f"Comment {index}",
+                "type": "USER",
+                "created_at": datetime(2024, 1, index + 1),
+            }
+            for index in range(3)
+        ]
+    )
+    await test_db.ratings.insert_one({"solution_slug": "docker", "username": "testuser", "score": 4})
+    await test_db.solution_adopters.insert_one({"solution_slug": "docker", "username": "testuser"})
+    return "docker"
+
+
+def test_include_is_parsed():
+    assert SolutionDetailService.parse_include(None) == SOLUTION_DETAIL_PARTS
+    assert SolutionDetailService.parse_include("tags, comments,") == ["tags", "comments"]
+    with pytest.raises(ValueError, match="secrets"):
+        SolutionDetailService.parse_include("tags,secrets")
+
+
+async def test_detail_assembles_every_part(api_client, solution, auth_headers):
+    response = await api_client.get(
+        f"/api/solutions/{solution}/full", params={"comments_limit": 2}, headers=auth_headers
+    )
+
+    assert response.status_code == 200
+    detail = response.json()["data"]
+    assert detail["solution"]["name"] == "Docker"
+    assert [comment["content"] for comment in detail["comments"]] == ["Comment 2", "Comment 1"]
+    assert detail["comments_total"] == 3
+    assert detail["comments"][0]["full_name"] == "Testuser"
+    assert [tag["name"] for tag in detail["tags"]] == ["containers"]
+    assert detail["my_rating"]["score"] == 4
+    assert [user["username"] for user in detail["adopted_users"]] == ["testuser"]
+
+
+async def test_only_included_parts_are_returned(api_client, solution):
+    response = await api_client.get(f"/api/solutions/{solution}/full", params={"include": "tags,my_rating"})
+
+    detail = response.json()["data"]
+    assert detail["tags"] is not None
+    # Anonymous requests have no rating of their own
+    assert detail["my_rating"] is None
+    assert detail["solution"] is None and detail["comments"] is None
+
+
+async def test_unknown_part_is_rejected(api_client, solution):
+    response = await api_client.get(f"/api/solutions/{solution}/full", params={"include": "secrets"})
+
+    assert response.status_code == 400
+
+
+async def test_detail_of_missing_solution_is_not_found(api_client):
+    response = await api_client.get("/api/solutions/missing/full")
+
+    assert response.status_code == 404
@@ -0,0 +1,85 @@
+import pytest
+
+from app.core.config import settings
+from app.core.versioning import collection_versions
+from app.services.solution_cache import solution_version
+from app.services.solution_service import SolutionService
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_import_creates_valid_items_and_reports_invalid_ones(api_client, test_db, auth_headers, solution_data):
+    items = [
+        solution_data("Docker", tags=["Containers", "containers"]),
+        {"name": "Missing fields"},
+        solution_data("Docker"),
+        solution_data("Blank", category="  "),
+    ]
+
+    response = await api_client.post("/api/solutions/import", json=items, headers=auth_headers)
+
+    assert response.status_code == 200
+    summary = response.json()["data"]
+    assert (summary["created"], summary["failed"]) == (2, 2)
+    assert [result["success"] for result in summary["results"]] == [True, False, True, False]
+    assert [result["slug"] for result in summary["results"] if result["success"]] == ["docker", "docker-1"]
+    assert summary["results"][3]["error"] == "category: Category name cannot be empty"
+
+    stored = await test_db.solutions.find_one({"slug": "docker"})
+    assert stored["tags"] == ["containers"]
+    assert stored["review_status"] == "PENDING"
+    assert await test_db.categories.count_documents({"name": "Infrastructure"}) == 1
+    assert await test_db.history.count_documents({}) == 2
+
+
+async def test_import_avoids_existing_slugs(api_client, auth_headers, solution_data):
+    await api_client.post("/api/solutions/", json=solution_data("Docker"), headers=auth_headers)
+
+    response = await api_client.post("/api/solutions/import", json=[solution_data("Docker")], headers=auth_headers)
+
+    assert response.json()["data"]["results"][0]["slug"] == "docker-1"
+
+
+async def test_import_allocates_again_slugs_taken_concurrently(test_db, solution_data, monkeypatch):
+    service = SolutionService()
+    get_taken_slugs = service._get_taken_slugs
+    calls = []
+
+    async def taken_before_the_concurrent_write(base_slugs):
+        calls.append(base_slugs)
+        if len(calls) == 1:
+            # Another request creates "docker" once the batch has allocated its slugs
+            await test_db.solutions.insert_one({"name": "Docker", "slug": "docker"})
+            return set()
+        return await get_taken_slugs(base_slugs)
+
+    monkeypatch.setattr(service, "_get_taken_slugs", taken_before_the_concurrent_write)
+
+    summary = await service.import_solutions([solution_data("Docker"), solution_data("Podman")])
+
+    assert (summary.created, summary.failed) == (2, 0)
+    assert [result.slug for result in summary.results] == ["docker-1", "podman"]
+
+
+async def test_import_publishes_a_version_per_solution(api_client, auth_headers, solution_data):
+    before = await collection_versions.get(solution_version("docker"))
+
+    await api_client.post("/api/solutions/import", json=[solution_data("Docker")], headers=auth_headers)
+
+    assert await collection_versions.get(solution_version("docker")) != before
+
+
+async def test_import_rejects_too_many_items(api_client, auth_headers, solution_data, monkeypatch):
+    monkeypatch.setattr(settings, "SOLUTION_IMPORT_MAX_ITEMS", 1)
+
+    response = await api_client.post(
+        "/api/solutions/import", json=[solution_data("A"), solution_data("B")], headers=auth_headers
+    )
+
+    assert response.status_code == 400
+
+
+async def test_import_requires_authentication(api_client, solution_data):
+    response = await api_client.post("/api/solutions/import", json=[solution_data()])
+
+    assert response.status_code == 401
@@ -0,0 +1,76 @@
+import pytest
+
+from app.models.solution import SolutionCreate, SolutionUpdate
+from app.services.solution_service import SolutionService
+
+pytestmark = pytest.mark.asyncio
+
+
+async def _create_solutions(solution_data, count: int, **fields) -> list:
+    service = SolutionService()
+    return [
+        await service.create_solution(SolutionCreate(**solution_data("Docker", **fields)), "testuser")
+        for _ in range(count)
+    ]
+
+
+async def test_update_by_name_writes_every_solution_at_once(api_client, test_db, admin_headers, solution_data):
+    await _create_solutions(solution_data, 2, tags=["containers"], maintainer_id="testuser")
+    await test_db.history.delete_many({})
+
+    response = await api_client.put(
+        "/api/solutions/by-name/Docker",
+        json={"name": "Podman", "review_status": "APPROVED"},
+        headers=admin_headers,
+    )
+
+    assert response.status_code == 200
+    solutions = response.json()["data"]
+    assert [solution["slug"] for solution in solutions] == ["podman", "podman-1"]
+    assert {solution["review_status"] for solution in solutions} == {"APPROVED"}
+    assert await test_db.solutions.count_documents({"name": "Podman", "updated_by": "testadmin"}) == 2
+    assert (await test_db.tags.find_one({"name": "containers"}))["usage_count"] == 2
+
+    records = await test_db.history.find().to_list(None)
+    assert len(records) == 2
+    assert {
+        (field["field_name"], field["old_value"], field["new_value"]) for field in records[0]["changed_fields"]
+    } == {
+        ("name", "Docker", "Podman"),
+        ("review_status", "PENDING", "APPROVED"),
+    }
+
+
+async def test_unchanged_solutions_get_no_history(test_db, solution_data):
+    await _create_solutions(solution_data, 2)
+    await test_db.history.delete_many({})
+
+    updated = await SolutionService().update_solutions_by_name(
+        "Docker", SolutionUpdate(description="Test Description"), "testadmin"
+    )
+
+    assert len(updated) == 2
+    assert await test_db.history.count_documents({}) == 0
+
+
+async def test_renamed_solutions_keep_matching_slugs(test_db, solution_data):
+    await _create_solutions(solution_data, 1)
+    await test_db.solutions.insert_one({"name": "Docker", "slug": "legacy"})
+
+    updated = await SolutionService().update_solutions_by_name("Docker", SolutionUpdate(name="docker"), "testadmin")
+
+    assert sorted(solution.slug for solution in updated) == ["docker", "docker-1"]
+
+
+async def test_update_of_unknown_name_is_not_found(api_client, admin_headers):
+    response = await api_client.put("/api/solutions/by-name/Missing", json={"brief": "New"}, headers=admin_headers)
+
+    assert response.status_code == 404
+
+
+async def test_update_by_name_requires_a_superuser(api_client, auth_headers, solution_data):
+    await _create_solutions(solution_data, 1)
+
+    response = await api_client.put("/api/solutions/by-name/Docker", json={"brief": "New"}, headers=auth_headers)
+
+    assert response.status_code == 403
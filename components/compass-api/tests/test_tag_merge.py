@@ -0,0 +1,91 @@
+import pytest
+
+from app.core.config import settings
+from app.services.tag_service import TagService, replace_tag
+
+pytestmark = pytest.mark.asyncio
+
+
+async def _insert_tagged_solutions(db, *tags_per_solution) -> None:
+    await db.solutions.insert_many(
+        [
+            {"name": f"Solution {index}", "slug": f"solution-{index}", "tags": tags, "review_status": "APPROVED"}
+            for index, tags in enumerate(tags_per_solution)
+        ]
+    )
+
+
+async def _solution_tags(db) -> list:
+    return [solution["tags"] async for solution in db.solutions.find().sort("slug", 1)]
+
+
+def test_replace_tag():
+    assert replace_tag(["a", "b", "a"], "a", "c") == ["c", "b"]
+    assert replace_tag(["a", "b"], "a", "b") == ["b"]
+    assert replace_tag(["a", "b"], "a", None) == ["b"]
+
+
+async def test_replace_rewrites_every_solution_in_batches(test_db, monkeypatch):
+    monkeypatch.setattr(settings, "JOB_BATCH_SIZE", 2)
+    await _insert_tagged_solutions(test_db, ["a", "b"], ["b", "a"], ["a"], ["c"])
+    reports = []
+
+    async def progress(processed, total):
+        reports.append((processed, total))
+
+    updated = await TagService().replace_solution_tag("a", "b", "testadmin", progress)
+
+    assert updated == 3
+    assert reports == [(2, 3), (3, 3)]
+    assert await _solution_tags(test_db) == [["b"], ["b"], ["b"], ["c"]]
+
+
+async def test_merge_runs_as_a_job(api_client, test_db, admin_headers, run_jobs):
+    await test_db.tags.insert_many([{"name": "k8s", "usage_count": 2}, {"name": "kubernetes", "usage_count": 1}])
+    await _insert_tagged_solutions(test_db, ["k8s", "kubernetes"], ["k8s"])
+    source = await test_db.tags.find_one({"name": "k8s"})
+
+    response = await api_client.put(f"/api/tags/{source['_id']}", json={"name": "Kubernetes"}, headers=admin_headers)
+
+    assert response.status_code == 202
+    assert response.headers["location"] == f"/api/jobs/{response.json()['data']['_id']}"
+    assert await run_jobs() == 1
+    assert await _solution_tags(test_db) == [["kubernetes"], ["kubernetes"]]
+    assert [tag["name"] async for tag in test_db.tags.find()] == ["kubernetes"]
+    assert (await test_db.tags.find_one({"name": "kubernetes"}))["usage_count"] == 2
+
+
+async def test_rename_of_a_used_tag_runs_as_a_job(api_client, test_db, admin_headers, run_jobs):
+    await test_db.tags.insert_one({"name": "k8s", "usage_count": 1})
+    await _insert_tagged_solutions(test_db, ["docker", "k8s"])
+    tag = await test_db.tags.find_one({"name": "k8s"})
+
+    response = await api_client.put(
+        f"/api/tags/{tag['_id']}", json={"name": "Kubernetes", "description": "Orchestrator"}, headers=admin_headers
+    )
+
+    assert response.status_code == 202
+    assert (await test_db.tags.find_one({"_id": tag["_id"]}))["name"] == "k8s"
+    assert await run_jobs() == 1
+    renamed = await test_db.tags.find_one({"_id": tag["_id"]})
+    assert (renamed["name"], renamed["description"], renamed["usage_count"]) == ("kubernetes", "Orchestrator", 1)
+    assert await _solution_tags(test_db) == [["docker", "kubernetes"]]
+
+
+async def test_rename_of_an_unused_tag_is_immediate(api_client, test_db, admin_headers):
+    await test_db.tags.insert_one({"name": "k8s", "usage_count": 0})
+    tag = await test_db.tags.find_one({"name": "k8s"})
+
+    response = await api_client.put(f"/api/tags/{tag['_id']}", json={"name": "Kubernetes"}, headers=admin_headers)
+
+    assert response.status_code == 200
+    assert response.json()["data"]["name"] == "kubernetes"
+    assert await test_db.jobs.count_documents({}) == 0
+
+
+async def test_merge_of_unknown_tag_does_nothing(test_db):
+    await test_db.tags.insert_one({"name": "kubernetes", "usage_count": 0})
+
+    assert await TagService().merge_tags("000000000000000000000000", "kubernetes") is None
+    assert await TagService().enqueue_merge_tags("000000000000000000000000", "kubernetes") is None
+    assert await test_db.jobs.count_documents({}) == 0
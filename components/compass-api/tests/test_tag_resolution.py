@@ -0,0 +1,70 @@
+import pytest
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+
+from app.services.solution_service import SolutionService
+from app.services.tag_service import DUPLICATE_KEY_ERROR, TagService
+
+pytestmark = pytest.mark.asyncio
+
+
+def _bulk_write_error(code: int, upserted: int = 0) -> BulkWriteError:
+    return BulkWriteError({"writeErrors": [{"index": 0, "code": code, "errmsg": "failed"}], "nUpserted": upserted})
+
+
+async def test_resolve_tags_creates_only_missing_tags(test_db):
+    await test_db.tags.insert_one({"name": "docker", "description": "Existing", "usage_count": 0})
+
+    resolved = await TagService().resolve_tags(["Docker", "Cloud Native", "cloud-native"], "testuser")
+
+    assert resolved == {"Docker": "docker", "Cloud Native": "cloud-native", "cloud-native": "cloud-native"}
+    tags = {tag["name"]: tag async for tag in test_db.tags.find()}
+    assert sorted(tags) == ["cloud-native", "docker"]
+    assert tags["docker"]["description"] == "Existing"
+    assert tags["cloud-native"]["description"] == "Tag for Cloud Native"
+    assert tags["cloud-native"]["created_by"] == "testuser"
+
+
+async def test_resolve_no_tags(test_db):
+    assert await TagService().resolve_tags([]) == {}
+    assert await test_db.tags.count_documents({}) == 0
+
+
+async def test_process_tags_keeps_order_without_duplicates(test_db):
+    tags = await SolutionService()._process_tags(["Kubernetes", "docker", "kubernetes", "Docker"])
+
+    assert tags == ["kubernetes", "docker"]
+
+
+async def test_upsert_is_replayed_after_losing_a_race(test_db, monkeypatch):
+    service = TagService()
+    bulk_write = service.collection.bulk_write
+    calls = []
+
+    async def racing_bulk_write(operations, **kwargs):
+        calls.append(operations)
+        if len(calls) == 1:
+            await test_db.tags.insert_one({"name": "docker", "usage_count": 0})
+            raise _bulk_write_error(DUPLICATE_KEY_ERROR)
+        return await bulk_write(operations, **kwargs)
+
+    monkeypatch.setattr(service.collection, "bulk_write", racing_bulk_write)
+
+    operations = [UpdateOne({"name": "docker"}, {"$setOnInsert": {"usage_count": 0}}, upsert=True)]
+    upserted = await service._upsert_tags(operations)
+
+    assert len(calls) == 2
+    assert upserted == 0
+    assert await test_db.tags.count_documents({"name": "docker"}) == 1
+
+
+async def test_upsert_raises_other_write_errors(test_db, monkeypatch):
+    service = TagService()
+
+    async def failing_bulk_write(operations, **kwargs):
+        raise _bulk_write_error(121)
+
+    monkeypatch.setattr(service.collection, "bulk_write", failing_bulk_write)
+
+    with pytest.raises(BulkWriteError):
+        await service._upsert_tags([UpdateOne({"name": "docker"}, {"$setOnInsert": {}}, upsert=True)])
@@ -0,0 +1,61 @@
+import pytest
+
+from app.core.versioning import collection_versions
+from app.models.solution import SolutionCreate, SolutionUpdate
+from app.services.catalog_service import TAG_USAGE
+from app.services.solution_service import SolutionService
+from app.services.tag_service import TagService, counted_tags, usage_deltas
+
+pytestmark = pytest.mark.asyncio
+
+
+async def _usage_counts(db) -> dict:
+    return {tag["name"]: tag["usage_count"] async for tag in db.tags.find()}
+
+
+def test_usage_deltas():
+    assert counted_tags(["a", "b"], "PENDING") == set()
+    assert usage_deltas(counted_tags(["a", "b"], "APPROVED"), {"b", "c"}) == {"c": 1, "a": -1}
+
+
+async def test_counts_follow_solution_writes(test_db, solution_data):
+    service = SolutionService()
+    solution = await service.create_solution(SolutionCreate(**solution_data(tags=["a", "b"])), "testuser")
+    assert await _usage_counts(test_db) == {"a": 0, "b": 0}
+
+    solution = await service.update_solution(solution, SolutionUpdate(review_status="APPROVED"), "testadmin")
+    assert await _usage_counts(test_db) == {"a": 1, "b": 1}
+
+    solution = await service.update_solution(solution, SolutionUpdate(tags=["b", "c"]), "testadmin")
+    assert await _usage_counts(test_db) == {"a": 0, "b": 1, "c": 1}
+
+    await service.delete_solution(str(solution.id), "testadmin")
+    assert await _usage_counts(test_db) == {"a": 0, "b": 0, "c": 0}
+
+
+async def test_deltas_come_from_the_state_the_write_replaced(test_db, solution_data):
+    service = SolutionService()
+    stale = await service.create_solution(SolutionCreate(**solution_data(tags=["a"])), "testuser")
+    await service.update_solution(stale, SolutionUpdate(review_status="APPROVED"), "testadmin")
+
+    # Written from a copy read before the approval
+    await service.update_solution(stale, SolutionUpdate(tags=["b"]), "testuser")
+
+    assert await _usage_counts(test_db) == {"a": 0, "b": 1}
+
+
+async def test_rebuild_corrects_drifted_counts(test_db):
+    await test_db.tags.insert_many([{"name": "a", "usage_count": 5}, {"name": "b", "usage_count": 0}])
+    await test_db.solutions.insert_one({"name": "Docker", "tags": ["b"], "review_status": "APPROVED"})
+
+    corrected = await TagService().rebuild_usage_counts()
+
+    assert corrected == 2
+    assert await _usage_counts(test_db) == {"a": 0, "b": 1}
+    assert await TagService().rebuild_usage_counts() == 0
+
+
+async def test_no_deltas_leave_the_counts_untouched(test_db):
+    await TagService().adjust_usage_counts({"a": 0})
+
+    assert await collection_versions.get(TAG_USAGE) == (None,)
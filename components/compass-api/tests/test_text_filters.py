@@ -0,0 +1,83 @@
+import pytest
+
+from app.core.text_filters import normalize_text, text_filter
+from app.services.history_service import HistoryService
+
+pytestmark = pytest.mark.asyncio
+
+
+def test_normalize_text():
+    assert normalize_text("  Docker   Engine\t") == "docker engine"
+
+
+@pytest.mark.parametrize(
+    "match, expected",
+    [
+        ("exact", "c++ build"),
+        ("prefix", {"$regex": "^c\\+\\+\\ build"}),
+        ("contains", {"$regex": "c\\+\\+\\ build"}),
+    ],
+)
+def test_text_filter_modes(match, expected):
+    assert text_filter("C++  Build", match) == expected
+
+
+def test_unknown_match_mode_is_rejected():
+    with pytest.raises(ValueError, match="Invalid match mode"):
+        text_filter("docker", "fuzzy")
+
+
+async def test_comments_are_filtered_by_slug_mode(api_client, test_db):
+    await test_db.comments.insert_many(
+        [
+            {"solution_slug": slug, "username": "testuser", "content": "Nice", "type": "USER"}
+            for slug in ("docker", "docker-compose", "podman-docker")
+        ]
+    )
+
+    async def slugs(match: str) -> list:
+        response = await api_client.get(
+            "/api/comments/", params={"solution_slug": "Docker", "solution_slug_match": match}
+        )
+        return sorted(comment["solution_slug"] for comment in response.json()["data"])
+
+    assert await slugs("exact") == ["docker"]
+    assert await slugs("prefix") == ["docker", "docker-compose"]
+    assert await slugs("contains") == ["docker", "docker-compose", "podman-docker"]
+
+
+async def test_invalid_match_mode_is_a_client_error(api_client):
+    response = await api_client.get(
+        "/api/comments/", params={"solution_slug": "docker", "solution_slug_match": "fuzzy"}
+    )
+
+    assert response.status_code == 422
+
+
+async def test_history_names_are_backfilled_and_matched(api_client, test_db, admin_headers):
+    await test_db.history.insert_many(
+        [
+            {
+                "object_type": "solution",
+                "object_id": "1",
+                "object_name": "Docker  Engine",
+                "change_type": "CREATE",
+                "changed_fields": [],
+                "change_summary": "Created",
+            },
+            {
+                "object_type": "solution",
+                "object_id": "2",
+                "object_name": "Podman",
+                "change_type": "CREATE",
+                "changed_fields": [],
+                "change_summary": "Created",
+            },
+        ]
+    )
+
+    assert await HistoryService().backfill_normalized_names() == 2
+    assert await HistoryService().backfill_normalized_names() == 0
+
+    response = await api_client.get("/api/history/", params={"object_name": "docker e"}, headers=admin_headers)
+    assert [record["object_name"] for record in response.json()["data"]] == ["Docker  Engine"]
@@ -0,0 +1,83 @@
+import pytest
+
+from app.models.solution import SolutionCreate, SolutionUpdate
+from app.models.tag import TagCreate
+from app.services.solution_service import SolutionService
+from app.services.tag_service import TagService
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_update_returns_the_written_solution(api_client, test_db, auth_headers, solution_data):
+    await api_client.post("/api/solutions/", json=solution_data("Docker"), headers=auth_headers)
+
+    response = await api_client.put("/api/solutions/docker", json={"brief": "Containers"}, headers=auth_headers)
+
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert (data["brief"], data["name"], data["updated_by"]) == ("Containers", "Docker", "testuser")
+    assert (await test_db.solutions.find_one({"slug": "docker"}))["brief"] == "Containers"
+
+
+async def test_update_is_refused_when_the_permission_was_lost(test_db, solution_data):
+    service = SolutionService()
+    solution = await service.create_solution(SolutionCreate(**solution_data("Docker")), "testuser")
+    await test_db.solutions.update_one(
+        {"_id": solution.id}, {"$set": {"created_by": "someone", "maintainer_id": "someone"}}
+    )
+
+    updated = await service.update_solution(
+        solution,
+        SolutionUpdate(brief="Containers"),
+        "testuser",
+        permission_filter=service.solution_permission_filter("testuser", is_superuser=False),
+    )
+
+    assert updated is None
+    assert (await test_db.solutions.find_one({"_id": solution.id}))["brief"] == "Test brief"
+
+
+async def test_update_by_other_users_is_forbidden(api_client, test_db, auth_headers, solution_data):
+    await SolutionService().create_solution(
+        SolutionCreate(**solution_data("Docker", maintainer_id="someone")), "someone"
+    )
+
+    response = await api_client.put("/api/solutions/docker", json={"brief": "Containers"}, headers=auth_headers)
+
+    assert response.status_code == 403
+
+
+async def test_created_and_updated_tags_are_returned(api_client, test_db, admin_headers):
+    created = await api_client.post(
+        "/api/tags/", json={"name": "Docker", "description": "Containers"}, headers=admin_headers
+    )
+    tag_id = created.json()["data"]["_id"]
+
+    updated = await api_client.put(
+        f"/api/tags/{tag_id}", json={"name": "docker", "description": "Engine"}, headers=admin_headers
+    )
+
+    assert created.status_code == 201
+    assert tag_id == str((await test_db.tags.find_one({"name": "docker"}))["_id"])
+    assert updated.json()["data"]["description"] == "Engine"
+    assert updated.json()["data"]["_id"] == tag_id
+
+
+async def test_duplicate_tag_is_rejected(test_db):
+    await TagService().create_tag(TagCreate(name="Docker"))
+
+    with pytest.raises(ValueError, match="already exists"):
+        await TagService().create_tag(TagCreate(name="docker"))
+
+
+async def test_updated_category_is_returned(api_client, admin_headers):
+    created = await api_client.post("/api/categories/", json={"name": "Infrastructure"}, headers=admin_headers)
+
+    response = await api_client.put(
+        f"/api/categories/{created.json()['data']['_id']}",
+        json={"name": "Infrastructure", "description": "Servers"},
+        headers=admin_headers,
+    )
+
+    assert response.status_code == 200
+    assert (response.json()["data"]["name"], response.json()["data"]["description"]) == ("Infrastructure", "Servers")